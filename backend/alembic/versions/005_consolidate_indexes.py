@@ -0,0 +1,54 @@
+"""Drop indexes made redundant by primary keys and composite indexes
+
+Revision ID: 005_consolidate_indexes
+Revises: 004_add_llm_usage
+Create Date: 2026-01-15
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '005_consolidate_indexes'
+down_revision = '004_add_llm_usage'
+branch_labels = None
+depends_on = None
+
+
+# Each of these duplicates the leading column of another index:
+# - ix_interviews_id / ix_messages_id: the primary key index
+# - ix_interviews_status: ix_interviews_status_created (status, created_at)
+# - ix_messages_interview_id: ix_messages_interview_timestamp (interview_id, timestamp)
+REDUNDANT_INDEXES = [
+    ('ix_interviews_id', 'interviews', ['id']),
+    ('ix_interviews_status', 'interviews', ['status']),
+    ('ix_messages_id', 'messages', ['id']),
+    ('ix_messages_interview_id', 'messages', ['interview_id']),
+]
+
+
+def upgrade() -> None:
+    """Drop redundant single-column indexes."""
+    if op.get_bind().dialect.name == 'postgresql':
+        # DROP INDEX CONCURRENTLY avoids an ACCESS EXCLUSIVE lock on populated tables,
+        # but cannot run inside a transaction block
+        with op.get_context().autocommit_block():
+            for name, _table, _columns in REDUNDANT_INDEXES:
+                op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {name}')
+    else:
+        for name, table, _columns in REDUNDANT_INDEXES:
+            op.drop_index(name, table_name=table)
+
+
+def downgrade() -> None:
+    """Recreate the single-column indexes."""
+    if op.get_bind().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            for name, table, columns in REDUNDANT_INDEXES:
+                op.execute(
+                    f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} '
+                    f'ON {table} ({", ".join(columns)})'
+                )
+    else:
+        for name, table, columns in REDUNDANT_INDEXES:
+            op.create_index(name, table, columns, unique=False)
@@ -0,0 +1,46 @@
+"""Store match analysis and report documents as JSONB
+
+Revision ID: 006_jsonb_documents
+Revises: 005_consolidate_indexes
+Create Date: 2026-01-15
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '006_jsonb_documents'
+down_revision = '005_consolidate_indexes'
+branch_labels = None
+depends_on = None
+
+
+JSON_DOCUMENT_COLUMNS = ['match_analysis_json', 'report_json']
+
+
+def upgrade() -> None:
+    """Convert interview JSON documents to JSONB."""
+    for column in JSON_DOCUMENT_COLUMNS:
+        op.alter_column(
+            'interviews',
+            column,
+            type_=postgresql.JSONB(astext_type=sa.Text()),
+            existing_type=postgresql.JSON(astext_type=sa.Text()),
+            existing_nullable=True,
+            postgresql_using=f'{column}::jsonb',
+        )
+
+
+def downgrade() -> None:
+    """Convert interview JSON documents back to JSON."""
+    for column in JSON_DOCUMENT_COLUMNS:
+        op.alter_column(
+            'interviews',
+            column,
+            type_=postgresql.JSON(astext_type=sa.Text()),
+            existing_type=postgresql.JSONB(astext_type=sa.Text()),
+            existing_nullable=True,
+            postgresql_using=f'{column}::json',
+        )
@@ -0,0 +1,49 @@
+"""Add partial index on messages for per-question lookups
+
+Revision ID: 007_messages_question_index
+Revises: 006_jsonb_documents
+Create Date: 2026-01-15
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '007_messages_question_index'
+down_revision = '006_jsonb_documents'
+branch_labels = None
+depends_on = None
+
+
+INDEX_NAME = 'ix_messages_interview_qnum'
+INDEX_WHERE = 'question_number IS NOT NULL'
+
+
+def upgrade() -> None:
+    """Index (interview_id, question_number) for question/answer messages only."""
+    if op.get_bind().dialect.name == 'postgresql':
+        # CREATE INDEX CONCURRENTLY keeps messages writable during the build,
+        # but cannot run inside a transaction block
+        with op.get_context().autocommit_block():
+            op.execute(
+                f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_NAME} '
+                f'ON messages (interview_id, question_number) WHERE {INDEX_WHERE}'
+            )
+    else:
+        op.create_index(
+            INDEX_NAME,
+            'messages',
+            ['interview_id', 'question_number'],
+            unique=False,
+            sqlite_where=sa.text(INDEX_WHERE),
+        )
+
+
+def downgrade() -> None:
+    """Remove the per-question index."""
+    if op.get_bind().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {INDEX_NAME}')
+    else:
+        op.drop_index(INDEX_NAME, table_name='messages')
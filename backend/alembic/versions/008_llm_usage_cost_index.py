@@ -0,0 +1,53 @@
+"""Add covering (interview_id, agent_name) index on llm_usage
+
+Revision ID: 008_llm_usage_cost_index
+Revises: 007_messages_question_index
+Create Date: 2026-01-16
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '008_llm_usage_cost_index'
+down_revision = '007_messages_question_index'
+branch_labels = None
+depends_on = None
+
+
+INDEX_NAME = 'ix_llm_usage_interview_id_agent'
+INCLUDE_COLUMNS = ['estimated_cost', 'total_tokens', 'cached']
+
+# Its leading column duplicates the new composite index
+REDUNDANT_INDEX = 'ix_llm_usage_interview_id'
+
+
+def upgrade() -> None:
+    """Replace the interview_id index with a covering per-agent index."""
+    if op.get_bind().dialect.name == 'postgresql':
+        # CONCURRENTLY keeps llm_usage writable during the build,
+        # but cannot run inside a transaction block
+        with op.get_context().autocommit_block():
+            op.execute(
+                f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_NAME} '
+                f'ON llm_usage (interview_id, agent_name) '
+                f'INCLUDE ({", ".join(INCLUDE_COLUMNS)})'
+            )
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {REDUNDANT_INDEX}')
+    else:
+        op.create_index(INDEX_NAME, 'llm_usage', ['interview_id', 'agent_name'], unique=False)
+        op.drop_index(REDUNDANT_INDEX, table_name='llm_usage')
+
+
+def downgrade() -> None:
+    """Restore the single-column interview_id index."""
+    if op.get_bind().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.execute(
+                f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {REDUNDANT_INDEX} '
+                f'ON llm_usage (interview_id)'
+            )
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {INDEX_NAME}')
+    else:
+        op.create_index(REDUNDANT_INDEX, 'llm_usage', ['interview_id'], unique=False)
+        op.drop_index(INDEX_NAME, table_name='llm_usage')
@@ -0,0 +1,59 @@
+"""Replace the candidate token index with a partial unique index
+
+Revision ID: 009_partial_token_index
+Revises: 008_llm_usage_cost_index
+Create Date: 2026-01-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '009_partial_token_index'
+down_revision = '008_llm_usage_cost_index'
+branch_labels = None
+depends_on = None
+
+
+INDEX_NAME = 'ix_interviews_active_token'
+INDEX_WHERE = 'candidate_link_token IS NOT NULL'
+
+# Full unique index from 001; most rows (unassigned interviews) index a NULL
+OLD_INDEX = 'ix_interviews_candidate_link_token'
+
+
+def upgrade() -> None:
+    """Index only interviews that have a candidate token."""
+    if op.get_bind().dialect.name == 'postgresql':
+        # CONCURRENTLY keeps interviews writable during the build,
+        # but cannot run inside a transaction block
+        with op.get_context().autocommit_block():
+            op.execute(
+                f'CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_NAME} '
+                f'ON interviews (candidate_link_token) WHERE {INDEX_WHERE}'
+            )
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {OLD_INDEX}')
+    else:
+        op.create_index(
+            INDEX_NAME,
+            'interviews',
+            ['candidate_link_token'],
+            unique=True,
+            sqlite_where=sa.text(INDEX_WHERE),
+        )
+        op.drop_index(OLD_INDEX, table_name='interviews')
+
+
+def downgrade() -> None:
+    """Restore the full unique token index."""
+    if op.get_bind().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.execute(
+                f'CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS {OLD_INDEX} '
+                f'ON interviews (candidate_link_token)'
+            )
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {INDEX_NAME}')
+    else:
+        op.create_index(OLD_INDEX, 'interviews', ['candidate_link_token'], unique=True)
+        op.drop_index(INDEX_NAME, table_name='interviews')
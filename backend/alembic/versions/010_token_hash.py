@@ -0,0 +1,98 @@
+"""Look up candidate tokens by SHA-256 digest
+
+Revision ID: 010_token_hash
+Revises: 009_partial_token_index
+Create Date: 2026-01-16
+
+"""
+import hashlib
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '010_token_hash'
+down_revision = '009_partial_token_index'
+branch_labels = None
+depends_on = None
+
+
+INDEX_NAME = 'ix_interviews_token_hash'
+INDEX_WHERE = 'candidate_link_token_hash IS NOT NULL'
+
+# Partial unique index on the plain token from 009, superseded by the digest index
+OLD_INDEX = 'ix_interviews_active_token'
+OLD_INDEX_WHERE = 'candidate_link_token IS NOT NULL'
+
+
+def _backfill_hashes() -> None:
+    """Hash the tokens of already-assigned interviews."""
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        op.execute(
+            "UPDATE interviews "
+            "SET candidate_link_token_hash = sha256(convert_to(candidate_link_token, 'UTF8')) "
+            "WHERE candidate_link_token IS NOT NULL"
+        )
+        return
+
+    rows = bind.execute(
+        sa.text('SELECT id, candidate_link_token FROM interviews '
+                'WHERE candidate_link_token IS NOT NULL')
+    ).all()
+    for interview_id, token in rows:
+        bind.execute(
+            sa.text('UPDATE interviews SET candidate_link_token_hash = :digest WHERE id = :id'),
+            {'digest': hashlib.sha256(token.encode()).digest(), 'id': interview_id},
+        )
+
+
+def upgrade() -> None:
+    """Add and backfill the digest column, then move the unique index onto it."""
+    op.add_column(
+        'interviews',
+        sa.Column('candidate_link_token_hash', sa.LargeBinary(32), nullable=True)
+    )
+    _backfill_hashes()
+
+    if op.get_bind().dialect.name == 'postgresql':
+        # CONCURRENTLY keeps interviews writable during the build,
+        # but cannot run inside a transaction block
+        with op.get_context().autocommit_block():
+            op.execute(
+                f'CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_NAME} '
+                f'ON interviews (candidate_link_token_hash) WHERE {INDEX_WHERE}'
+            )
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {OLD_INDEX}')
+    else:
+        op.create_index(
+            INDEX_NAME,
+            'interviews',
+            ['candidate_link_token_hash'],
+            unique=True,
+            sqlite_where=sa.text(INDEX_WHERE),
+        )
+        op.drop_index(OLD_INDEX, table_name='interviews')
+
+
+def downgrade() -> None:
+    """Restore the plain token index and drop the digest column."""
+    if op.get_bind().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.execute(
+                f'CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS {OLD_INDEX} '
+                f'ON interviews (candidate_link_token) WHERE {OLD_INDEX_WHERE}'
+            )
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {INDEX_NAME}')
+    else:
+        op.create_index(
+            OLD_INDEX,
+            'interviews',
+            ['candidate_link_token'],
+            unique=True,
+            sqlite_where=sa.text(OLD_INDEX_WHERE),
+        )
+        op.drop_index(INDEX_NAME, table_name='interviews')
+
+    op.drop_column('interviews', 'candidate_link_token_hash')
@@ -0,0 +1,54 @@
+"""Cascade interview deletes to llm_usage in the database
+
+Revision ID: 011_llm_usage_cascade
+Revises: 010_token_hash
+Create Date: 2026-01-16
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '011_llm_usage_cascade'
+down_revision = '010_token_hash'
+branch_labels = None
+depends_on = None
+
+
+# 004 created the foreign key unnamed; this is PostgreSQL's generated name
+PG_CONSTRAINT = 'llm_usage_interview_id_fkey'
+
+# Lets batch mode on SQLite address the reflected, unnamed foreign key
+NAMING_CONVENTION = {
+    'fk': 'fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s',
+}
+BATCH_CONSTRAINT = 'fk_llm_usage_interview_id_interviews'
+
+
+def _replace_foreign_key(ondelete: str | None) -> None:
+    """Recreate llm_usage.interview_id -> interviews.id with the given ON DELETE."""
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_constraint(PG_CONSTRAINT, 'llm_usage', type_='foreignkey')
+        op.create_foreign_key(
+            PG_CONSTRAINT, 'llm_usage', 'interviews', ['interview_id'], ['id'],
+            ondelete=ondelete,
+        )
+        return
+
+    with op.batch_alter_table(
+        'llm_usage', naming_convention=NAMING_CONVENTION, recreate='always'
+    ) as batch_op:
+        batch_op.drop_constraint(BATCH_CONSTRAINT, type_='foreignkey')
+        batch_op.create_foreign_key(
+            BATCH_CONSTRAINT, 'interviews', ['interview_id'], ['id'], ondelete=ondelete
+        )
+
+
+def upgrade() -> None:
+    """Delete usage rows with their interview (ON DELETE CASCADE)."""
+    _replace_foreign_key('CASCADE')
+
+
+def downgrade() -> None:
+    """Restore the plain foreign key."""
+    _replace_foreign_key(None)
@@ -0,0 +1,50 @@
+"""Store messages.role as a native enum
+
+Revision ID: 012_message_role_enum
+Revises: 011_llm_usage_cascade
+Create Date: 2026-01-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '012_message_role_enum'
+down_revision = '011_llm_usage_cascade'
+branch_labels = None
+depends_on = None
+
+
+ROLES = ('assistant', 'candidate')
+message_role = sa.Enum(*ROLES, name='message_role')
+
+
+def upgrade() -> None:
+    """Convert role from VARCHAR(20) to the message_role enum."""
+    if op.get_bind().dialect.name == 'postgresql':
+        # Rewrites the table under an exclusive lock; run during a maintenance window
+        message_role.create(op.get_bind(), checkfirst=True)
+        op.execute(
+            'ALTER TABLE messages ALTER COLUMN role TYPE message_role '
+            'USING role::message_role'
+        )
+    else:
+        with op.batch_alter_table('messages') as batch_op:
+            batch_op.alter_column(
+                'role', existing_type=sa.String(20), type_=message_role,
+                existing_nullable=False,
+            )
+
+
+def downgrade() -> None:
+    """Convert role back to VARCHAR(20)."""
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute('ALTER TABLE messages ALTER COLUMN role TYPE VARCHAR(20) USING role::text')
+        message_role.drop(op.get_bind(), checkfirst=True)
+    else:
+        with op.batch_alter_table('messages') as batch_op:
+            batch_op.alter_column(
+                'role', existing_type=message_role, type_=sa.String(20),
+                existing_nullable=False,
+            )
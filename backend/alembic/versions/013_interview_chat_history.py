@@ -0,0 +1,59 @@
+"""Add rolling chat history to interviews
+
+Revision ID: 013_interview_chat_history
+Revises: 012_message_role_enum
+Create Date: 2026-01-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '013_interview_chat_history'
+down_revision = '012_message_role_enum'
+branch_labels = None
+depends_on = None
+
+
+def _backfill_chat_history() -> None:
+    """Build the history of existing interviews from their messages."""
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        op.execute(
+            "UPDATE interviews SET chat_history = history.text "
+            "FROM ("
+            "  SELECT interview_id, "
+            "         string_agg(role::text || ': ' || content || E'\\n', '' "
+            "                    ORDER BY timestamp, id) AS text "
+            "  FROM messages GROUP BY interview_id"
+            ") AS history "
+            "WHERE interviews.id = history.interview_id"
+        )
+        return
+
+    rows = bind.execute(
+        sa.text('SELECT interview_id, role, content FROM messages ORDER BY timestamp, id')
+    ).all()
+    histories: dict[int, list[str]] = {}
+    for interview_id, role, content in rows:
+        histories.setdefault(interview_id, []).append(f'{role}: {content}\n')
+    for interview_id, lines in histories.items():
+        bind.execute(
+            sa.text('UPDATE interviews SET chat_history = :history WHERE id = :id'),
+            {'history': ''.join(lines), 'id': interview_id},
+        )
+
+
+def upgrade() -> None:
+    """Add chat_history and backfill it."""
+    op.add_column(
+        'interviews',
+        sa.Column('chat_history', sa.Text(), nullable=False, server_default='')
+    )
+    _backfill_chat_history()
+
+
+def downgrade() -> None:
+    """Remove chat_history."""
+    op.drop_column('interviews', 'chat_history')
@@ -0,0 +1,82 @@
+"""Track the current question and question count on interviews
+
+Revision ID: 014_interview_current_question
+Revises: 013_interview_chat_history
+Create Date: 2026-01-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '014_interview_current_question'
+down_revision = '013_interview_chat_history'
+branch_labels = None
+depends_on = None
+
+
+def _backfill_current_question() -> None:
+    """Derive the state of existing interviews from their assistant questions."""
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        op.execute(
+            "UPDATE interviews "
+            "SET current_question = latest.content, "
+            "    current_question_number = latest.question_number, "
+            "    questions_asked = latest.asked "
+            "FROM ("
+            "  SELECT DISTINCT ON (interview_id) interview_id, content, question_number, "
+            "         count(*) OVER (PARTITION BY interview_id) AS asked "
+            "  FROM messages "
+            "  WHERE role = 'assistant' AND question_number IS NOT NULL "
+            "    AND question_number <> 0 "
+            "  ORDER BY interview_id, timestamp DESC, id DESC"
+            ") AS latest "
+            "WHERE interviews.id = latest.interview_id"
+        )
+        return
+
+    rows = bind.execute(
+        sa.text(
+            "SELECT interview_id, content, question_number FROM messages "
+            "WHERE role = 'assistant' AND question_number IS NOT NULL "
+            "AND question_number <> 0 ORDER BY timestamp, id"
+        )
+    ).all()
+    state: dict[int, dict] = {}
+    for interview_id, content, question_number in rows:
+        asked = state.get(interview_id, {}).get('asked', 0) + 1
+        state[interview_id] = {
+            'question': content, 'number': question_number, 'asked': asked,
+        }
+    for interview_id, values in state.items():
+        bind.execute(
+            sa.text(
+                'UPDATE interviews SET current_question = :question, '
+                'current_question_number = :number, questions_asked = :asked '
+                'WHERE id = :id'
+            ),
+            {**values, 'id': interview_id},
+        )
+
+
+def upgrade() -> None:
+    """Add the current-question columns and backfill them."""
+    op.add_column('interviews', sa.Column('current_question', sa.Text(), nullable=True))
+    op.add_column(
+        'interviews',
+        sa.Column('current_question_number', sa.Integer(), nullable=False, server_default='0')
+    )
+    op.add_column(
+        'interviews',
+        sa.Column('questions_asked', sa.Integer(), nullable=False, server_default='0')
+    )
+    _backfill_current_question()
+
+
+def downgrade() -> None:
+    """Remove the current-question columns."""
+    op.drop_column('interviews', 'questions_asked')
+    op.drop_column('interviews', 'current_question_number')
+    op.drop_column('interviews', 'current_question')
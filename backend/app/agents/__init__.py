@@ -1,13 +1,25 @@
 """Agents package - LangChain agents for interview orchestration."""
-from app.agents.answer_evaluation import AnswerEvaluationAgent, evaluate_answer
-from app.agents.document_analysis import DocumentAnalysisAgent, analyze_documents
+from app.agents.answer_evaluation import (
+    AnswerEvaluationAgent,
+    evaluate_answer,
+    evaluate_answers,
+)
+from app.agents.document_analysis import (
+    DocumentAnalysisAgent,
+    analyze_documents,
+    analyze_documents_async,
+)
 from app.agents.integrity_judgment import IntegrityJudgmentAgent, assess_integrity
 from app.agents.interview_introduction import (
     generate_introduction,
     generate_closing_message,
 )
 from app.agents.message_classification import MessageClassificationAgent, classify_message
-from app.agents.question_generation import QuestionGenerationAgent, generate_question
+from app.agents.question_generation import (
+    QuestionGenerationAgent,
+    generate_question,
+    stream_question,
+)
 from app.agents.report_generation import ReportGenerationAgent, generate_report
 
 __all__ = [
@@ -20,8 +32,11 @@ __all__ = [
     "IntegrityJudgmentAgent",
     # Convenience functions
     "analyze_documents",
+    "analyze_documents_async",
     "evaluate_answer",
+    "evaluate_answers",
     "generate_question",
+    "stream_question",
     "classify_message",
     "generate_report",
     "assess_integrity",
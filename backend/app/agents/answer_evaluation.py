@@ -1,15 +1,34 @@
 """Answer Evaluation Agent - scores and evaluates candidate answers."""
+import asyncio
+from functools import lru_cache
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from langchain.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import PydanticOutputParser
 
-from app.agents.base import BaseAgent
+from app.agents.base import AgentError, BaseAgent
 from app.agents.llm_factory import get_llm
-from app.agents.prompts import ANSWER_EVALUATION_PROMPT
-from app.schemas.message import AnswerEvaluation
+from app.agents.output_parsers import PydanticJsonOutputParser
+from app.agents.prompts import (
+    ANSWER_EVALUATION_BATCH_INPUT_PROMPT,
+    ANSWER_EVALUATION_BATCH_PROMPT,
+    ANSWER_EVALUATION_INPUT_PROMPT,
+    ANSWER_EVALUATION_PROMPT,
+)
+from app.schemas.message import AnswerEvaluation, AnswerEvaluationBatch
 from app.agents.validators import QuestionAnswerInput
 
+# Number of question/answer pairs packed into a single batched prompt
+EVALUATION_BATCH_SIZE = 5
+
+# Maximum number of batched prompts in flight at once (provider rate limits)
+MAX_CONCURRENT_BATCHES = 8
+
+
+# Parsers and their format instructions are stateless; build them once at import
+_PARSER = PydanticJsonOutputParser(pydantic_object=AnswerEvaluation)
+_FORMAT_INSTRUCTIONS = _PARSER.get_format_instructions()
+_BATCH_PARSER = PydanticJsonOutputParser(pydantic_object=AnswerEvaluationBatch)
+_BATCH_FORMAT_INSTRUCTIONS = _BATCH_PARSER.get_format_instructions()
+
 
 class AnswerEvaluationAgent(BaseAgent):
     """Agent for evaluating candidate answers."""
@@ -18,7 +37,21 @@ class AnswerEvaluationAgent(BaseAgent):
         """Initialize the answer evaluation agent."""
         super().__init__(agent_name="answer_evaluation")
         self.llm = get_llm(temperature=0.0)  # Deterministic for fairness
-        self.parser = PydanticOutputParser(pydantic_object=AnswerEvaluation)
+        self.parser = _PARSER
+        # Built once per agent; static instructions first for provider prefix caching
+        self._chain = self.build_structured_chain(
+            ANSWER_EVALUATION_PROMPT,
+            ANSWER_EVALUATION_INPUT_PROMPT,
+            self.parser,
+            _FORMAT_INSTRUCTIONS,
+        )
+        self.batch_parser = _BATCH_PARSER
+        self._batch_chain = self.build_structured_chain(
+            ANSWER_EVALUATION_BATCH_PROMPT,
+            ANSWER_EVALUATION_BATCH_INPUT_PROMPT,
+            self.batch_parser,
+            _BATCH_FORMAT_INSTRUCTIONS,
+        )
 
     async def evaluate(
         self,
@@ -40,33 +73,16 @@ class AnswerEvaluationAgent(BaseAgent):
             AnswerEvaluation with score, rationale, evidence, and followup hint
         """
         # Validate inputs
-        self.validate_inputs(question=question, answer=answer)
         QuestionAnswerInput(question=question, answer=answer)
 
-        # Create the prompt
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                ("system", "You are an expert technical interviewer."),
-                (
-                    "human",
-                    ANSWER_EVALUATION_PROMPT
-                    + "\n\n{format_instructions}\n\nProvide your evaluation:",
-                ),
-            ]
-        )
-
-        # Create the chain
-        chain = prompt | self.llm | self.parser
-
         inputs = {
             "question": question,
             "answer": answer,
-            "format_instructions": self.parser.get_format_instructions(),
         }
 
         # Execute the evaluation
         result = await self.invoke_with_retry_async(
-            chain=chain,
+            chain=self._chain,
             inputs=inputs,
             model=getattr(self.llm, "model_name", "unknown"),
             temperature=0.0,
@@ -76,6 +92,79 @@ class AnswerEvaluationAgent(BaseAgent):
 
         return result
 
+    async def evaluate_batch(
+        self,
+        questions: list[str],
+        answers: list[str],
+        db: Optional[AsyncSession] = None,
+        interview_id: Optional[int] = None,
+    ) -> list[AnswerEvaluation]:
+        """
+        Evaluate several answers, packing up to EVALUATION_BATCH_SIZE pairs per LLM call.
+
+        Args:
+            questions: The questions that were asked
+            answers: The candidate's answers, aligned with questions
+            db: Database session for cost tracking
+            interview_id: Interview ID for cost tracking
+
+        Returns:
+            One AnswerEvaluation per question/answer pair, in input order
+
+        Raises:
+            ValueError: If questions and answers are not aligned
+            AgentError: If the model returns the wrong number of evaluations
+        """
+        if len(questions) != len(answers):
+            raise ValueError("questions and answers must have the same length")
+
+        for question, answer in zip(questions, answers):
+            QuestionAnswerInput(question=question, answer=answer)
+
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_BATCHES)
+
+        async def evaluate_chunk(chunk: list[tuple[str, str]]) -> list[AnswerEvaluation]:
+            qa_pairs = "\n\n".join(
+                f"Q{i}: {question}\nA{i}: {answer}"
+                for i, (question, answer) in enumerate(chunk, start=1)
+            )
+
+            async with semaphore:
+                result = await self.invoke_with_retry_async(
+                    chain=self._batch_chain,
+                    inputs={
+                        "qa_pairs": qa_pairs,
+                        "count": len(chunk),
+                    },
+                    model=getattr(self.llm, "model_name", "unknown"),
+                    temperature=0.0,
+                    db=db,
+                    interview_id=interview_id,
+                )
+
+            if len(result.evaluations) != len(chunk):
+                raise AgentError(
+                    f"Expected {len(chunk)} evaluations, got {len(result.evaluations)}"
+                )
+            return result.evaluations
+
+        pairs = list(zip(questions, answers))
+        chunk_results = await asyncio.gather(
+            *(
+                evaluate_chunk(pairs[start : start + EVALUATION_BATCH_SIZE])
+                for start in range(0, len(pairs), EVALUATION_BATCH_SIZE)
+            )
+        )
+
+        evaluations = [evaluation for chunk in chunk_results for evaluation in chunk]
+        return evaluations
+
+
+@lru_cache(maxsize=None)
+def _get_agent() -> AnswerEvaluationAgent:
+    """Return the shared agent used by the convenience functions."""
+    return AnswerEvaluationAgent()
+
 
 # Convenience function
 async def evaluate_answer(
@@ -96,5 +185,27 @@ async def evaluate_answer(
     Returns:
         AnswerEvaluation object
     """
-    agent = AnswerEvaluationAgent()
+    agent = _get_agent()
     return await agent.evaluate(question, answer, db, interview_id)
+
+
+async def evaluate_answers(
+    questions: list[str],
+    answers: list[str],
+    db: Optional[AsyncSession] = None,
+    interview_id: Optional[int] = None,
+) -> list[AnswerEvaluation]:
+    """
+    Evaluate several candidate answers in batched LLM calls.
+
+    Args:
+        questions: The questions asked
+        answers: The candidate's answers, aligned with questions
+        db: Database session
+        interview_id: Interview ID
+
+    Returns:
+        List of AnswerEvaluation objects, in input order
+    """
+    agent = _get_agent()
+    return await agent.evaluate_batch(questions, answers, db, interview_id)
@@ -1,10 +1,21 @@
 """Base agent class with error handling and retry logic."""
+import asyncio
 import logging
 from typing import Any, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from tenacity import (
+    AsyncRetrying,
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
 from langchain_core.exceptions import OutputParserException
+from langchain_core.output_parsers import PydanticOutputParser
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import Runnable, RunnableLambda
+from pydantic import BaseModel, ValidationError
 
 from app.config import settings
 from app.utils.llm_cache import get_cache
@@ -26,6 +37,43 @@ class LLMInvocationError(AgentError):
     pass
 
 
+# Retry policy shared by the sync decorator and the async retry loop
+_RETRY_STOP = stop_after_attempt(3)
+_RETRY_WAIT = wait_exponential(multiplier=1, min=2, max=10)
+_RETRY_ON = retry_if_exception_type((LLMInvocationError, OutputParserException))
+
+
+def _validate_structured_output(model: type[BaseModel]) -> RunnableLambda:
+    """
+    Build a chain step that turns structured LLM output into the model.
+
+    Some providers return the tool-call arguments as a plain dict for pydantic v2
+    schemas (langchain-openai's with_structured_output does), so the output is
+    validated here instead of trusting its type.
+
+    Args:
+        model: Pydantic model the chain must return
+
+    Returns:
+        Runnable that returns a model instance
+
+    Raises:
+        OutputParserException: If the output does not validate against the model
+    """
+
+    def validate(output: Any) -> BaseModel:
+        if isinstance(output, model):
+            return output
+        try:
+            return model.model_validate(output)
+        except ValidationError as e:
+            raise OutputParserException(
+                f"Failed to parse {model.__name__} from structured output {output!r}. Got: {e}"
+            ) from e
+
+    return RunnableLambda(validate)
+
+
 class BaseAgent:
     """Base class for all LangChain agents with common functionality."""
 
@@ -40,11 +88,48 @@ class BaseAgent:
         self.logger = logging.getLogger(f"agents.{agent_name}")
         self.cache = get_cache() if settings.cache_enabled else None
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((LLMInvocationError, OutputParserException)),
-    )
+    def build_structured_chain(
+        self,
+        system_prompt: str,
+        input_prompt: str,
+        parser: PydanticOutputParser,
+        format_instructions: str,
+    ) -> Runnable:
+        """
+        Build a prompt -> LLM chain that returns the parser's pydantic model.
+
+        Uses the provider's native structured output (function calling) when the
+        LLM supports it, so the schema travels as a tool definition instead of
+        prompt text and the response is never parsed from prose. Providers without
+        it fall back to format instructions and the JSON output parser.
+
+        Args:
+            system_prompt: Static instructions, sent first as the system message
+            input_prompt: Per-call template, sent as the human message
+            parser: Parser for the agent's output model
+            format_instructions: The parser's precomputed format instructions
+
+        Returns:
+            Runnable that takes the input_prompt variables and returns the model
+        """
+        try:
+            structured_llm = self.llm.with_structured_output(parser.pydantic_object)
+        except NotImplementedError:
+            self.logger.debug(f"{self.agent_name}: structured output unsupported, parsing JSON")
+            prompt = ChatPromptTemplate.from_messages(
+                [
+                    ("system", system_prompt + "\n\n{format_instructions}"),
+                    ("human", input_prompt),
+                ]
+            ).partial(format_instructions=format_instructions)
+            return prompt | self.llm | parser
+
+        prompt = ChatPromptTemplate.from_messages(
+            [("system", system_prompt), ("human", input_prompt)]
+        )
+        return prompt | structured_llm | _validate_structured_output(parser.pydantic_object)
+
+    @retry(stop=_RETRY_STOP, wait=_RETRY_WAIT, retry=_RETRY_ON)
     def invoke_with_retry(
         self,
         chain: Any,
@@ -86,7 +171,7 @@ class BaseAgent:
             )
             cached_response = self.cache.get(cache_key)
 
-        if cached_response:
+        if cached_response is not None:
             self.logger.info(f"{self.agent_name} agent - Cache HIT")
             return cached_response
 
@@ -99,10 +184,9 @@ class BaseAgent:
             self.logger.info(f"{self.agent_name} agent completed successfully")
             self.logger.debug(f"Output: {result}")
 
-            # Cache the response
+            # Cache the parsed response so hits return the same type
             if self.cache and use_cache and cache_key:
-                result_str = str(result)
-                self.cache.set(cache_key, result_str)
+                self.cache.set(cache_key, result)
                 self.logger.debug(f"Cached response with key: {cache_key[:16]}...")
 
             return result
@@ -142,6 +226,7 @@ class BaseAgent:
 
         Raises:
             LLMInvocationError: If all retries fail
+            OutputParserException: If the last attempt's output fails to parse
         """
         # Generate cache key from inputs
         prompt_str = str(inputs)
@@ -157,7 +242,7 @@ class BaseAgent:
             )
             cached_response = self.cache.get(cache_key)
 
-        if cached_response:
+        if cached_response is not None:
             self.logger.info(f"{self.agent_name} agent - Cache HIT")
             
             # Track cache hit in database if enabled
@@ -174,41 +259,44 @@ class BaseAgent:
             
             return cached_response
 
-        try:
-            self.logger.info(f"Invoking {self.agent_name} agent - Cache MISS")
-            self.logger.debug(f"Inputs: {inputs}")
-
-            result = chain.invoke(inputs)
-
-            self.logger.info(f"{self.agent_name} agent completed successfully")
-            self.logger.debug(f"Output: {result}")
-
-            # Cache the response
-            if self.cache and use_cache and cache_key:
-                # Convert result to string for caching
-                result_str = str(result)
-                self.cache.set(cache_key, result_str)
-                self.logger.debug(f"Cached response with key: {cache_key[:16]}...")
-
-            # Track cost if enabled
-            if settings.cost_tracking_enabled and db and interview_id:
-                await self._track_cost(
-                    db=db,
-                    interview_id=interview_id,
-                    model=model,
-                    prompt=prompt_str,
-                    response=str(result),
-                )
-
-            return result
-
-        except OutputParserException as e:
-            self.logger.error(f"Output parsing failed: {e}")
-            raise
+        self.logger.info(f"Invoking {self.agent_name} agent - Cache MISS")
+        self.logger.debug(f"Inputs: {inputs}")
+
+        # Same policy as invoke_with_retry; the last error is re-raised as-is
+        async for attempt in AsyncRetrying(
+            stop=_RETRY_STOP, wait=_RETRY_WAIT, retry=_RETRY_ON, reraise=True
+        ):
+            with attempt:
+                try:
+                    result = await chain.ainvoke(inputs)
+                except OutputParserException as e:
+                    self.logger.error(f"Output parsing failed: {e}")
+                    raise
+                except Exception as e:
+                    self.logger.error(f"{self.agent_name} agent failed: {e}")
+                    raise LLMInvocationError(
+                        f"Failed to invoke {self.agent_name}: {str(e)}"
+                    ) from e
+
+        self.logger.info(f"{self.agent_name} agent completed successfully")
+        self.logger.debug(f"Output: {result}")
+
+        # Cache the parsed response so hits return the same type
+        if self.cache and use_cache and cache_key:
+            self.cache.set(cache_key, result)
+            self.logger.debug(f"Cached response with key: {cache_key[:16]}...")
+
+        # Track cost if enabled
+        if settings.cost_tracking_enabled and db and interview_id:
+            await self._track_cost(
+                db=db,
+                interview_id=interview_id,
+                model=model,
+                prompt=prompt_str,
+                response=str(result),
+            )
 
-        except Exception as e:
-            self.logger.error(f"{self.agent_name} agent failed: {e}")
-            raise LLMInvocationError(f"Failed to invoke {self.agent_name}: {str(e)}") from e
+        return result
 
     async def _track_cost(
         self,
@@ -284,22 +372,25 @@ class BaseAgent:
             cost: Estimated cost
             cached: Whether response was cached
         """
-        try:
-            usage = LLMUsage(
-                interview_id=interview_id,
-                agent_name=self.agent_name,
-                model=model,
-                prompt_tokens=prompt_tokens,
-                completion_tokens=completion_tokens,
-                total_tokens=prompt_tokens + completion_tokens,
-                estimated_cost=cost,
-                cached=cached,
-            )
-            db.add(usage)
-            await db.commit()
-        except Exception as e:
-            self.logger.error(f"Failed to save usage to database: {e}")
-            await db.rollback()
+        usage = LLMUsage(
+            interview_id=interview_id,
+            agent_name=self.agent_name,
+            model=model,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=prompt_tokens + completion_tokens,
+            estimated_cost=cost,
+            cached=cached,
+        )
+        # Agents may run concurrently on one session; serialize the writes, and
+        # roll back under the same lock so a failure never races a sibling's commit
+        async with db.info.setdefault("llm_usage_lock", asyncio.Lock()):
+            try:
+                db.add(usage)
+                await db.commit()
+            except Exception as e:
+                self.logger.error(f"Failed to save usage to database: {e}")
+                await db.rollback()
 
     def validate_inputs(self, **kwargs: Any) -> None:
         """
@@ -1,14 +1,19 @@
 """Document Analysis Agent - analyzes resume, role description, and job offering."""
-from langchain.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import PydanticOutputParser
+from functools import lru_cache
 
 from app.agents.base import BaseAgent
 from app.agents.llm_factory import get_llm
-from app.agents.prompts import DOCUMENT_ANALYSIS_PROMPT
+from app.agents.output_parsers import PydanticJsonOutputParser
+from app.agents.prompts import DOCUMENT_ANALYSIS_INPUT_PROMPT, DOCUMENT_ANALYSIS_PROMPT
 from app.agents.validators import DocumentInput
 from app.schemas.interview import MatchAnalysis
 
 
+# Parsers and their format instructions are stateless; build them once at import
+_PARSER = PydanticJsonOutputParser(pydantic_object=MatchAnalysis)
+_FORMAT_INSTRUCTIONS = _PARSER.get_format_instructions()
+
+
 class DocumentAnalysisAgent(BaseAgent):
     """Agent for analyzing candidate-role fit."""
 
@@ -16,7 +21,14 @@ class DocumentAnalysisAgent(BaseAgent):
         """Initialize the document analysis agent."""
         super().__init__("document_analysis")
         self.llm = get_llm(temperature=0.0)  # Deterministic for consistency
-        self.parser = PydanticOutputParser(pydantic_object=MatchAnalysis)
+        self.parser = _PARSER
+        # Built once per agent; static instructions first for provider prefix caching
+        self._chain = self.build_structured_chain(
+            DOCUMENT_ANALYSIS_PROMPT,
+            DOCUMENT_ANALYSIS_INPUT_PROMPT,
+            self.parser,
+            _FORMAT_INSTRUCTIONS,
+        )
 
     def analyze(
         self, resume_text: str, role_description_text: str, job_offering_text: str
@@ -42,30 +54,14 @@ class DocumentAnalysisAgent(BaseAgent):
             job_offering_text=job_offering_text,
         )
 
-        # Create the prompt with format instructions
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                ("system", "You are an expert technical recruiter."),
-                (
-                    "human",
-                    DOCUMENT_ANALYSIS_PROMPT
-                    + "\n\n{format_instructions}\n\nProvide your analysis:",
-                ),
-            ]
-        )
-
-        # Create the chain
-        chain = prompt | self.llm | self.parser
-
         # Execute the analysis with retry logic
         from app.config import settings
         result = self.invoke_with_retry(
-            chain,
+            self._chain,
             {
                 "resume_text": validated.resume_text,
                 "role_description_text": validated.role_description_text,
                 "job_offering_text": validated.job_offering_text,
-                "format_instructions": self.parser.get_format_instructions(),
             },
             model=settings.llm_model,
         )
@@ -100,30 +96,14 @@ class DocumentAnalysisAgent(BaseAgent):
             job_offering_text=job_offering_text,
         )
 
-        # Create the prompt with format instructions
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                ("system", "You are an expert technical recruiter."),
-                (
-                    "human",
-                    DOCUMENT_ANALYSIS_PROMPT
-                    + "\n\n{format_instructions}\n\nProvide your analysis:",
-                ),
-            ]
-        )
-
-        # Create the chain
-        chain = prompt | self.llm | self.parser
-
         # Execute the analysis with retry logic and cost tracking
         from app.config import settings
         result = await self.invoke_with_retry_async(
-            chain,
+            self._chain,
             {
                 "resume_text": validated.resume_text,
                 "role_description_text": validated.role_description_text,
                 "job_offering_text": validated.job_offering_text,
-                "format_instructions": self.parser.get_format_instructions(),
             },
             model=settings.llm_model,
             db=db,
@@ -133,6 +113,12 @@ class DocumentAnalysisAgent(BaseAgent):
         return result
 
 
+@lru_cache(maxsize=None)
+def _get_agent() -> DocumentAnalysisAgent:
+    """Return the shared agent used by the convenience functions."""
+    return DocumentAnalysisAgent()
+
+
 # Convenience function
 def analyze_documents(
     resume_text: str, role_description_text: str, job_offering_text: str
@@ -148,5 +134,31 @@ def analyze_documents(
     Returns:
         MatchAnalysis object
     """
-    agent = DocumentAnalysisAgent()
+    agent = _get_agent()
     return agent.analyze(resume_text, role_description_text, job_offering_text)
+
+
+async def analyze_documents_async(
+    resume_text: str,
+    role_description_text: str,
+    job_offering_text: str,
+    db=None,
+    interview_id: int = None,
+) -> MatchAnalysis:
+    """
+    Analyze candidate-role match without blocking the event loop.
+
+    Args:
+        resume_text: Resume content
+        role_description_text: Role description content
+        job_offering_text: Job offering content
+        db: Database session for cost tracking
+        interview_id: Interview ID for cost tracking
+
+    Returns:
+        MatchAnalysis object
+    """
+    agent = _get_agent()
+    return await agent.analyze_async(
+        resume_text, role_description_text, job_offering_text, db, interview_id
+    )
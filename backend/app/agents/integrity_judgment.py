@@ -1,15 +1,92 @@
 """Integrity Judgment Agent - optional per-message integrity assessment."""
+import asyncio
+from collections import deque
+from functools import lru_cache
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from langchain.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import PydanticOutputParser
 
 from app.agents.base import BaseAgent
 from app.agents.llm_factory import get_llm
-from app.agents.prompts import INTEGRITY_JUDGMENT_PROMPT
+from app.agents.output_parsers import PydanticJsonOutputParser
+from app.agents.prompts import INTEGRITY_JUDGMENT_INPUT_PROMPT, INTEGRITY_JUDGMENT_PROMPT
 from app.schemas.interview import IntegrityAssessment
 from app.agents.validators import IntegrityAdjustmentInput
 
+# Deterministic pre-filter thresholds
+SLOW_RESPONSE_MS = 8000  # Typed (no paste) answers slower than this are low risk
+MIN_STYLE_OVERLAP = 0.15  # Trigram overlap with previous answers below this is low risk
+MAX_TYPING_CHARS_PER_MS = 0.4  # Faster than this cannot have been typed by hand
+TYPING_SPEED_CERTAINTY = 80.0
+
+# Number of most recent answers used for style comparison
+STYLE_WINDOW = 3
+
+# Maximum number of LLM assessments in flight at once during batch assessment
+MAX_CONCURRENT_ASSESSMENTS = 8
+
+
+@lru_cache(maxsize=256)
+def _trigrams(text: str) -> frozenset[str]:
+    """Return the set of lowercase character trigrams in text (memoized per answer)."""
+    text = text.lower()
+    return frozenset(text[i : i + 3] for i in range(len(text) - 2))
+
+
+def _trigram_overlap(a: frozenset[str], b: frozenset[str]) -> float:
+    """Return the Jaccard overlap of two trigram sets."""
+    if not a or not b:
+        return 0.0
+    shared = sum(1 for trigram in a if trigram in b)
+    return shared / (len(a) + len(b) - shared)
+
+
+def _cheap_integrity_prefilter(
+    answer: str,
+    response_time_ms: int,
+    paste_detected: bool,
+    previous_answers: list[str],
+) -> Optional[IntegrityAssessment]:
+    """
+    Decide clear-cut integrity cases from telemetry without calling the LLM.
+
+    Args:
+        answer: The candidate's answer
+        response_time_ms: Response time in milliseconds
+        paste_detected: Whether paste was detected
+        previous_answers: Previous answers for style comparison
+
+    Returns:
+        IntegrityAssessment for clear-cut cases, None if the LLM should decide
+    """
+    if response_time_ms > 0 and len(answer) / response_time_ms > MAX_TYPING_CHARS_PER_MS:
+        chars_per_second = len(answer) * 1000 / response_time_ms
+        return IntegrityAssessment(
+            cheat_certainty=TYPING_SPEED_CERTAINTY,
+            indicators=[f"Answer produced at {chars_per_second:.0f} characters per second"],
+        )
+
+    if paste_detected:
+        return None
+
+    if response_time_ms > SLOW_RESPONSE_MS:
+        return IntegrityAssessment(cheat_certainty=0.0, indicators=[])
+
+    if previous_answers:
+        answer_trigrams = _trigrams(answer)
+        max_overlap = max(
+            _trigram_overlap(answer_trigrams, _trigrams(previous))
+            for previous in previous_answers[-STYLE_WINDOW:]
+        )
+        if max_overlap < MIN_STYLE_OVERLAP:
+            return IntegrityAssessment(cheat_certainty=0.0, indicators=[])
+
+    return None
+
+
+# Parsers and their format instructions are stateless; build them once at import
+_PARSER = PydanticJsonOutputParser(pydantic_object=IntegrityAssessment)
+_FORMAT_INSTRUCTIONS = _PARSER.get_format_instructions()
+
 
 class IntegrityJudgmentAgent(BaseAgent):
     """Agent for assessing potential integrity issues in answers."""
@@ -18,7 +95,14 @@ class IntegrityJudgmentAgent(BaseAgent):
         """Initialize the integrity judgment agent."""
         super().__init__(agent_name="integrity_judgment")
         self.llm = get_llm(temperature=0.0)  # Deterministic for fairness
-        self.parser = PydanticOutputParser(pydantic_object=IntegrityAssessment)
+        self.parser = _PARSER
+        # Built once per agent; static instructions first for provider prefix caching
+        self._chain = self.build_structured_chain(
+            INTEGRITY_JUDGMENT_PROMPT,
+            INTEGRITY_JUDGMENT_INPUT_PROMPT,
+            self.parser,
+            _FORMAT_INSTRUCTIONS,
+        )
 
     async def assess(
         self,
@@ -46,7 +130,6 @@ class IntegrityJudgmentAgent(BaseAgent):
             IntegrityAssessment with certainty and indicators
         """
         # Validate inputs
-        self.validate_inputs(question=question, answer=answer)
         IntegrityAdjustmentInput(
             question=question,
             answer=answer,
@@ -54,24 +137,17 @@ class IntegrityJudgmentAgent(BaseAgent):
             paste_detected=paste_detected,
         )
 
-        # Create the prompt
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                ("system", "You are analyzing interview integrity."),
-                (
-                    "human",
-                    INTEGRITY_JUDGMENT_PROMPT
-                    + "\n\n{format_instructions}\n\nProvide your assessment:",
-                ),
-            ]
+        # Skip the LLM for clear-cut cases
+        prefiltered = _cheap_integrity_prefilter(
+            answer, response_time_ms, paste_detected, previous_answers
         )
-
-        # Create the chain
-        chain = prompt | self.llm | self.parser
+        if prefiltered is not None:
+            return prefiltered
 
         # Format previous answers
         previous_answers_str = "\n\n".join(
-            [f"Answer {i+1}: {ans}" for i, ans in enumerate(previous_answers[-3:])]
+            f"Answer {i}: {ans}"
+            for i, ans in enumerate(previous_answers[-STYLE_WINDOW:], start=1)
         ) or "No previous answers yet"
 
         inputs = {
@@ -80,12 +156,11 @@ class IntegrityJudgmentAgent(BaseAgent):
             "response_time_ms": response_time_ms,
             "paste_detected": paste_detected,
             "previous_answers": previous_answers_str,
-            "format_instructions": self.parser.get_format_instructions(),
         }
 
         # Execute assessment
         result = await self.invoke_with_retry_async(
-            chain=chain,
+            chain=self._chain,
             inputs=inputs,
             model=getattr(self.llm, "model_name", "unknown"),
             temperature=0.0,
@@ -95,6 +170,59 @@ class IntegrityJudgmentAgent(BaseAgent):
 
         return result
 
+    async def assess_batch(
+        self,
+        items: list[IntegrityAdjustmentInput],
+        db: Optional[AsyncSession] = None,
+        interview_id: Optional[int] = None,
+    ) -> list[IntegrityAssessment]:
+        """
+        Assess every answer of an interview, each against the answers before it.
+
+        Trigram sets are memoized per answer, so the pre-filter builds each one once
+        across the whole batch. Answers the pre-filter cannot decide are assessed by
+        the LLM concurrently, at most MAX_CONCURRENT_ASSESSMENTS at a time.
+
+        Args:
+            items: Question/answer pairs with telemetry, in interview order
+            db: Database session for cost tracking
+            interview_id: Interview ID for cost tracking
+
+        Returns:
+            One IntegrityAssessment per item, in input order
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_ASSESSMENTS)
+
+        async def assess_item(
+            item: IntegrityAdjustmentInput, previous_answers: list[str]
+        ) -> IntegrityAssessment:
+            async with semaphore:
+                return await self.assess(
+                    item.question,
+                    item.answer,
+                    item.response_time_ms,
+                    item.paste_detected,
+                    previous_answers,
+                    db,
+                    interview_id,
+                )
+
+        # Only the last STYLE_WINDOW answers are ever compared, so keep a ring buffer
+        # instead of slicing the growing answer list for every item
+        recent_answers: deque[str] = deque(maxlen=STYLE_WINDOW)
+        calls = []
+        for item in items:
+            calls.append(assess_item(item, list(recent_answers)))
+            recent_answers.append(item.answer)
+
+        return list(await asyncio.gather(*calls))
+
+
+@lru_cache(maxsize=None)
+def _get_agent() -> IntegrityJudgmentAgent:
+    """Return the shared agent used by the convenience functions."""
+    return IntegrityJudgmentAgent()
+
 
 # Convenience function
 async def assess_integrity(
@@ -121,7 +249,7 @@ async def assess_integrity(
     Returns:
         IntegrityAssessment object
     """
-    agent = IntegrityJudgmentAgent()
+    agent = _get_agent()
     return await agent.assess(
         question,
         answer,
@@ -1,4 +1,6 @@
 """LLM factory for creating language model instances."""
+from functools import lru_cache
+
 from langchain_openai import ChatOpenAI
 from langchain_google_genai import ChatGoogleGenerativeAI
 
@@ -60,6 +62,12 @@ class LLMFactory:
 
 
 # Convenience function
+@lru_cache(maxsize=8)
 def get_llm(temperature: float = 0.0):
-    """Get an LLM instance with the specified temperature."""
+    """
+    Get the shared LLM instance for the specified temperature.
+
+    Provider and model are fixed for the lifetime of the process, so agents with the
+    same temperature share one client (and its HTTP connection pool).
+    """
     return LLMFactory.create_llm(temperature=temperature)
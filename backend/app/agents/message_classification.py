@@ -1,16 +1,57 @@
 """Message Classification Agent - classifies candidate messages."""
+import re
+from functools import lru_cache
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from langchain.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import PydanticOutputParser
 
 from app.agents.base import BaseAgent
 from app.agents.llm_factory import get_llm
-from app.agents.prompts import MESSAGE_CLASSIFICATION_PROMPT
+from app.agents.output_parsers import PydanticJsonOutputParser
+from app.agents.prompts import MESSAGE_CLASSIFICATION_INPUT_PROMPT, MESSAGE_CLASSIFICATION_PROMPT
 from app.schemas.interview import MessageClassification
 from app.agents.validators import MessageClassificationInput
 
 
+# Parsers and their format instructions are stateless; build them once at import
+_PARSER = PydanticJsonOutputParser(pydantic_object=MessageClassification)
+_FORMAT_INSTRUCTIONS = _PARSER.get_format_instructions()
+
+# Confidence reported for messages decided by the rules below
+RULE_CONFIDENCE = 0.95
+
+# Give-ups ("idk", "pass", "no idea") are answers; evaluation scores them low
+_GIVE_UP_PATTERN = re.compile(
+    r"(?:idk|pass|skip|no idea|not sure|i don'?t know|no clue)[.!]*",
+    re.IGNORECASE,
+)
+
+# Requests to restate or explain the question, matched at the start of the message
+_CLARIFICATION_PATTERN = re.compile(
+    r"(?:can|could|would) you (?:please )?(?:repeat|rephrase|clarify|explain the question)"
+    r"|(?:please )?(?:repeat|rephrase|clarify)\b"
+    r"|what do you mean\b"
+    r"|what does (?:that|the question) mean\b",
+    re.IGNORECASE,
+)
+
+
+def _rule_based_classify(candidate_message: str) -> Optional[MessageClassification]:
+    """
+    Classify messages that match an unambiguous pattern without calling the LLM.
+
+    Args:
+        candidate_message: The candidate's message, already stripped
+
+    Returns:
+        MessageClassification, or None if the message needs the LLM
+    """
+    if _GIVE_UP_PATTERN.fullmatch(candidate_message):
+        return MessageClassification(type="Answer", confidence=RULE_CONFIDENCE)
+    if _CLARIFICATION_PATTERN.match(candidate_message):
+        return MessageClassification(type="Clarification", confidence=RULE_CONFIDENCE)
+    return None
+
+
 class MessageClassificationAgent(BaseAgent):
     """Agent for classifying candidate messages."""
 
@@ -18,7 +59,14 @@ class MessageClassificationAgent(BaseAgent):
         """Initialize the message classification agent."""
         super().__init__(agent_name="message_classification")
         self.llm = get_llm(temperature=0.0)  # Deterministic for consistency
-        self.parser = PydanticOutputParser(pydantic_object=MessageClassification)
+        self.parser = _PARSER
+        # Built once per agent; static instructions first for provider prefix caching
+        self._chain = self.build_structured_chain(
+            MESSAGE_CLASSIFICATION_PROMPT,
+            MESSAGE_CLASSIFICATION_INPUT_PROMPT,
+            self.parser,
+            _FORMAT_INSTRUCTIONS,
+        )
 
     async def classify(
         self,
@@ -40,33 +88,24 @@ class MessageClassificationAgent(BaseAgent):
             MessageClassification with type and confidence
         """
         # Validate inputs
-        self.validate_inputs(current_question=current_question, candidate_message=candidate_message)
-        MessageClassificationInput(current_question=current_question, candidate_message=candidate_message)
-
-        # Create the prompt
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                ("system", "You are analyzing interview messages."),
-                (
-                    "human",
-                    MESSAGE_CLASSIFICATION_PROMPT
-                    + "\n\n{format_instructions}\n\nProvide your classification:",
-                ),
-            ]
+        validated = MessageClassificationInput(
+            current_question=current_question, candidate_message=candidate_message
         )
 
-        # Create the chain
-        chain = prompt | self.llm | self.parser
+        # Obvious cases don't need an LLM round-trip
+        rule_result = _rule_based_classify(validated.candidate_message)
+        if rule_result is not None:
+            self.logger.info(f"{self.agent_name} agent - Rule match: {rule_result.type}")
+            return rule_result
 
         inputs = {
             "current_question": current_question,
             "candidate_message": candidate_message,
-            "format_instructions": self.parser.get_format_instructions(),
         }
 
         # Execute classification
         result = await self.invoke_with_retry_async(
-            chain=chain,
+            chain=self._chain,
             inputs=inputs,
             model=getattr(self.llm, "model_name", "unknown"),
             temperature=0.0,
@@ -77,6 +116,12 @@ class MessageClassificationAgent(BaseAgent):
         return result
 
 
+@lru_cache(maxsize=None)
+def _get_agent() -> MessageClassificationAgent:
+    """Return the shared agent used by the convenience functions."""
+    return MessageClassificationAgent()
+
+
 # Convenience function
 async def classify_message(
     current_question: str,
@@ -96,5 +141,5 @@ async def classify_message(
     Returns:
         MessageClassification object
     """
-    agent = MessageClassificationAgent()
+    agent = _get_agent()
     return await agent.classify(current_question, candidate_message, db, interview_id)
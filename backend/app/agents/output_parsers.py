@@ -0,0 +1,100 @@
+"""Output parsers for agent chains."""
+from typing import List, Optional
+
+from langchain_core.exceptions import OutputParserException
+from langchain_core.output_parsers import PydanticOutputParser
+from langchain_core.outputs import Generation
+from pydantic import ValidationError
+
+
+def find_json_span(text: str) -> Optional[tuple[int, int]]:
+    """
+    Locate the first complete top-level JSON object in text with a single pass.
+
+    Handles braces inside strings and escaped quotes, so surrounding prose or
+    markdown code fences are ignored without regex matching.
+
+    Args:
+        text: LLM completion text
+
+    Returns:
+        (start, end) slice bounds of the JSON object, or None if there is none
+    """
+    start = text.find("{")
+    if start == -1:
+        return None
+
+    depth = 0
+    in_string = False
+    escaped = False
+    for index in range(start, len(text)):
+        char = text[index]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return start, index + 1
+
+    return None
+
+
+class PydanticJsonOutputParser(PydanticOutputParser):
+    """
+    Pydantic output parser that validates the raw JSON span directly.
+
+    The stock parser decodes the completion with json.loads and then validates the
+    resulting dict. This parser locates the JSON object once and hands the string
+    to model_validate_json, so decoding and validation happen in a single pass
+    inside pydantic-core. Format instructions are unchanged.
+    """
+
+    def parse_result(self, result: List[Generation], *, partial: bool = False):
+        """
+        Parse the first generation into the pydantic model.
+
+        Args:
+            result: LLM generations
+            partial: Unused; partial (streaming) parsing is not supported
+
+        Returns:
+            Validated pydantic model instance
+
+        Raises:
+            OutputParserException: If no JSON object is found or validation fails
+        """
+        text = result[0].text
+        span = find_json_span(text)
+        if span is None:
+            raise OutputParserException(
+                f"No JSON object found in completion: {text}", llm_output=text
+            )
+
+        try:
+            return self.pydantic_object.model_validate_json(text[span[0] : span[1]])
+        except ValidationError as e:
+            name = self.pydantic_object.__name__
+            raise OutputParserException(
+                f"Failed to parse {name} from completion {text}. Got: {e}", llm_output=text
+            ) from e
+
+    def parse(self, text: str):
+        """
+        Parse completion text into the pydantic model.
+
+        Args:
+            text: LLM completion text
+
+        Returns:
+            Validated pydantic model instance
+        """
+        return self.parse_result([Generation(text=text)])
@@ -1,12 +1,15 @@
 """Question Generation Agent - generates adaptive interview questions."""
+from collections.abc import AsyncIterator
+from functools import lru_cache
 from typing import Optional
 from langchain.prompts import ChatPromptTemplate
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.agents.base import BaseAgent
 from app.agents.llm_factory import get_llm
-from app.agents.prompts import QUESTION_GENERATION_PROMPT
+from app.agents.prompts import QUESTION_GENERATION_INPUT_PROMPT, QUESTION_GENERATION_PROMPT
 from app.agents.validators import QuestionGenerationInput
+from app.config import settings
 
 
 class QuestionGenerationAgent(BaseAgent):
@@ -16,6 +19,14 @@ class QuestionGenerationAgent(BaseAgent):
         """Initialize the question generation agent."""
         super().__init__(agent_name="question_generation")
         self.llm = get_llm(temperature=0.7)  # Some creativity for varied questions
+        # Built once per agent; static instructions first for provider prefix caching
+        self._prompt = ChatPromptTemplate.from_messages(
+            [
+                ("system", QUESTION_GENERATION_PROMPT),
+                ("human", QUESTION_GENERATION_INPUT_PROMPT),
+            ]
+        )
+        self._chain = self._prompt | self.llm
 
     async def generate_question(
         self,
@@ -40,13 +51,82 @@ class QuestionGenerationAgent(BaseAgent):
         Returns:
             The next question to ask
         """
-        # Validate inputs
-        self.validate_inputs(
-            difficulty_level=difficulty_level,
-            questions_asked=questions_asked
+        inputs = self._build_inputs(focus_areas, difficulty_level, chat_history, questions_asked)
+
+        # Execute question generation
+        result = await self.invoke_with_retry_async(
+            chain=self._chain,
+            inputs=inputs,
+            model=getattr(self.llm, "model_name", "unknown"),
+            temperature=0.7,
+            db=db,
+            interview_id=interview_id,
         )
-        
-        # Additional Pydantic validation
+
+        # Extract the text content
+        return result.content.strip()
+
+    async def stream_question(
+        self,
+        focus_areas: list[str],
+        difficulty_level: float,
+        chat_history: str,
+        questions_asked: int,
+        db: Optional[AsyncSession] = None,
+        interview_id: Optional[int] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Generate the next interview question, yielding text chunks as the LLM decodes them.
+
+        Streamed responses bypass the LLM cache; cost is tracked once the stream completes.
+
+        Args:
+            focus_areas: List of topics to cover in the interview
+            difficulty_level: Current difficulty (3-10 scale)
+            chat_history: Previous conversation context
+            questions_asked: Number of questions already asked
+            db: Database session for cost tracking
+            interview_id: Interview ID for cost tracking
+
+        Yields:
+            Chunks of the question text
+        """
+        inputs = self._build_inputs(focus_areas, difficulty_level, chat_history, questions_asked)
+
+        chunks: list[str] = []
+        async for chunk in self._chain.astream(inputs):
+            if chunk.content:
+                chunks.append(chunk.content)
+                yield chunk.content
+
+        if settings.cost_tracking_enabled and db and interview_id:
+            await self._track_cost(
+                db=db,
+                interview_id=interview_id,
+                model=getattr(self.llm, "model_name", "unknown"),
+                prompt=str(inputs),
+                response="".join(chunks),
+            )
+
+    def _build_inputs(
+        self,
+        focus_areas: list[str],
+        difficulty_level: float,
+        chat_history: str,
+        questions_asked: int,
+    ) -> dict:
+        """
+        Validate the generation parameters and build the prompt inputs.
+
+        Args:
+            focus_areas: List of topics to cover in the interview
+            difficulty_level: Current difficulty (3-10 scale)
+            chat_history: Previous conversation context
+            questions_asked: Number of questions already asked
+
+        Returns:
+            Input dictionary for the chain
+        """
         QuestionGenerationInput(
             focus_areas=focus_areas,
             difficulty_level=difficulty_level,
@@ -54,36 +134,18 @@ class QuestionGenerationAgent(BaseAgent):
             questions_asked=questions_asked
         )
 
-        # Create the prompt
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                ("system", "You are an expert technical interviewer."),
-                ("human", QUESTION_GENERATION_PROMPT),
-            ]
-        )
-
-        # Create the chain
-        chain = prompt | self.llm
-
-        inputs = {
+        return {
             "focus_areas": ", ".join(focus_areas),
             "difficulty_level": difficulty_level,
             "chat_history": chat_history or "No previous questions yet.",
             "questions_asked": questions_asked,
         }
 
-        # Execute question generation
-        result = await self.invoke_with_retry_async(
-            chain=chain,
-            inputs=inputs,
-            model=getattr(self.llm, "model_name", "unknown"),
-            temperature=0.7,
-            db=db,
-            interview_id=interview_id,
-        )
 
-        # Extract the text content
-        return result.content.strip()
+@lru_cache(maxsize=None)
+def _get_agent() -> QuestionGenerationAgent:
+    """Return the shared agent used by the convenience functions."""
+    return QuestionGenerationAgent()
 
 
 # Convenience function
@@ -109,7 +171,36 @@ async def generate_question(
     Returns:
         Next question string
     """
-    agent = QuestionGenerationAgent()
+    agent = _get_agent()
     return await agent.generate_question(
         focus_areas, difficulty_level, chat_history, questions_asked, db, interview_id
     )
+
+
+async def stream_question(
+    focus_areas: list[str],
+    difficulty_level: float,
+    chat_history: str = "",
+    questions_asked: int = 0,
+    db: Optional[AsyncSession] = None,
+    interview_id: Optional[int] = None,
+) -> AsyncIterator[str]:
+    """
+    Stream the next interview question as it is generated.
+
+    Args:
+        focus_areas: Topics to cover
+        difficulty_level: Current difficulty (3-10)
+        chat_history: Previous conversation
+        questions_asked: Number of questions asked
+        db: Database session
+        interview_id: Interview ID
+
+    Yields:
+        Chunks of the question text
+    """
+    agent = _get_agent()
+    async for chunk in agent.stream_question(
+        focus_areas, difficulty_level, chat_history, questions_asked, db, interview_id
+    ):
+        yield chunk
@@ -1,15 +1,20 @@
 """Report Generation Agent - creates final interview reports."""
+from functools import lru_cache
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from langchain.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import PydanticOutputParser
 
 from app.agents.base import BaseAgent
 from app.agents.llm_factory import get_llm
-from app.agents.prompts import REPORT_GENERATION_PROMPT
+from app.agents.output_parsers import PydanticJsonOutputParser
+from app.agents.prompts import REPORT_GENERATION_INPUT_PROMPT, REPORT_GENERATION_PROMPT
 from app.schemas.interview import FinalReport
 
 
+# Parsers and their format instructions are stateless; build them once at import
+_PARSER = PydanticJsonOutputParser(pydantic_object=FinalReport)
+_FORMAT_INSTRUCTIONS = _PARSER.get_format_instructions()
+
+
 class ReportGenerationAgent(BaseAgent):
     """Agent for generating final interview reports."""
 
@@ -17,7 +22,14 @@ class ReportGenerationAgent(BaseAgent):
         """Initialize the report generation agent."""
         super().__init__(agent_name="report_generation")
         self.llm = get_llm(temperature=0.0)  # Deterministic for consistency
-        self.parser = PydanticOutputParser(pydantic_object=FinalReport)
+        self.parser = _PARSER
+        # Built once per agent; static instructions first for provider prefix caching
+        self._chain = self.build_structured_chain(
+            REPORT_GENERATION_PROMPT,
+            REPORT_GENERATION_INPUT_PROMPT,
+            self.parser,
+            _FORMAT_INSTRUCTIONS,
+        )
 
     async def generate_report(
         self,
@@ -45,21 +57,6 @@ class ReportGenerationAgent(BaseAgent):
         # Validate inputs
         self.validate_inputs(transcript=transcript, telemetry_summary=telemetry_summary)
 
-        # Create the prompt
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                ("system", "You are an expert technical recruiter creating interview reports."),
-                (
-                    "human",
-                    REPORT_GENERATION_PROMPT
-                    + "\n\n{format_instructions}\n\nProvide your report:",
-                ),
-            ]
-        )
-
-        # Create the chain
-        chain = prompt | self.llm | self.parser
-
         # Format the data
         match_analysis_str = (
             f"Match Score: {match_analysis.get('match_score')}/10\n"
@@ -79,12 +76,11 @@ class ReportGenerationAgent(BaseAgent):
             "transcript": transcript,
             "question_scores": question_scores_str,
             "telemetry_summary": telemetry_summary,
-            "format_instructions": self.parser.get_format_instructions(),
         }
 
         # Execute report generation
         result = await self.invoke_with_retry_async(
-            chain=chain,
+            chain=self._chain,
             inputs=inputs,
             model=getattr(self.llm, "model_name", "unknown"),
             temperature=0.0,
@@ -95,6 +91,12 @@ class ReportGenerationAgent(BaseAgent):
         return result
 
 
+@lru_cache(maxsize=None)
+def _get_agent() -> ReportGenerationAgent:
+    """Return the shared agent used by the convenience functions."""
+    return ReportGenerationAgent()
+
+
 # Convenience function
 async def generate_report(
     match_analysis: dict,
@@ -118,7 +120,7 @@ async def generate_report(
     Returns:
         FinalReport object
     """
-    agent = ReportGenerationAgent()
+    agent = _get_agent()
     return await agent.generate_report(
         match_analysis, transcript, question_scores, telemetry_summary, db, interview_id
     )
@@ -1,5 +1,12 @@
 """Authentication endpoints."""
+import asyncio
+import hashlib
+import hmac
+import logging
+import secrets
+import time
 from datetime import timedelta
+from functools import lru_cache
 
 from fastapi import APIRouter, HTTPException, status, Request
 from pydantic import BaseModel
@@ -8,6 +15,7 @@ from app.config import settings
 from app.utils.auth import create_access_token, verify_password
 from app.middleware.rate_limit import limiter, RATE_LIMIT_AUTH
 
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
 
@@ -25,11 +33,97 @@ class TokenResponse(BaseModel):
     token_type: str = "bearer"
 
 
-# Admin credentials (Argon2 hashed password)
-# Password: admin123
-# To regenerate: poetry run python generate_argon2_hash.py
+# Admin credentials; the Argon2 password hash comes from settings.admin_password_hash
+# To generate one: poetry run python generate_argon2_hash.py <password>
 ADMIN_USERNAME = "admin"
-ADMIN_PASSWORD_HASH = "$argon2id$v=19$m=65536,t=3,p=4$7z1nrBWitDamVCqlVKoVQg$fPZ8YXweR0XY+K0xPKLNxw5Jj8FqVLLqVqKqKqKqKqI"
+_ADMIN_USERNAME_BYTES = ADMIN_USERNAME.encode()
+
+# Resolved once at import instead of per request
+try:
+    import argon2  # noqa: F401
+
+    _ARGON2_AVAILABLE = True
+except ImportError:
+    _ARGON2_AVAILABLE = False
+
+# Development-only plain-text admin password (see settings.admin_password_fallback_enabled)
+_DEV_ADMIN_PASSWORD = b"admin123"
+
+# Memoized admin password checks, keyed by a per-process keyed digest so the
+# cache never holds plaintext passwords
+_VERIFY_CACHE_KEY = secrets.token_bytes(16)
+_VERIFY_CACHE_SIZE = 128
+_admin_verify_cache: dict[bytes, bool] = {}
+
+
+def check_admin_credentials() -> None:
+    """
+    Ensure some admin login is configured.
+
+    Raises:
+        RuntimeError: If neither ADMIN_PASSWORD_HASH nor the development fallback is set
+    """
+    if not settings.admin_password_hash and not settings.admin_password_fallback_enabled:
+        raise RuntimeError(
+            "No admin login configured: set ADMIN_PASSWORD_HASH "
+            "(generate with: python generate_argon2_hash.py <password>), or "
+            "ADMIN_PASSWORD_FALLBACK_ENABLED=true for local development"
+        )
+
+
+async def _verify_admin(password: str) -> bool:
+    """
+    Verify a password against the configured admin hash, caching the result.
+
+    Argon2 verification is deliberately expensive and the admin hash is fixed for the process,
+    so repeated logins with the same password only pay for it once. Misses run the
+    hash on a worker thread so the event loop keeps serving other requests.
+
+    Args:
+        password: Plain text password
+
+    Returns:
+        True if password matches the admin hash, False otherwise (or with no hash set)
+    """
+    password_hash = settings.admin_password_hash
+    if not password_hash:
+        return False
+
+    digest = hashlib.blake2b(
+        password.encode(), digest_size=16, key=_VERIFY_CACHE_KEY
+    ).digest()
+
+    result = _admin_verify_cache.get(digest)
+    if result is None:
+        result = await asyncio.to_thread(verify_password, password, password_hash)
+        if len(_admin_verify_cache) >= _VERIFY_CACHE_SIZE:
+            # Evict the oldest entry
+            _admin_verify_cache.pop(next(iter(_admin_verify_cache)))
+        _admin_verify_cache[digest] = result
+
+    return result
+
+
+# Logins within the same window reuse one signed token instead of re-signing
+_TOKEN_BUCKET_SECONDS = 30
+
+
+@lru_cache(maxsize=32)
+def _signed_token(sub: str, exp_bucket: int) -> str:
+    """
+    Create (or reuse) the access token for a subject within a time bucket.
+
+    Args:
+        sub: Token subject (username)
+        exp_bucket: Current time bucket, int(time.time()) // _TOKEN_BUCKET_SECONDS
+
+    Returns:
+        Encoded JWT token
+    """
+    return create_access_token(
+        data={"sub": sub},
+        expires_delta=timedelta(minutes=settings.access_token_expire_minutes),
+    )
 
 
 @router.post("/login", response_model=TokenResponse)
@@ -47,10 +141,10 @@ async def login(request: Request, login_data: LoginRequest):
     Raises:
         HTTPException: If credentials are invalid
     """
-    # Verify username
-    print(f"DEBUG: Login attempt for username: {login_data.username}")
-    if login_data.username != ADMIN_USERNAME:
-        print(f"DEBUG: Username mismatch. Expected {ADMIN_USERNAME}, got {login_data.username}")
+    # Verify username in constant time; unknown users never reach Argon2
+    logger.debug("Login attempt for username: %s", login_data.username)
+    if not hmac.compare_digest(login_data.username.encode(), _ADMIN_USERNAME_BYTES):
+        logger.debug("Username mismatch for login attempt: %s", login_data.username)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -58,42 +152,26 @@ async def login(request: Request, login_data: LoginRequest):
         )
     
     # Verify password
-    # Temporarily using plain text until argon2 dependencies are installed
-    # After running: poetry lock && poetry install
-    # This will automatically switch to Argon2 hashing
-    try:
-        # Try Argon2 verification first
-        verify_result = verify_password(login_data.password, ADMIN_PASSWORD_HASH)
-        print(f"DEBUG: Argon2 verification result: {verify_result}")
-        
-        if not verify_result:
-            # Fallback to plain text for development
-            print(f"DEBUG: Checking plain text fallback")
-            if login_data.password != "admin123":
-                print("DEBUG: Plain text password mismatch")
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Incorrect username or password",
-                    headers={"WWW-Authenticate": "Bearer"},
-                )
-    except Exception as e:
-        print(f"DEBUG: Exception during password verification: {e}")
-        # If Argon2 not installed yet, use plain text
-        if login_data.password != "admin123":
-            print("DEBUG: Plain text fallback (exception) mismatch")
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Incorrect username or password",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-    
-    print("DEBUG: Login successful")
+    password_ok = _ARGON2_AVAILABLE and await _verify_admin(login_data.password)
+    logger.debug("Argon2 verification result: %s", password_ok)
+
+    if not password_ok and settings.admin_password_fallback_enabled:
+        # Development fallback until a real admin hash is configured
+        logger.debug("Checking plain text fallback")
+        password_ok = hmac.compare_digest(login_data.password.encode(), _DEV_ADMIN_PASSWORD)
+
+    if not password_ok:
+        logger.debug("Password mismatch")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect username or password",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    logger.debug("Login successful")
     # Create access token
-    access_token_expires = timedelta(minutes=settings.access_token_expire_minutes)
-    access_token = create_access_token(
-        data={"sub": login_data.username},
-        expires_delta=access_token_expires
-    )
+    access_token = _signed_token(ADMIN_USERNAME, int(time.time()) // _TOKEN_BUCKET_SECONDS)
     
-    return TokenResponse(access_token=access_token)
+    # Trusted values; skip constructor validation
+    return TokenResponse.model_construct(access_token=access_token, token_type="bearer")
 
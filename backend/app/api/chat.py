@@ -1,15 +1,22 @@
 """Message/Chat API endpoints."""
-from fastapi import APIRouter, Depends, HTTPException, Request
+import asyncio
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.agents import generate_introduction
+from app.agents import generate_introduction, generate_question
 from app.database import get_db
 from app.middleware.rate_limit import limiter, RATE_LIMIT_CHAT
-from app.schemas.message import CandidateMessageSubmit, MessageResponse
+from app.schemas.message import CandidateMessageSubmit, MessageCreate, MessageResponse
 from app.services import InterviewService, MessageService
+from app.utils.file_upload import extract_text_from_pdf as extract
 
 router = APIRouter(prefix="/chat", tags=["chat"])
 
+# Validates and serializes a whole transcript in one pydantic-core pass
+_MESSAGE_LIST_ADAPTER = TypeAdapter(list[MessageResponse])
+
 
 @router.post("/start/{token}")
 @limiter.limit(RATE_LIMIT_CHAT)
@@ -42,26 +49,18 @@ async def start_interview(
         interview = await InterviewService.start_interview(db, token)
 
         # Generate introduction
-        role_text = extract_text_from_pdf(interview.role_path) if interview.role_path else "the position"
+        role_text = (
+            await asyncio.to_thread(extract_text_from_pdf, interview.role_path)
+            if interview.role_path
+            else "the position"
+        )
         introduction = generate_introduction(
             role_description=role_text,
             target_questions=interview.target_questions,
         )
 
-        # Save introduction message
-        from app.schemas.message import MessageCreate
-        await MessageService.create_message(
-            db,
-            interview.id,
-            MessageCreate(
-                role="assistant",
-                content=introduction,
-            ),
-        )
-
         # Generate first question
-        from app.agents import generate_question
-        focus_areas = interview.match_analysis_json.get("focus_areas", ["General"])
+        focus_areas = await InterviewService.get_focus_areas(db, interview.id)
 
         first_question = await generate_question(
             focus_areas=focus_areas,
@@ -72,16 +71,22 @@ async def start_interview(
             interview_id=interview.id,
         )
 
-        # Save first question
-        await MessageService.create_message(
+        # Save introduction and first question together
+        await MessageService.create_messages(
             db,
             interview.id,
-            MessageCreate(
-                role="assistant",
-                content=first_question,
-                question_number=1,
-                difficulty_level=interview.difficulty_start,
-            ),
+            [
+                MessageCreate(
+                    role="assistant",
+                    content=introduction,
+                ),
+                MessageCreate(
+                    role="assistant",
+                    content=first_question,
+                    question_number=1,
+                    difficulty_level=interview.difficulty_start,
+                ),
+            ],
         )
 
         return {
@@ -112,7 +117,12 @@ async def get_messages(
         List of messages
     """
     messages = await MessageService.get_messages(db, interview_id)
-    return messages
+
+    # Bypass per-item response_model handling; the adapter already produces the schema
+    validated = _MESSAGE_LIST_ADAPTER.validate_python(messages, from_attributes=True)
+    return Response(
+        content=_MESSAGE_LIST_ADAPTER.dump_json(validated), media_type="application/json"
+    )
 
 
 @router.post("/{interview_id}/message")
@@ -154,7 +164,6 @@ async def send_message(
 # Helper function (should be in utils)
 def extract_text_from_pdf(file_path: str) -> str:
     """Extract text from PDF file."""
-    from app.utils.file_upload import extract_text_from_pdf as extract
     try:
         return extract(file_path)
     except Exception:
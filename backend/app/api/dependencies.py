@@ -1,13 +1,57 @@
 """Authentication dependencies for FastAPI."""
+import logging
+import time
+from typing import Optional
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
 from app.utils.auth import verify_token
 
 
+logger = logging.getLogger(__name__)
+
 # HTTP Bearer token scheme
 security = HTTPBearer()
 
+# Verified token payloads, keyed by the raw token: token -> (payload, cached_until).
+# Entries never outlive the token's own expiry.
+_TOKEN_CACHE_TTL_SECONDS = 60
+_TOKEN_CACHE_SIZE = 10_000
+_token_cache: dict[str, tuple[dict, float]] = {}
+
+
+def _verify_token_cached(token: str) -> Optional[dict]:
+    """
+    Verify a JWT, reusing the decoded payload for repeated requests.
+
+    Args:
+        token: JWT token to verify
+
+    Returns:
+        Decoded token data or None if invalid
+    """
+    now = time.time()
+    cached = _token_cache.get(token)
+    if cached is not None:
+        payload, cached_until = cached
+        if now < cached_until:
+            return payload
+        del _token_cache[token]
+
+    payload = verify_token(token)
+    if payload is not None:
+        cached_until = now + _TOKEN_CACHE_TTL_SECONDS
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            cached_until = min(cached_until, exp)
+        if len(_token_cache) >= _TOKEN_CACHE_SIZE:
+            # Evict the oldest entry
+            _token_cache.pop(next(iter(_token_cache)))
+        _token_cache[token] = (payload, cached_until)
+
+    return payload
+
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security)
@@ -25,12 +69,13 @@ async def get_current_user(
         HTTPException: If token is invalid or expired
     """
     token = credentials.credentials
-    print(f"DEBUG: Received token: {token[:10]}...")
-    payload = verify_token(token)
-    print(f"DEBUG: Token verification payload: {payload}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Received token: %s...", token[:10])
+    payload = _verify_token_cached(token)
+    logger.debug("Token verification payload: %s", payload)
     
     if payload is None:
-        print("DEBUG: Token verification failed (payload is None)")
+        logger.debug("Token verification failed (payload is None)")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication credentials",
@@ -39,7 +84,7 @@ async def get_current_user(
     
     username = payload.get("sub")
     if username is None:
-        print("DEBUG: Username not found in payload")
+        logger.debug("Username not found in payload")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication credentials",
@@ -1,10 +1,15 @@
 """Interview API endpoints."""
+import asyncio
+from concurrent.futures.process import BrokenProcessPool
+
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Request
+from sqlalchemy import Integer, cast, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies import require_admin
 from app.database import get_db
 from app.middleware.rate_limit import limiter, RATE_LIMIT_ADMIN
+from app.models.llm_usage import LLMUsage
 from app.schemas.interview import (
     InterviewCreate,
     InterviewResponse,
@@ -13,10 +18,12 @@ from app.schemas.interview import (
 from app.services import InterviewService
 from app.utils.file_upload import (
     save_upload_file,
-    extract_text_from_pdf,
+    extract_text_from_upload,
+    get_pdf_executor,
     validate_file_type,
     FileUploadError,
 )
+from app.utils.llm_cache import get_cache
 
 router = APIRouter(prefix="/interviews", tags=["interviews"])
 
@@ -63,20 +70,67 @@ async def list_interviews(
     Returns:
         List of interviews
     """
-    interviews = await InterviewService.list_interviews(db, skip=skip, limit=limit)
-
-    # Transform to list response
-    return [
-        InterviewListResponse(
-            id=interview.id,
-            status=interview.status,
-            target_questions=interview.target_questions,
-            match_score=interview.match_analysis_json.get("match_score") if interview.match_analysis_json else None,
-            interview_score=interview.report_json.get("interview_score") if interview.report_json else None,
-            created_at=interview.created_at,
+    rows = await InterviewService.list_interviews(db, skip=skip, limit=limit)
+
+    # Columns come straight from the database, skip re-validation
+    return [InterviewListResponse.model_construct(**row._mapping) for row in rows]
+
+
+# Static paths are declared before /{interview_id}, which would otherwise match them
+@router.get("/stats/costs")
+@limiter.limit(RATE_LIMIT_ADMIN)
+async def get_cost_statistics(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(require_admin),
+):
+    """
+    Get aggregate cost statistics across all interviews.
+
+    Returns:
+        Aggregate cost statistics
+    """
+    # Get aggregate statistics
+    result = await db.execute(
+        select(
+            func.sum(LLMUsage.estimated_cost).label("total_cost"),
+            func.sum(LLMUsage.total_tokens).label("total_tokens"),
+            func.count(LLMUsage.id).label("total_calls"),
+            func.sum(cast(LLMUsage.cached, Integer)).label("cache_hits"),
         )
-        for interview in interviews
-    ]
+    )
+    stats = result.one()
+
+    total_cost = float(stats.total_cost or 0)
+    total_tokens = int(stats.total_tokens or 0)
+    total_calls = int(stats.total_calls or 0)
+    cache_hits = int(stats.cache_hits or 0)
+    cache_misses = total_calls - cache_hits
+
+    return {
+        "total_cost": round(total_cost, 6),
+        "total_tokens": total_tokens,
+        "total_calls": total_calls,
+        "cache_hits": cache_hits,
+        "cache_misses": cache_misses,
+        "cache_hit_rate": cache_hits * 100 / total_calls if total_calls else 0.0,
+    }
+
+
+@router.get("/cache/stats")
+@limiter.limit(RATE_LIMIT_ADMIN)
+async def get_cache_statistics(
+    request: Request,
+    current_user: dict = Depends(require_admin),
+):
+    """
+    Get cache statistics.
+
+    Returns:
+        Cache statistics including hit rate and size
+    """
+    cache = get_cache()
+    return cache.get_stats()
 
 
 @router.get("/{interview_id}", response_model=InterviewResponse)
@@ -165,7 +219,7 @@ async def upload_documents(
         Updated interview with match analysis
 
     Raises:
-        HTTPException: If validation fails or interview not found
+        HTTPException: If validation fails, interview not found, or a PDF worker crashed
     """
     try:
         # Validate file types
@@ -177,19 +231,34 @@ async def upload_documents(
                 )
 
         # Save files
-        resume_path = await save_upload_file(resume, prefix="resume")
-        role_path = await save_upload_file(role_description, prefix="role")
-        job_path = await save_upload_file(job_offering, prefix="job")
+        saved = await asyncio.gather(
+            save_upload_file(resume, prefix="resume"),
+            save_upload_file(role_description, prefix="role"),
+            save_upload_file(job_offering, prefix="job"),
+        )
+        (resume_path, resume_pdf), (role_path, role_pdf), (job_path, job_pdf) = saved
 
         # Update interview with file paths
         interview = await InterviewService.upload_documents(
             db, interview_id, resume_path, role_path, job_path
         )
 
-        # Extract text from PDFs
-        resume_text = extract_text_from_pdf(resume_path)
-        role_text = extract_text_from_pdf(role_path)
-        job_text = extract_text_from_pdf(job_path)
+        # Extract text from the uploaded bytes in parallel worker processes
+        loop = asyncio.get_running_loop()
+        executor = get_pdf_executor()
+        try:
+            resume_text, role_text, job_text = await asyncio.gather(
+                loop.run_in_executor(executor, extract_text_from_upload, resume_path, resume_pdf),
+                loop.run_in_executor(executor, extract_text_from_upload, role_path, role_pdf),
+                loop.run_in_executor(executor, extract_text_from_upload, job_path, job_pdf),
+            )
+        except BrokenProcessPool:
+            # A worker died (e.g. killed while parsing); a broken pool rejects every
+            # later job, so drop it and let the next upload start a fresh one
+            get_pdf_executor.cache_clear()
+            raise HTTPException(
+                status_code=503, detail="PDF text extraction failed. Please try again."
+            )
 
         # Run match analysis
         interview = await InterviewService.analyze_match(
@@ -278,122 +347,55 @@ async def get_interview_costs(
     Returns:
         Cost breakdown with token usage and estimated costs
     """
-    from sqlalchemy import select, func
-    from app.models.llm_usage import LLMUsage
-
-    # Get all LLM usage for this interview
+    # Aggregate LLM usage for this interview per agent in the database
     result = await db.execute(
-        select(LLMUsage).where(LLMUsage.interview_id == interview_id)
+        select(
+            LLMUsage.agent_name,
+            func.count(LLMUsage.id).label("calls"),
+            func.sum(LLMUsage.total_tokens).label("tokens"),
+            func.sum(LLMUsage.estimated_cost).label("cost"),
+            func.sum(cast(LLMUsage.cached, Integer)).label("cached"),
+        )
+        .where(LLMUsage.interview_id == interview_id)
+        .group_by(LLMUsage.agent_name)
     )
-    usage_records = result.scalars().all()
+    agent_rows = result.all()
 
-    if not usage_records:
+    if not agent_rows:
         return {
             "interview_id": interview_id,
             "total_cost": 0.0,
             "total_tokens": 0,
             "cache_hits": 0,
             "cache_misses": 0,
+            "cache_hit_rate": 0.0,
             "by_agent": {},
         }
 
-    # Aggregate by agent
-    by_agent = {}
-    total_cost = 0.0
-    total_tokens = 0
-    cache_hits = 0
-    cache_misses = 0
-
-    for record in usage_records:
-        if record.cached:
-            cache_hits += 1
-        else:
-            cache_misses += 1
-
-        total_cost += record.estimated_cost
-        total_tokens += record.total_tokens
-
-        if record.agent_name not in by_agent:
-            by_agent[record.agent_name] = {
-                "calls": 0,
-                "tokens": 0,
-                "cost": 0.0,
-                "cached": 0,
-            }
-
-        by_agent[record.agent_name]["calls"] += 1
-        by_agent[record.agent_name]["tokens"] += record.total_tokens
-        by_agent[record.agent_name]["cost"] += record.estimated_cost
-        if record.cached:
-            by_agent[record.agent_name]["cached"] += 1
-
-    return {
-        "interview_id": interview_id,
-        "total_cost": round(total_cost, 6),
-        "total_tokens": total_tokens,
-        "cache_hits": cache_hits,
-        "cache_misses": cache_misses,
-        "cache_hit_rate": round((cache_hits / (cache_hits + cache_misses) * 100), 2) if (cache_hits + cache_misses) > 0 else 0,
-        "by_agent": by_agent,
+    by_agent = {
+        row.agent_name: {
+            "calls": row.calls,
+            "tokens": int(row.tokens),
+            "cost": float(row.cost),
+            "cached": int(row.cached),
+        }
+        for row in agent_rows
     }
 
-
-@router.get("/stats/costs")
-@limiter.limit(RATE_LIMIT_ADMIN)
-async def get_cost_statistics(
-    request: Request,
-    db: AsyncSession = Depends(get_db),
-    current_user: dict = Depends(require_admin),
-):
-    """
-    Get aggregate cost statistics across all interviews.
-
-    Returns:
-        Aggregate cost statistics
-    """
-    from sqlalchemy import select, func
-    from app.models.llm_usage import LLMUsage
-
-    # Get aggregate statistics
-    result = await db.execute(
-        select(
-            func.sum(LLMUsage.estimated_cost).label("total_cost"),
-            func.sum(LLMUsage.total_tokens).label("total_tokens"),
-            func.count(LLMUsage.id).label("total_calls"),
-            func.sum(func.cast(LLMUsage.cached, sa.Integer)).label("cache_hits"),
-        )
-    )
-    stats = result.one()
-
-    total_cost = float(stats.total_cost or 0)
-    total_tokens = int(stats.total_tokens or 0)
-    total_calls = int(stats.total_calls or 0)
-    cache_hits = int(stats.cache_hits or 0)
+    # Totals over one row per agent
+    total_cost = sum(agent["cost"] for agent in by_agent.values())
+    total_tokens = sum(agent["tokens"] for agent in by_agent.values())
+    total_calls = sum(agent["calls"] for agent in by_agent.values())
+    cache_hits = sum(agent["cached"] for agent in by_agent.values())
     cache_misses = total_calls - cache_hits
 
     return {
+        "interview_id": interview_id,
         "total_cost": round(total_cost, 6),
         "total_tokens": total_tokens,
-        "total_calls": total_calls,
         "cache_hits": cache_hits,
         "cache_misses": cache_misses,
-        "cache_hit_rate": round((cache_hits / total_calls * 100), 2) if total_calls > 0 else 0,
+        # At least one row exists here, so total_calls > 0
+        "cache_hit_rate": cache_hits * 100 / total_calls,
+        "by_agent": by_agent,
     }
-
-
-@router.get("/cache/stats")
-@limiter.limit(RATE_LIMIT_ADMIN)
-async def get_cache_statistics(
-    request: Request,
-    current_user: dict = Depends(require_admin),
-):
-    """
-    Get cache statistics.
-
-    Returns:
-        Cache statistics including hit rate and size
-    """
-    from app.utils.llm_cache import get_cache
-
-    cache = get_cache()
-    return cache.get_stats()
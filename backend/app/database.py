@@ -1,17 +1,74 @@
 """Database session management."""
 from collections.abc import AsyncGenerator
+from typing import Any
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import orjson
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base
 
 from app.config import settings
 
+
+def _json_dumps(value: Any) -> str:
+    """Serialize JSON column values with orjson (drivers expect str, not bytes)."""
+    return orjson.dumps(value).decode()
+
+
+def _pool_options(database_url: str) -> dict[str, Any]:
+    """
+    Connection pool options for the engine.
+
+    SQLite (used in development and tests) does not use a sized queue pool.
+
+    Args:
+        database_url: SQLAlchemy database URL
+
+    Returns:
+        Keyword arguments for create_async_engine
+    """
+    if database_url.startswith("sqlite"):
+        return {}
+
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": True,  # Replace connections dropped by the server
+    }
+
+
+def enable_sqlite_foreign_keys(async_engine: AsyncEngine) -> None:
+    """
+    Enforce foreign keys (including ON DELETE CASCADE) on SQLite connections.
+
+    SQLite ignores foreign key constraints unless enabled per connection;
+    PostgreSQL always enforces them.
+
+    Args:
+        async_engine: Engine whose new connections should enforce foreign keys
+    """
+    if async_engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(async_engine.sync_engine, "connect")
+    def _set_foreign_keys(dbapi_connection, _connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
 # Create async engine
 engine = create_async_engine(
     settings.database_url,
-    echo=True,  # Set to False in production
+    echo=settings.sql_echo,
     future=True,
+    json_serializer=_json_dumps,
+    json_deserializer=orjson.loads,
+    **_pool_options(settings.database_url),
 )
+enable_sqlite_foreign_keys(engine)
 
 # Create session factory
 AsyncSessionLocal = async_sessionmaker(
@@ -27,13 +84,15 @@ Base = declarative_base()
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Dependency for getting async database sessions."""
+    """
+    Dependency for getting async database sessions.
+
+    Services commit their own units of work, so read-only requests never send a
+    COMMIT. Anything left uncommitted is rolled back when the session closes.
+    """
     async with AsyncSessionLocal() as session:
         try:
             yield session
-            await session.commit()
         except Exception:
             await session.rollback()
             raise
-        finally:
-            await session.close()
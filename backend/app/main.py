@@ -1,19 +1,37 @@
 """Main FastAPI application."""
-from fastapi import FastAPI, Request
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from fastapi import APIRouter, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 
 from app.api import interviews, chat, auth
 from app.config import settings
 from app.middleware.rate_limit import limiter
+from app.utils.file_upload import shutdown_pdf_executor
+
+logging.basicConfig(level=settings.log_level.upper())
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Check configuration on startup and stop worker processes on shutdown."""
+    # Refuse to start without any way to log in as admin
+    auth.check_admin_credentials()
+    yield
+    shutdown_pdf_executor()
 
 
 app = FastAPI(
     title="AI Interviewer API",
     description="AI-powered technical interview platform",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Add rate limiting
@@ -24,24 +42,36 @@ from app.utils.state_machine import StateTransitionError
 
 @app.exception_handler(StateTransitionError)
 async def state_transition_exception_handler(request: Request, exc: StateTransitionError):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=400,
         content={"detail": str(exc)},
     )
 
-# CORS middleware
+# CORS middleware; a wildcard origin is invalid with credentials, so origins are explicit
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, specify allowed origins
+    allow_origins=settings.cors_origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
-# Include routers
-app.include_router(auth.router, prefix="/api")  # Public auth endpoints
-app.include_router(interviews.router, prefix="/api")  # Admin endpoints (protected)
-app.include_router(chat.router, prefix="/api")  # Chat endpoints (public for candidates)
+
+def include_routers(app: FastAPI, routers: list[APIRouter], prefix: str = "/api") -> None:
+    """
+    Mount API routers under a common prefix.
+
+    Args:
+        app: Application to mount on
+        routers: Routers to include, in order
+        prefix: Path prefix shared by all routers
+    """
+    for router in routers:
+        app.include_router(router, prefix=prefix)
+
+
+# Public auth endpoints, admin endpoints (protected), chat endpoints (public for candidates)
+include_routers(app, [auth.router, interviews.router, chat.router])
 
 
 @app.get("/")
@@ -1,16 +1,38 @@
 """Rate limiting configuration for API endpoints."""
 import os
+
 from slowapi import Limiter
-from slowapi.util import get_remote_address
+from starlette.requests import Request
+
+from app.config import settings
 
 
 # Check if we're in testing mode
 _testing = os.getenv("TESTING", "false").lower() == "true"
 
-# Initialize rate limiter with in-memory storage
+
+def client_host(request: Request) -> str:
+    """
+    Rate limit key: the client address, read straight from the ASGI scope.
+
+    Equivalent to slowapi's get_remote_address without building request.client.
+
+    Args:
+        request: Incoming request
+
+    Returns:
+        Client host, or 127.0.0.1 if the server did not provide one
+    """
+    client = request.scope.get("client")
+    return client[0] if client else "127.0.0.1"
+
+
+# Sliding-window limiter; storage is shared across workers when a Redis URI is set.
 # Disable rate limiting during tests
 limiter = Limiter(
-    key_func=get_remote_address,
+    key_func=client_host,
+    storage_uri=settings.rate_limit_storage_uri,
+    strategy="moving-window",
     enabled=not _testing,
 )
 
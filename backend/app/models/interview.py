@@ -2,7 +2,8 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import JSON, DateTime, Integer, String, Text
+from sqlalchemy import JSON, DateTime, Index, Integer, LargeBinary, String, Text, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -12,18 +13,37 @@ from app.utils.state_machine import InterviewStatus
 if TYPE_CHECKING:
     from app.models.message import Message
 
+# Binary JSON on PostgreSQL (no re-parsing on read, GIN-indexable); plain JSON elsewhere
+JSONDocument = JSON().with_variant(JSONB(), "postgresql")
+
 
 class Interview(Base):
     """Interview entity representing a candidate interview session."""
 
     __tablename__ = "interviews"
+    __table_args__ = (
+        # Serves status filters and listing by creation date
+        Index("ix_interviews_status_created", "status", "created_at"),
+        # Token lookups go through the fixed-size digest; only assigned interviews
+        # have one, so unassigned rows are left out of the index
+        Index(
+            "ix_interviews_token_hash",
+            "candidate_link_token_hash",
+            unique=True,
+            postgresql_where=text("candidate_link_token_hash IS NOT NULL"),
+            sqlite_where=text("candidate_link_token_hash IS NOT NULL"),
+        ),
+    )
+    # Fetch created_at/updated_at with RETURNING as part of each INSERT/UPDATE,
+    # so committed instances need no refresh round-trip
+    __mapper_args__ = {"eager_defaults": True}
 
     # Primary key
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
 
     # Status
     status: Mapped[str] = mapped_column(
-        String(20), nullable=False, default=InterviewStatus.DRAFT.value, index=True
+        String(20), nullable=False, default=InterviewStatus.DRAFT.value
     )
 
     # Document references
@@ -32,22 +52,38 @@ class Interview(Base):
     job_offering_path: Mapped[str | None] = mapped_column(String(500), nullable=True)
 
     # Match analysis (JSON)
-    match_analysis_json: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    match_analysis_json: Mapped[dict | None] = mapped_column(JSONDocument, nullable=True)
 
     # Interview configuration
     target_questions: Mapped[int] = mapped_column(Integer, nullable=False, default=8)
     difficulty_start: Mapped[int] = mapped_column(Integer, nullable=False, default=5)
 
     # Candidate access
-    candidate_link_token: Mapped[str | None] = mapped_column(
-        String(255), nullable=True, unique=True, index=True
+    candidate_link_token: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    # SHA-256 of candidate_link_token; the plain token is kept for the admin link
+    candidate_link_token_hash: Mapped[bytes | None] = mapped_column(
+        LargeBinary(32), nullable=True
     )
     token_expires_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
 
     # Final report (JSON)
-    report_json: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    report_json: Mapped[dict | None] = mapped_column(JSONDocument, nullable=True)
+
+    # Rolling "role: content" transcript, appended as messages are saved so prompts
+    # do not re-read and re-format every message on each turn
+    chat_history: Mapped[str] = mapped_column(
+        Text, nullable=False, default="", server_default=""
+    )
+    # Latest question asked and the running question count, kept with the history
+    current_question: Mapped[str | None] = mapped_column(Text, nullable=True)
+    current_question_number: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    questions_asked: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
@@ -58,11 +94,20 @@ class Interview(Base):
     )
 
     # Relationships
+    # Both child tables cascade deletes in the database (ON DELETE CASCADE), so the
+    # ORM does not load children just to delete them
     messages: Mapped[list["Message"]] = relationship(
-        "Message", back_populates="interview", cascade="all, delete-orphan"
+        "Message",
+        back_populates="interview",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        order_by="(Message.timestamp, Message.id)",  # Transcript order
     )
     llm_usage: Mapped[list["LLMUsage"]] = relationship(
-        "LLMUsage", back_populates="interview", cascade="all, delete-orphan"
+        "LLMUsage",
+        back_populates="interview",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     def __repr__(self) -> str:
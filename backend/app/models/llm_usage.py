@@ -1,6 +1,6 @@
 """LLM usage tracking model."""
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -10,9 +10,19 @@ class LLMUsage(Base):
     """Track LLM API usage and costs."""
 
     __tablename__ = "llm_usage"
+    __table_args__ = (
+        # Serves per-interview cost breakdowns; on Postgres the included columns
+        # let the GROUP BY agent_name aggregation run as an index-only scan
+        Index(
+            "ix_llm_usage_interview_id_agent",
+            "interview_id",
+            "agent_name",
+            postgresql_include=["estimated_cost", "total_tokens", "cached"],
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    interview_id = Column(Integer, ForeignKey("interviews.id"), nullable=False, index=True)
+    interview_id = Column(Integer, ForeignKey("interviews.id", ondelete="CASCADE"), nullable=False)
     agent_name = Column(String, nullable=False, index=True)
     model = Column(String, nullable=False)
     prompt_tokens = Column(Integer, nullable=False)
@@ -2,7 +2,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, Float, ForeignKey, Integer, String, Text, JSON
+from sqlalchemy import DateTime, Enum, Float, ForeignKey, Index, Integer, Text, JSON, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -11,24 +11,41 @@ from app.database import Base
 if TYPE_CHECKING:
     from app.models.interview import Interview
 
+MESSAGE_ROLES = ("assistant", "candidate")
+
 
 class Message(Base):
     """Message entity representing a single message in the interview transcript."""
 
     __tablename__ = "messages"
+    __table_args__ = (
+        # Serves interview-scoped lookups and transcript ordering
+        Index("ix_messages_interview_timestamp", "interview_id", "timestamp"),
+        # Serves per-question score lookups for report generation
+        Index(
+            "ix_messages_interview_qnum",
+            "interview_id",
+            "question_number",
+            postgresql_where=text("question_number IS NOT NULL"),
+            sqlite_where=text("question_number IS NOT NULL"),
+        ),
+    )
+    # Fetch the server-side timestamp with RETURNING as part of the INSERT
+    __mapper_args__ = {"eager_defaults": True}
 
     # Primary key
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
 
     # Foreign key
     interview_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("interviews.id", ondelete="CASCADE"), nullable=False, index=True
+        Integer, ForeignKey("interviews.id", ondelete="CASCADE"), nullable=False
     )
 
     # Message metadata
+    # Native enum on PostgreSQL (4 bytes per row); VARCHAR elsewhere. Values stay str.
     role: Mapped[str] = mapped_column(
-        String(20), nullable=False
-    )  # 'assistant' or 'candidate'
+        Enum(*MESSAGE_ROLES, name="message_role"), nullable=False
+    )
     content: Mapped[str] = mapped_column(Text, nullable=False)
     timestamp: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
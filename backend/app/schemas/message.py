@@ -1,5 +1,6 @@
 """Pydantic schemas for messages."""
 from datetime import datetime
+from typing import Literal
 
 from pydantic import BaseModel, Field, ConfigDict
 
@@ -22,11 +23,19 @@ class AnswerEvaluation(BaseModel):
     followup_hint: str | None = Field(None, description="Idea for the next question")
 
 
+class AnswerEvaluationBatch(BaseModel):
+    """Batch of answer evaluations, in the same order as the submitted answers."""
+
+    evaluations: list[AnswerEvaluation] = Field(
+        ..., description="One evaluation per question/answer pair, in order"
+    )
+
+
 # Message CRUD schemas
 class MessageCreate(BaseModel):
     """Schema for creating a new message."""
 
-    role: str = Field(..., description="'assistant' or 'candidate'")
+    role: Literal["assistant", "candidate"] = Field(..., description="Message author")
     content: str = Field(..., min_length=1)
     question_number: int | None = None
     difficulty_level: float | None = None
@@ -47,7 +56,7 @@ class MessageResponse(BaseModel):
     difficulty_level: float | None = None
     answer_quality_score: int | None = None
     cheat_certainty: float | None = None
-    telemetry: dict | None = None
+    telemetry: Telemetry | None = None
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -1,16 +1,73 @@
 """Interview service - business logic for interview operations."""
 import secrets
-from datetime import datetime, timedelta
+import time
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import Row, bindparam, delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 
-from app.agents import analyze_documents, generate_report
+from app.agents import analyze_documents_async, generate_report
 from app.models import Interview, Message
 from app.schemas.interview import InterviewCreate, MatchAnalysis
+from app.utils.auth import hash_link_token
 from app.utils.state_machine import InterviewStatus, InterviewStateMachine
 
+# Transcript speaker labels, looked up instead of upper-casing every row
+_ROLE_LABELS = {"assistant": "ASSISTANT", "candidate": "CANDIDATE"}
+
+# Status strings resolved once instead of through the enum on every check
+_DRAFT = InterviewStatus.DRAFT.value
+
+# Interview ids resolved from candidate tokens, keyed by token digest:
+# digest -> (interview_id, cached_until). Entries never outlive the token's expiry.
+_TOKEN_CACHE_TTL_SECONDS = 60
+_TOKEN_CACHE_SIZE = 10_000
+_token_cache: dict[bytes, tuple[int, float]] = {}
+
+# Hot lookups are built once at import; only the bound parameters change per call,
+# so requests skip statement construction and reuse the compiled SQL cache entry.
+# Primary-key lookups use db.get, which checks the session identity map first.
+_INTERVIEW_BY_TOKEN = select(Interview).where(
+    Interview.candidate_link_token_hash == bindparam("token_hash")
+)
+_INTERVIEW_LIST = (
+    select(
+        Interview.id,
+        Interview.status,
+        Interview.target_questions,
+        Interview.match_analysis_json["match_score"].as_integer().label("match_score"),
+        Interview.report_json["interview_score"].as_integer().label("interview_score"),
+        Interview.created_at,
+    )
+    .order_by(Interview.created_at.desc())
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+
+
+def _cache_token(token_hash: bytes, interview: Interview) -> None:
+    """
+    Remember which interview a token digest resolves to.
+
+    Args:
+        token_hash: Digest of the candidate link token
+        interview: Interview the token belongs to
+    """
+    cached_until = time.time() + _TOKEN_CACHE_TTL_SECONDS
+    expires_at = interview.token_expires_at
+    if expires_at is not None:
+        if expires_at.tzinfo is None:
+            # SQLite returns naive datetimes; stored values are UTC
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        cached_until = min(cached_until, expires_at.timestamp())
+
+    if len(_token_cache) >= _TOKEN_CACHE_SIZE:
+        # Evict the oldest entry
+        _token_cache.pop(next(iter(_token_cache)))
+    _token_cache[token_hash] = (interview.id, cached_until)
+
 
 class InterviewService:
     """Service for interview business logic."""
@@ -30,14 +87,13 @@ class InterviewService:
             Created interview
         """
         interview = Interview(
-            status=InterviewStatus.DRAFT.value,
+            status=_DRAFT,
             target_questions=interview_data.target_questions,
             difficulty_start=interview_data.difficulty_start,
         )
 
         db.add(interview)
         await db.commit()
-        await db.refresh(interview)
 
         return interview
 
@@ -66,13 +122,12 @@ class InterviewService:
             ValueError: If interview not found or not in DRAFT status
         """
         # Get interview
-        result = await db.execute(select(Interview).where(Interview.id == interview_id))
-        interview = result.scalar_one_or_none()
+        interview = await db.get(Interview, interview_id)
 
         if not interview:
             raise ValueError(f"Interview {interview_id} not found")
 
-        if interview.status != InterviewStatus.DRAFT.value:
+        if interview.status != _DRAFT:
             raise ValueError(f"Interview must be in DRAFT status to upload documents")
 
         # Update document paths
@@ -81,7 +136,6 @@ class InterviewService:
         interview.job_offering_path = job_offering_path
 
         await db.commit()
-        await db.refresh(interview)
 
         return interview
 
@@ -110,15 +164,15 @@ class InterviewService:
             ValueError: If interview not found or invalid state
         """
         # Get interview
-        result = await db.execute(select(Interview).where(Interview.id == interview_id))
-        interview = result.scalar_one_or_none()
+        interview = await db.get(Interview, interview_id)
 
         if not interview:
             raise ValueError(f"Interview {interview_id} not found")
 
-        # Run document analysis agent
-        match_analysis: MatchAnalysis = analyze_documents(
-            resume_text, role_text, job_offering_text
+        # Run document analysis agent on the async LLM client, so other requests
+        # keep being served while it waits on the provider
+        match_analysis: MatchAnalysis = await analyze_documents_async(
+            resume_text, role_text, job_offering_text, db=db, interview_id=interview_id
         )
 
         # Update interview with match analysis
@@ -128,7 +182,6 @@ class InterviewService:
         InterviewStateMachine.transition(interview, InterviewStatus.READY)
 
         await db.commit()
-        await db.refresh(interview)
 
         return interview
 
@@ -148,22 +201,25 @@ class InterviewService:
             ValueError: If interview not found or invalid state
         """
         # Get interview
-        result = await db.execute(select(Interview).where(Interview.id == interview_id))
-        interview = result.scalar_one_or_none()
+        interview = await db.get(Interview, interview_id)
 
         if not interview:
             raise ValueError(f"Interview {interview_id} not found")
 
+        # Forget the previous token, if any, before issuing a new one
+        if interview.candidate_link_token_hash is not None:
+            _token_cache.pop(interview.candidate_link_token_hash, None)
+
         # Generate secure token
         interview.candidate_link_token = secrets.token_urlsafe(32)
-        # Token expires in 48 hours
-        interview.token_expires_at = datetime.utcnow() + timedelta(hours=48)
+        interview.candidate_link_token_hash = hash_link_token(interview.candidate_link_token)
+        # Token expires in 48 hours (timezone-aware UTC, matching the column type)
+        interview.token_expires_at = datetime.now(timezone.utc) + timedelta(hours=48)
 
         # Transition to ASSIGNED status
         InterviewStateMachine.transition(interview, InterviewStatus.ASSIGNED)
 
         await db.commit()
-        await db.refresh(interview)
 
         return interview
 
@@ -177,32 +233,58 @@ class InterviewService:
             token: Candidate link token
 
         Returns:
-            Interview in IN_PROGRESS status
+            Interview in IN_PROGRESS status, with match_analysis_json and report_json
+            deferred (use get_focus_areas for the analysis focus areas)
 
         Raises:
             ValueError: If token invalid, expired, or interview already started
         """
-        # Find interview by token
+        # Find interview by token and let the database compare the expiry against
+        # UTC now; the JSON documents are not needed to start
+        now = datetime.now(timezone.utc)
         result = await db.execute(
-            select(Interview).where(Interview.candidate_link_token == token)
+            select(Interview, (Interview.token_expires_at < now).label("token_expired"))
+            .options(defer(Interview.match_analysis_json), defer(Interview.report_json))
+            .where(Interview.candidate_link_token_hash == hash_link_token(token))
         )
-        interview = result.scalar_one_or_none()
-        
-        if not interview:
+        row = result.one_or_none()
+
+        if row is None:
             raise ValueError("Invalid interview token")
-        
-        # Check if token has expired
-        if interview.token_expires_at and interview.token_expires_at < datetime.now(interview.token_expires_at.tzinfo):
+
+        interview, token_expired = row
+        if token_expired:
             raise ValueError("Interview link has expired. Please request a new link.")
 
         # Transition to IN_PROGRESS
         InterviewStateMachine.transition(interview, InterviewStatus.IN_PROGRESS)
 
         await db.commit()
-        await db.refresh(interview)
 
         return interview
 
+    @staticmethod
+    async def get_focus_areas(db: AsyncSession, interview_id: int) -> list[str]:
+        """
+        Get the focus areas from an interview's match analysis.
+
+        Only the focus_areas key is selected, so the rest of the analysis
+        document is never transferred or decoded.
+
+        Args:
+            db: Database session
+            interview_id: Interview ID
+
+        Returns:
+            Focus areas, or ["General"] if the interview has none
+        """
+        result = await db.execute(
+            select(Interview.match_analysis_json["focus_areas"]).where(
+                Interview.id == interview_id
+            )
+        )
+        return result.scalar_one_or_none() or ["General"]
+
     @staticmethod
     async def get_interview(db: AsyncSession, interview_id: int) -> Optional[Interview]:
         """
@@ -215,8 +297,7 @@ class InterviewService:
         Returns:
             Interview or None if not found
         """
-        result = await db.execute(select(Interview).where(Interview.id == interview_id))
-        return result.scalar_one_or_none()
+        return await db.get(Interview, interview_id)
 
     @staticmethod
     async def get_interview_by_token(db: AsyncSession, token: str) -> Optional[Interview]:
@@ -230,17 +311,34 @@ class InterviewService:
         Returns:
             Interview or None if not found
         """
-        result = await db.execute(
-            select(Interview).where(Interview.candidate_link_token == token)
-        )
-        return result.scalar_one_or_none()
+        token_hash = hash_link_token(token)
+
+        # Repeat lookups resolve the id from the cache and load by primary key,
+        # which hits the session identity map when the interview is already loaded
+        cached = _token_cache.get(token_hash)
+        if cached is not None:
+            interview_id, cached_until = cached
+            if time.time() < cached_until:
+                interview = await db.get(Interview, interview_id)
+                if interview is not None and interview.candidate_link_token_hash == token_hash:
+                    return interview
+            _token_cache.pop(token_hash, None)
+
+        result = await db.execute(_INTERVIEW_BY_TOKEN, {"token_hash": token_hash})
+        interview = result.scalar_one_or_none()
+        if interview is not None:
+            _cache_token(token_hash, interview)
+        return interview
 
     @staticmethod
     async def list_interviews(
         db: AsyncSession, skip: int = 0, limit: int = 100
-    ) -> list[Interview]:
+    ) -> list[Row]:
         """
-        List all interviews with pagination.
+        List interview summaries with pagination.
+
+        Only the list columns are selected; the scores are extracted from the JSON
+        documents in SQL so the documents themselves are never loaded.
 
         Args:
             db: Database session
@@ -248,12 +346,11 @@ class InterviewService:
             limit: Maximum number of records to return
 
         Returns:
-            List of interviews
+            Rows with id, status, target_questions, match_score, interview_score
+            and created_at
         """
-        result = await db.execute(
-            select(Interview).order_by(Interview.created_at.desc()).offset(skip).limit(limit)
-        )
-        return list(result.scalars().all())
+        result = await db.execute(_INTERVIEW_LIST, {"skip": skip, "limit": limit})
+        return list(result.all())
 
     @staticmethod
     async def complete_interview(db: AsyncSession, interview_id: int) -> Interview:
@@ -270,43 +367,42 @@ class InterviewService:
         Raises:
             ValueError: If interview not found or invalid state
         """
-        # Get interview with messages
-        result = await db.execute(
-            select(Interview).where(Interview.id == interview_id)
-        )
-        interview = result.scalar_one_or_none()
+        # Get interview
+        interview = await db.get(Interview, interview_id)
 
         if not interview:
             raise ValueError(f"Interview {interview_id} not found")
 
-        # Get all messages
+        # Fetch only the columns the report needs, in transcript order; the paste
+        # flag is extracted from the telemetry JSON by the database
         messages_result = await db.execute(
-            select(Message)
+            select(
+                Message.role,
+                Message.content,
+                Message.question_number,
+                Message.answer_quality_score,
+                Message.telemetry["paste_detected"].as_boolean().label("paste_detected"),
+            )
             .where(Message.interview_id == interview_id)
-            .order_by(Message.timestamp)
+            .order_by(Message.timestamp, Message.id)
         )
-        messages = list(messages_result.scalars().all())
+        rows = messages_result.all()
 
-        # Build transcript
         transcript = "\n\n".join(
-            [f"{msg.role.upper()}: {msg.content}" for msg in messages]
+            f"{_ROLE_LABELS.get(row.role) or row.role.upper()}: {row.content}" for row in rows
         )
 
-        # Collect question scores
-        question_scores = []
-        for msg in messages:
-            if msg.role == "candidate" and msg.answer_quality_score:
-                question_scores.append({
-                    "score": msg.answer_quality_score,
-                    "rationale": f"Question {msg.question_number}",
-                })
-
-        # Build telemetry summary
-        paste_count = sum(
-            1 for msg in messages
-            if msg.telemetry and msg.telemetry.get("paste_detected")
-        )
-        telemetry_summary = f"Total messages: {len(messages)}, Paste events: {paste_count}"
+        question_scores = [
+            {
+                "score": row.answer_quality_score,
+                "rationale": f"Question {row.question_number}",
+            }
+            for row in rows
+            if row.role == "candidate" and row.answer_quality_score
+        ]
+
+        paste_count = sum(1 for row in rows if row.paste_detected)
+        telemetry_summary = f"Total messages: {len(rows)}, Paste events: {paste_count}"
 
         # Generate report
         final_report = await generate_report(
@@ -325,7 +421,6 @@ class InterviewService:
         InterviewStateMachine.transition(interview, InterviewStatus.COMPLETED)
 
         await db.commit()
-        await db.refresh(interview)
 
         return interview
 
@@ -341,13 +436,11 @@ class InterviewService:
         Returns:
             True if deleted, False if not found
         """
-        result = await db.execute(select(Interview).where(Interview.id == interview_id))
-        interview = result.scalar_one_or_none()
-
-        if not interview:
-            return False
-
-        await db.delete(interview)
+        # Messages and usage rows go with it via ON DELETE CASCADE
+        result = await db.execute(
+            delete(Interview).where(Interview.id == interview_id).returning(Interview.id)
+        )
+        deleted_id = result.scalar_one_or_none()
         await db.commit()
 
-        return True
+        return deleted_id is not None
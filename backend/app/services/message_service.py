@@ -1,8 +1,9 @@
 """Message service - business logic for message operations."""
+import asyncio
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.agents import (
@@ -15,6 +16,29 @@ from app.models import Interview, Message
 from app.schemas.message import CandidateMessageSubmit, MessageCreate
 from app.utils.state_machine import InterviewStatus
 
+# Status string resolved once instead of through the enum on every message
+_IN_PROGRESS = InterviewStatus.IN_PROGRESS.value
+
+# Integrity is only assessed for answers long enough to carry a signal, and a fast
+# response only counts as suspicious below this time
+INTEGRITY_MIN_WORDS = 15
+INTEGRITY_FAST_RESPONSE_MS = 5000
+
+# Assistant replies that do not come from an agent
+INTERVIEW_COMPLETE_MESSAGE = (
+    "Thank you for completing the interview! Your responses have been recorded "
+    "and will be reviewed by our team."
+)
+_CLARIFICATION_TEMPLATE = (
+    "Let me clarify the question: {question}\n\nPlease provide your answer when you're ready."
+).format
+_REDIRECT_TEMPLATE = "Let's stay focused on the current question: {question}".format
+
+
+async def _no_result() -> None:
+    """Placeholder for an agent call that is skipped in an asyncio.gather."""
+    return None
+
 
 class MessageService:
     """Service for message business logic."""
@@ -36,26 +60,42 @@ class MessageService:
         result = await db.execute(
             select(Message)
             .where(Message.interview_id == interview_id)
-            .order_by(Message.timestamp)
+            .order_by(Message.timestamp, Message.id)
         )
         return list(result.scalars().all())
 
     @staticmethod
-    async def create_message(
-        db: AsyncSession, interview_id: int, message_data: MessageCreate
-    ) -> Message:
+    async def get_candidate_answers(db: AsyncSession, interview_id: int) -> list[str]:
         """
-        Create a new message.
+        Get the content of the candidate's messages for an interview.
 
         Args:
             db: Database session
             interview_id: Interview ID
+
+        Returns:
+            Candidate message contents ordered by timestamp
+        """
+        result = await db.execute(
+            select(Message.content)
+            .where(Message.interview_id == interview_id, Message.role == "candidate")
+            .order_by(Message.timestamp, Message.id)
+        )
+        return list(result.scalars().all())
+
+    @staticmethod
+    def _build_message(interview_id: int, message_data: MessageCreate) -> Message:
+        """
+        Build a Message entity from message data.
+
+        Args:
+            interview_id: Interview ID
             message_data: Message data
 
         Returns:
-            Created message
+            Unsaved message
         """
-        message = Message(
+        return Message(
             interview_id=interview_id,
             role=message_data.role,
             content=message_data.content,
@@ -63,15 +103,102 @@ class MessageService:
             difficulty_level=message_data.difficulty_level,
             answer_quality_score=message_data.answer_quality_score,
             cheat_certainty=message_data.cheat_certainty,
-            telemetry=message_data.telemetry.model_dump() if message_data.telemetry else None,
+            # Defaults are implied on read, so only non-default fields are stored
+            telemetry=(
+                message_data.telemetry.model_dump(exclude_defaults=True) or None
+                if message_data.telemetry
+                else None
+            ),
         )
 
+    @staticmethod
+    async def _update_transcript_state(
+        db: AsyncSession, interview_id: int, messages_data: list[MessageCreate]
+    ) -> None:
+        """
+        Append messages to the interview's chat history and current-question state.
+
+        Runs in the caller's transaction; the database updates in place, and an
+        interview already loaded in the session is updated to match.
+
+        Args:
+            db: Database session
+            interview_id: Interview ID
+            messages_data: Messages being saved, in transcript order
+        """
+        lines = "".join(f"{m.role}: {m.content}\n" for m in messages_data)
+        values = {"chat_history": Interview.chat_history + lines}
+
+        questions = [
+            m for m in messages_data if m.role == "assistant" and m.question_number
+        ]
+        if questions:
+            values["current_question"] = questions[-1].content
+            values["current_question_number"] = questions[-1].question_number
+            values["questions_asked"] = Interview.questions_asked + len(questions)
+
+        # RETURNING the row refreshes an interview already loaded in the session,
+        # including the onupdate updated_at that the UPDATE would otherwise expire
+        await db.execute(
+            update(Interview)
+            .where(Interview.id == interview_id)
+            .values(**values)
+            .returning(Interview)
+            .execution_options(populate_existing=True)
+        )
+
+    @staticmethod
+    async def create_message(
+        db: AsyncSession, interview_id: int, message_data: MessageCreate
+    ) -> Message:
+        """
+        Create a new message.
+
+        Args:
+            db: Database session
+            interview_id: Interview ID
+            message_data: Message data
+
+        Returns:
+            Created message
+        """
+        message = MessageService._build_message(interview_id, message_data)
+
         db.add(message)
+        await MessageService._update_transcript_state(db, interview_id, [message_data])
         await db.commit()
-        await db.refresh(message)
 
         return message
 
+    @staticmethod
+    async def create_messages(
+        db: AsyncSession, interview_id: int, messages_data: list[MessageCreate]
+    ) -> list[Message]:
+        """
+        Create several messages in a single multi-row INSERT and commit.
+
+        Messages are inserted in list order, so their ids preserve transcript order
+        even when they share a timestamp.
+
+        Args:
+            db: Database session
+            interview_id: Interview ID
+            messages_data: Messages to create, in transcript order
+
+        Returns:
+            Created messages
+        """
+        messages = [
+            MessageService._build_message(interview_id, message_data)
+            for message_data in messages_data
+        ]
+
+        db.add_all(messages)
+        await MessageService._update_transcript_state(db, interview_id, messages_data)
+        await db.commit()
+
+        return messages
+
     @staticmethod
     async def process_candidate_message(
         db: AsyncSession, interview_id: int, candidate_message: CandidateMessageSubmit
@@ -96,27 +223,17 @@ class MessageService:
         Raises:
             ValueError: If interview not found or not in progress
         """
-        # Get interview
-        result = await db.execute(select(Interview).where(Interview.id == interview_id))
-        interview = result.scalar_one_or_none()
+        # Get interview; the current question and count are kept on the row
+        interview = await db.get(Interview, interview_id)
 
         if not interview:
             raise ValueError(f"Interview {interview_id} not found")
 
-        if interview.status != InterviewStatus.IN_PROGRESS.value:
+        if interview.status != _IN_PROGRESS:
             raise ValueError("Interview is not in progress")
 
-        # Get messages to find current question
-        messages = await MessageService.get_messages(db, interview_id)
-
-        # Find the last assistant question
-        last_question = None
-        question_number = 0
-        for msg in reversed(messages):
-            if msg.role == "assistant" and msg.question_number:
-                last_question = msg.content
-                question_number = msg.question_number
-                break
+        last_question = interview.current_question
+        question_number = interview.current_question_number
 
         if not last_question:
             raise ValueError("No current question found")
@@ -131,89 +248,106 @@ class MessageService:
 
         # Handle based on classification
         if classification.type == "Answer":
-            # Evaluate the answer
-            evaluation = await evaluate_answer(
+            # Evaluate the answer, assess integrity when telemetry warrants it, and
+            # generate the next question unless this was the last one. The LLM calls
+            # are independent (the next question does not depend on the score), so
+            # they run concurrently.
+            telemetry = candidate_message.telemetry
+            fast_response = (
+                telemetry.response_time_ms is not None
+                and telemetry.response_time_ms < INTEGRITY_FAST_RESPONSE_MS
+            )
+            check_integrity = (telemetry.paste_detected or fast_response) and len(
+                candidate_message.content.split()
+            ) >= INTEGRITY_MIN_WORDS
+            questions_asked = interview.questions_asked
+            interview_complete = questions_asked >= interview.target_questions
+
+            # Previous answers are only needed for the integrity assessment. Fetch them
+            # before the gather: the session cannot run queries concurrently.
+            if check_integrity:
+                previous_answers = await MessageService.get_candidate_answers(db, interview_id)
+                # Speed alone is judged against the candidate's earlier style; with no
+                # earlier answers there is nothing to compare
+                if not previous_answers and not telemetry.paste_detected:
+                    check_integrity = False
+
+            evaluation_task = evaluate_answer(
                 last_question,
                 candidate_message.content,
                 db=db,
                 interview_id=interview_id
             )
-
-            # Optional: Assess integrity
-            previous_answers = [
-                msg.content for msg in messages
-                if msg.role == "candidate"
-            ]
-            integrity = None
-            if candidate_message.telemetry.paste_detected or candidate_message.telemetry.response_time_ms < 5000:
-                integrity = assess_integrity(
+            integrity_task = (
+                assess_integrity(
                     last_question,
                     candidate_message.content,
-                    candidate_message.telemetry.response_time_ms or 0,
-                    candidate_message.telemetry.paste_detected,
+                    telemetry.response_time_ms or 0,
+                    telemetry.paste_detected,
                     previous_answers,
                 )
-
-            # Save candidate message with evaluation
-            await MessageService.create_message(
-                db,
-                interview_id,
-                MessageCreate(
-                    role="candidate",
-                    content=candidate_message.content,
-                    question_number=question_number,
+                if check_integrity
+                else _no_result()
+            )
+            question_task = (
+                generate_question(
+                    focus_areas=interview.match_analysis_json.get("focus_areas", []),
                     difficulty_level=interview.difficulty_start,
-                    answer_quality_score=evaluation.score,
-                    cheat_certainty=integrity.cheat_certainty if integrity else None,
-                    telemetry=candidate_message.telemetry,
-                ),
+                    chat_history=interview.chat_history.rstrip("\n"),
+                    questions_asked=questions_asked,
+                    db=db,
+                    interview_id=interview_id,
+                )
+                if not interview_complete
+                else _no_result()
+            )
+            evaluation, integrity, next_question = await asyncio.gather(
+                evaluation_task, integrity_task, question_task
             )
 
-            # Check if we've reached target questions
-            questions_asked = len([m for m in messages if m.role == "assistant" and m.question_number])
-
-            if questions_asked >= interview.target_questions:
-                # Interview complete
-                assistant_response = "Thank you for completing the interview! Your responses have been recorded and will be reviewed by our team."
+            candidate_reply = MessageCreate(
+                role="candidate",
+                content=candidate_message.content,
+                question_number=question_number,
+                difficulty_level=interview.difficulty_start,
+                answer_quality_score=evaluation.score,
+                cheat_certainty=integrity.cheat_certainty if integrity else None,
+                telemetry=candidate_message.telemetry,
+            )
 
-                await MessageService.create_message(
+            if interview_complete:
+                # Save the answer and the closing message together
+                await MessageService.create_messages(
                     db,
                     interview_id,
-                    MessageCreate(
-                        role="assistant",
-                        content=assistant_response,
-                    ),
+                    [
+                        candidate_reply,
+                        MessageCreate(
+                            role="assistant",
+                            content=INTERVIEW_COMPLETE_MESSAGE,
+                        ),
+                    ],
                 )
 
                 return {
-                    "response": assistant_response,
+                    "response": INTERVIEW_COMPLETE_MESSAGE,
                     "interview_complete": True,
                     "evaluation": evaluation.model_dump(),
                 }
 
-            # Generate next question
-            focus_areas = interview.match_analysis_json.get("focus_areas", [])
-            chat_history = "\n".join([f"{m.role}: {m.content}" for m in messages])
-
-            next_question = await generate_question(
-                focus_areas=focus_areas,
-                difficulty_level=interview.difficulty_start,
-                chat_history=chat_history,
-                questions_asked=questions_asked,
-                db=db,
-                interview_id=interview_id,
-            )
-
-            # Save next question
-            await MessageService.create_message(
+            # Save the answer and the next question together
+            await MessageService.create_messages(
                 db,
                 interview_id,
-                MessageCreate(
-                    role="assistant",
-                    content=next_question,
-                    question_number=question_number + 1,
-                    difficulty_level=interview.difficulty_start,
-                ),
+                [
+                    candidate_reply,
+                    MessageCreate(
+                        role="assistant",
+                        content=next_question,
+                        question_number=question_number + 1,
+                        difficulty_level=interview.difficulty_start,
+                    ),
+                ],
             )
 
             return {
@@ -225,25 +359,22 @@ class MessageService:
 
         elif classification.type == "Clarification":
             # Provide clarification (simple response for now)
-            clarification_response = f"Let me clarify the question: {last_question}\n\nPlease provide your answer when you're ready."
-
-            await MessageService.create_message(
-                db,
-                interview_id,
-                MessageCreate(
-                    role="candidate",
-                    content=candidate_message.content,
-                    telemetry=candidate_message.telemetry,
-                ),
-            )
+            clarification_response = _CLARIFICATION_TEMPLATE(question=last_question)
 
-            await MessageService.create_message(
+            await MessageService.create_messages(
                 db,
                 interview_id,
-                MessageCreate(
-                    role="assistant",
-                    content=clarification_response,
-                ),
+                [
+                    MessageCreate(
+                        role="candidate",
+                        content=candidate_message.content,
+                        telemetry=candidate_message.telemetry,
+                    ),
+                    MessageCreate(
+                        role="assistant",
+                        content=clarification_response,
+                    ),
+                ],
             )
 
             return {
@@ -254,25 +385,22 @@ class MessageService:
 
         else:  # OffTopic
             # Redirect to current question
-            redirect_response = f"Let's stay focused on the current question: {last_question}"
+            redirect_response = _REDIRECT_TEMPLATE(question=last_question)
 
-            await MessageService.create_message(
+            await MessageService.create_messages(
                 db,
                 interview_id,
-                MessageCreate(
-                    role="candidate",
-                    content=candidate_message.content,
-                    telemetry=candidate_message.telemetry,
-                ),
-            )
-
-            await MessageService.create_message(
-                db,
-                interview_id,
-                MessageCreate(
-                    role="assistant",
-                    content=redirect_response,
-                ),
+                [
+                    MessageCreate(
+                        role="candidate",
+                        content=candidate_message.content,
+                        telemetry=candidate_message.telemetry,
+                    ),
+                    MessageCreate(
+                        role="assistant",
+                        content=redirect_response,
+                    ),
+                ],
             )
 
             return {
@@ -1,4 +1,5 @@
 """Authentication utilities for JWT tokens."""
+import hashlib
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -9,7 +10,13 @@ from app.config import settings
 
 
 # Password hashing with Argon2 (modern, secure, no length limits)
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["argon2"],
+    deprecated="auto",
+    argon2__memory_cost=settings.argon2_memory_kib,
+    argon2__rounds=settings.argon2_time_cost,
+    argon2__parallelism=settings.argon2_parallelism,
+)
 
 # JWT settings
 SECRET_KEY = settings.SECRET_KEY
@@ -48,6 +55,19 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+def hash_link_token(token: str) -> bytes:
+    """
+    Digest a candidate link token for storage and lookup.
+
+    Args:
+        token: Plain candidate link token
+
+    Returns:
+        32-byte SHA-256 digest of the token
+    """
+    return hashlib.sha256(token.encode()).digest()
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """
     Create a JWT access token.
@@ -1,4 +1,5 @@
 """Cost tracking utility for LLM API usage."""
+from functools import lru_cache
 from typing import Dict, Optional
 import tiktoken
 
@@ -15,6 +16,23 @@ PRICING = {
 }
 
 
+@lru_cache(maxsize=None)
+def _get_encoding(model: str) -> tiktoken.Encoding:
+    """
+    Resolve the tiktoken encoding for a model once per process.
+
+    Args:
+        model: OpenAI model name
+
+    Returns:
+        The model's encoding, or cl100k_base for models tiktoken does not know
+    """
+    try:
+        return tiktoken.encoding_for_model(model)
+    except Exception:
+        return tiktoken.get_encoding("cl100k_base")
+
+
 class CostTracker:
     """Track LLM API costs and token usage."""
 
@@ -38,13 +56,7 @@ class CostTracker:
 
         # For OpenAI models, use tiktoken
         if model.startswith("gpt"):
-            try:
-                encoding = tiktoken.encoding_for_model(model)
-                return len(encoding.encode(text))
-            except Exception:
-                # Fallback to cl100k_base encoding
-                encoding = tiktoken.get_encoding("cl100k_base")
-                return len(encoding.encode(text))
+            return len(_get_encoding(model).encode(text))
 
         # For Gemini models, estimate based on characters
         # Gemini uses approximately 1 token per 4 characters
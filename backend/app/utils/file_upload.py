@@ -1,6 +1,11 @@
 """File upload utilities for handling document uploads."""
+import asyncio
+import io
 import os
 import hashlib
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import BinaryIO
 
@@ -10,6 +15,10 @@ from PyPDF2 import PdfReader
 from app.config import settings
 
 
+# Uploads are read, hashed and written in chunks of this size
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+
 class FileUploadError(Exception):
     """Error during file upload."""
 
@@ -41,7 +50,7 @@ def generate_file_hash(file_content: bytes) -> str:
     return hashlib.sha256(file_content).hexdigest()
 
 
-async def save_upload_file(upload_file: UploadFile, prefix: str = "") -> str:
+async def save_upload_file(upload_file: UploadFile, prefix: str = "") -> tuple[str, bytes]:
     """
     Save uploaded file to disk.
 
@@ -50,39 +59,132 @@ async def save_upload_file(upload_file: UploadFile, prefix: str = "") -> str:
         prefix: Optional prefix for filename (e.g., 'resume', 'role')
 
     Returns:
-        Relative path to saved file
+        Tuple of (absolute path to saved file, file content), so callers can
+        process the content without reading the file back from disk
 
     Raises:
         FileUploadError: If file save fails
     """
+    temp_path = None
     try:
-        # Read file content
-        content = await upload_file.read()
+        upload_dir = ensure_upload_directory()
+        fd, temp_path = tempfile.mkstemp(dir=upload_dir, suffix=".part")
+
+        # Hash and write each chunk in one pass; the name depends on the hash, so the
+        # file is written under a temporary name and renamed once complete. Writes run
+        # in a worker thread so concurrent uploads do not block the event loop.
+        hasher = hashlib.sha256()
+        chunks = []
+        with os.fdopen(fd, "wb") as f:
+            while chunk := await upload_file.read(UPLOAD_CHUNK_SIZE):
+                hasher.update(chunk)
+                await asyncio.to_thread(f.write, chunk)
+                chunks.append(chunk)
 
         # Generate unique filename using hash
-        file_hash = generate_file_hash(content)
+        file_hash = hasher.hexdigest()
         extension = Path(upload_file.filename or "document.pdf").suffix
         filename = f"{prefix}_{file_hash}{extension}" if prefix else f"{file_hash}{extension}"
 
-        # Ensure upload directory exists
-        upload_dir = ensure_upload_directory()
-
-        # Save file
         file_path = upload_dir / filename
-        with open(file_path, "wb") as f:
-            f.write(content)
+        os.replace(temp_path, file_path)
 
-        # Return absolute path
-        return str(file_path.absolute())
+        return str(file_path.absolute()), b"".join(chunks)
 
     except Exception as e:
+        if temp_path and os.path.exists(temp_path):
+            os.unlink(temp_path)
         raise FileUploadError(f"Failed to save file: {str(e)}") from e
 
 
+def _extract_text(reader: PdfReader) -> str:
+    """
+    Join the text of every page that has any.
+
+    Args:
+        reader: Opened PDF reader
+
+    Returns:
+        Extracted text content
+
+    Raises:
+        FileUploadError: If no page has extractable text
+    """
+    text_parts = []
+
+    for page in reader.pages:
+        text = page.extract_text()
+        if text:
+            text_parts.append(text)
+
+    if not text_parts:
+        raise FileUploadError("No text could be extracted from PDF")
+
+    return "\n\n".join(text_parts)
+
+
+# Maximum number of extracted documents kept in memory
+PDF_TEXT_CACHE_SIZE = 256
+
+# Worker processes for PDF parsing (pure Python, so threads would share one core);
+# one per document in an upload
+PDF_EXTRACT_WORKERS = 3
+
+
+@lru_cache(maxsize=None)
+def get_pdf_executor() -> ProcessPoolExecutor:
+    """Return the shared process pool used for PDF text extraction."""
+    return ProcessPoolExecutor(max_workers=PDF_EXTRACT_WORKERS)
+
+
+def shutdown_pdf_executor() -> None:
+    """Shut down the PDF process pool, if one was started, and forget it."""
+    if get_pdf_executor.cache_info().currsize:
+        get_pdf_executor().shutdown(cancel_futures=True)
+        get_pdf_executor.cache_clear()
+
+
+def _text_sidecar_path(file_path: str) -> Path:
+    """
+    Path of the extracted-text file stored next to an upload.
+
+    Upload names contain the content hash, so the sidecar stays valid for as long
+    as the PDF exists and is shared by every re-upload of the same document.
+
+    Args:
+        file_path: Path to the uploaded PDF
+
+    Returns:
+        Path of the .txt sidecar
+    """
+    return Path(file_path).with_suffix(".txt")
+
+
+@lru_cache(maxsize=PDF_TEXT_CACHE_SIZE)
+def _extract_text_from_file(file_path: str, mtime_ns: int) -> str:
+    """
+    Extract text from a PDF file, memoized per (path, modification time).
+
+    Args:
+        file_path: Path to PDF file
+        mtime_ns: File modification time; a rewritten file gets a new cache entry
+
+    Returns:
+        Extracted text content
+    """
+    sidecar = _text_sidecar_path(file_path)
+    if sidecar.exists():
+        return sidecar.read_text(encoding="utf-8")
+    return _extract_text(PdfReader(file_path))
+
+
 def extract_text_from_pdf(file_path: str) -> str:
     """
     Extract text from PDF file.
 
+    Results are cached, so re-reading the same stored document (e.g. the role
+    description on every interview start) does not re-parse the PDF.
+
     Args:
         file_path: Path to PDF file
 
@@ -93,23 +195,68 @@ def extract_text_from_pdf(file_path: str) -> str:
         FileUploadError: If text extraction fails
     """
     try:
-        reader = PdfReader(file_path)
-        text_parts = []
+        return _extract_text_from_file(file_path, os.stat(file_path).st_mtime_ns)
+    except Exception as e:
+        raise FileUploadError(f"Failed to extract text from PDF: {str(e)}") from e
 
-        for page in reader.pages:
-            text = page.extract_text()
-            if text:
-                text_parts.append(text)
 
-        if not text_parts:
-            raise FileUploadError("No text could be extracted from PDF")
+def extract_text_from_pdf_bytes(content: bytes) -> str:
+    """
+    Extract text from in-memory PDF content.
 
-        return "\n\n".join(text_parts)
+    Args:
+        content: PDF file content
 
+    Returns:
+        Extracted text content
+
+    Raises:
+        FileUploadError: If text extraction fails
+    """
+    try:
+        return _extract_text(PdfReader(io.BytesIO(content)))
     except Exception as e:
         raise FileUploadError(f"Failed to extract text from PDF: {str(e)}") from e
 
 
+def extract_text_from_upload(file_path: str, content: bytes) -> str:
+    """
+    Extract text from a saved upload, reusing the text of an earlier identical upload.
+
+    Parses the in-memory content on a miss and stores the text next to the PDF.
+    Module-level so it can run in the PDF process pool.
+
+    Args:
+        file_path: Path the upload was saved to
+        content: PDF file content
+
+    Returns:
+        Extracted text content
+
+    Raises:
+        FileUploadError: If text extraction fails
+    """
+    sidecar = _text_sidecar_path(file_path)
+    if sidecar.exists():
+        return sidecar.read_text(encoding="utf-8")
+
+    text = extract_text_from_pdf_bytes(content)
+
+    # Write under a temporary name and rename, so concurrent uploads of the same PDF
+    # or a crash mid-write never leave a partial sidecar behind
+    fd, temp_path = tempfile.mkstemp(dir=sidecar.parent, suffix=".part")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(temp_path, sidecar)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+    return text
+
+
 def validate_file_type(filename: str, allowed_extensions: list[str]) -> bool:
     """
     Validate file extension.
@@ -2,24 +2,27 @@
 import hashlib
 import time
 from typing import Optional, Dict, Any
-from datetime import datetime, timedelta
 
 
 class CacheEntry:
     """Cache entry with TTL."""
 
-    def __init__(self, value: str, ttl: int):
+    def __init__(self, value: Any, ttl: int):
         self.value = value
-        self.expires_at = datetime.now() + timedelta(seconds=ttl)
-        self.created_at = datetime.now()
+        self.expires_at = time.monotonic() + ttl
 
     def is_expired(self) -> bool:
         """Check if entry has expired."""
-        return datetime.now() > self.expires_at
+        return time.monotonic() > self.expires_at
 
 
 class LLMCache:
-    """In-memory cache for LLM responses with TTL support."""
+    """
+    In-memory LRU cache for LLM responses with TTL support.
+
+    Values are stored as returned by the chain (parsed pydantic models or strings),
+    so a hit can be used exactly like a fresh response.
+    """
 
     def __init__(self, default_ttl: int = 3600, max_size: int = 1000):
         """
@@ -64,7 +67,7 @@ class LLMCache:
         key_string = "|".join(key_parts)
         return hashlib.sha256(key_string.encode()).hexdigest()
 
-    def get(self, key: str) -> Optional[str]:
+    def get(self, key: str) -> Optional[Any]:
         """
         Get value from cache.
 
@@ -74,22 +77,22 @@ class LLMCache:
         Returns:
             Cached value or None if not found/expired
         """
-        if key not in self._cache:
+        entry = self._cache.pop(key, None)
+        if entry is None:
             self._misses += 1
             return None
 
-        entry = self._cache[key]
-
         # Check if expired
         if entry.is_expired():
-            del self._cache[key]
             self._misses += 1
             return None
 
+        # Re-insert to mark as most recently used
+        self._cache[key] = entry
         self._hits += 1
         return entry.value
 
-    def set(self, key: str, value: str, ttl: Optional[int] = None) -> None:
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         """
         Set value in cache.
 
@@ -98,7 +101,9 @@ class LLMCache:
             value: Value to cache
             ttl: Time-to-live in seconds (uses default if not specified)
         """
-        # Evict oldest entries if cache is full
+        self._cache.pop(key, None)
+
+        # Evict least recently used entries if cache is full
         if len(self._cache) >= self.max_size:
             self._evict_oldest()
 
@@ -106,16 +111,12 @@ class LLMCache:
         self._cache[key] = CacheEntry(value, ttl)
 
     def _evict_oldest(self) -> None:
-        """Evict oldest cache entry."""
+        """Evict the least recently used cache entry."""
         if not self._cache:
             return
 
-        # Find oldest entry
-        oldest_key = min(
-            self._cache.keys(),
-            key=lambda k: self._cache[k].created_at,
-        )
-        del self._cache[oldest_key]
+        # Dicts keep insertion order and hits re-insert, so the first key is the LRU
+        del self._cache[next(iter(self._cache))]
 
     def clear(self) -> None:
         """Clear all cache entries."""
@@ -12,6 +12,10 @@ class InterviewStatus(str, Enum):
     COMPLETED = "COMPLETED"  # Report generated
 
 
+# Status lookup by stored value, built once instead of going through Enum.__call__
+_STATUS_BY_VALUE = {status.value: status for status in InterviewStatus}
+
+
 class StateTransitionError(Exception):
     """Raised when an invalid state transition is attempted."""
 
@@ -21,27 +25,28 @@ class StateTransitionError(Exception):
 class InterviewStateMachine:
     """Manages interview state transitions and validation."""
 
-    # Valid state transitions
+    # Valid state transitions (frozensets for hashed membership checks)
     TRANSITIONS = {
-        InterviewStatus.DRAFT: [InterviewStatus.READY],
-        InterviewStatus.READY: [InterviewStatus.ASSIGNED],
-        InterviewStatus.ASSIGNED: [InterviewStatus.IN_PROGRESS],
-        InterviewStatus.IN_PROGRESS: [InterviewStatus.COMPLETED],
-        InterviewStatus.COMPLETED: [],  # Terminal state
+        InterviewStatus.DRAFT: frozenset({InterviewStatus.READY}),
+        InterviewStatus.READY: frozenset({InterviewStatus.ASSIGNED}),
+        InterviewStatus.ASSIGNED: frozenset({InterviewStatus.IN_PROGRESS}),
+        InterviewStatus.IN_PROGRESS: frozenset({InterviewStatus.COMPLETED}),
+        InterviewStatus.COMPLETED: frozenset(),  # Terminal state
     }
 
-    # Preconditions for state transitions
-    PRECONDITIONS = {
-        InterviewStatus.READY: lambda interview: interview.match_analysis_json is not None,
-        InterviewStatus.ASSIGNED: lambda interview: interview.candidate_link_token is not None,
-        InterviewStatus.IN_PROGRESS: lambda interview: True,  # No additional preconditions
-        InterviewStatus.COMPLETED: lambda interview: interview.report_json is not None,
+    # Preconditions for state transitions: the attribute that must be set on the
+    # interview before entering each status (IN_PROGRESS has none). Only the
+    # named attribute is read, so columns deferred by the caller stay unloaded.
+    REQUIRED_ATTRIBUTES = {
+        InterviewStatus.READY: "match_analysis_json",
+        InterviewStatus.ASSIGNED: "candidate_link_token",
+        InterviewStatus.COMPLETED: "report_json",
     }
 
     @classmethod
     def can_transition(cls, current_status: InterviewStatus, new_status: InterviewStatus) -> bool:
         """Check if transition from current_status to new_status is valid."""
-        return new_status in cls.TRANSITIONS.get(current_status, [])
+        return new_status in cls.TRANSITIONS.get(current_status, frozenset())
 
     @classmethod
     def validate_transition(
@@ -53,18 +58,21 @@ class InterviewStateMachine:
         Raises:
             StateTransitionError: If transition is invalid or preconditions not met.
         """
-        current_status = InterviewStatus(interview.status)
+        current_status = _STATUS_BY_VALUE.get(interview.status)
+        if current_status is None:
+            current_status = InterviewStatus(interview.status)  # Raises for unknown values
 
         # Check if transition is valid
-        if not cls.can_transition(current_status, new_status):
+        allowed = cls.TRANSITIONS.get(current_status, frozenset())
+        if new_status not in allowed:
             raise StateTransitionError(
                 f"Invalid transition from {current_status} to {new_status}. "
-                f"Valid transitions: {cls.TRANSITIONS.get(current_status, [])}"
+                f"Valid transitions: {sorted(allowed)}"
             )
 
         # Check preconditions
-        precondition = cls.PRECONDITIONS.get(new_status)
-        if precondition and not precondition(interview):
+        required_attribute = cls.REQUIRED_ATTRIBUTES.get(new_status)
+        if required_attribute and getattr(interview, required_attribute) is None:
             raise StateTransitionError(
                 f"Preconditions not met for transition to {new_status}"
             )
@@ -0,0 +1,50 @@
+"""Generate an Argon2 password hash, or time the configured Argon2 cost on this host.
+
+Usage:
+    poetry run python generate_argon2_hash.py <password>
+    poetry run python generate_argon2_hash.py --bench
+
+Set the printed hash as ADMIN_PASSWORD_HASH to configure the admin password.
+Hashes use the ARGON2_MEMORY_KIB / ARGON2_TIME_COST / ARGON2_PARALLELISM settings.
+Aim for roughly 200ms per verification on the production host.
+"""
+import argparse
+import time
+
+from app.config import settings
+from app.utils.auth import get_password_hash, verify_password
+
+BENCH_ROUNDS = 5
+
+
+def bench() -> None:
+    """Print the average verification time for the configured parameters."""
+    password_hash = get_password_hash("benchmark-password")
+
+    start = time.perf_counter()
+    for _ in range(BENCH_ROUNDS):
+        verify_password("benchmark-password", password_hash)
+    elapsed_ms = (time.perf_counter() - start) * 1000 / BENCH_ROUNDS
+
+    print(
+        f"m={settings.argon2_memory_kib} t={settings.argon2_time_cost} "
+        f"p={settings.argon2_parallelism}: {elapsed_ms:.1f}ms per verification"
+    )
+
+
+def main() -> None:
+    """Parse arguments and hash or benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("password", nargs="?", help="Password to hash")
+    group.add_argument("--bench", action="store_true", help="Time the configured parameters")
+    args = parser.parse_args()
+
+    if args.bench:
+        bench()
+    else:
+        print(get_password_hash(args.password))
+
+
+if __name__ == "__main__":
+    main()
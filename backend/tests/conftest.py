@@ -3,95 +3,150 @@ import pytest
 import asyncio
 import os
 from typing import AsyncGenerator, Generator
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from httpx import AsyncClient
 
 # Set testing environment variable to disable rate limiting
 # MUST be set before importing app modules
 os.environ["TESTING"] = "true"
 
-from app.database import Base, get_db
+from app.database import Base, enable_sqlite_foreign_keys, get_db
 from app.main import app
+from app.middleware.rate_limit import limiter
 from app.models.interview import Interview
 
 
-# Test database URL (in-memory SQLite)
-TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+# Test database URL: a named in-memory SQLite database, shared by every pooled
+# connection in this process. In-memory databases never cross processes, so each
+# pytest-xdist worker has its own; the worker id only makes that explicit.
+TEST_WORKER_ID = os.environ.get("PYTEST_XDIST_WORKER", "main")
+TEST_DATABASE_URL = (
+    f"sqlite+aiosqlite:///file:memdb_{TEST_WORKER_ID}?mode=memory&cache=shared&uri=true"
+)
 
 
 @pytest.fixture(scope="session")
 def event_loop() -> Generator:
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
+    """Create the event loop for the test session, on uvloop when it is installed."""
+    try:
+        # Installed with uvicorn[standard] (not on Windows), as in production
+        import uvloop
+    except ImportError:
+        loop = asyncio.get_event_loop_policy().new_event_loop()
+    else:
+        loop = uvloop.new_event_loop()
     yield loop
     loop.close()
 
 
-@pytest.fixture
-async def test_engine():
-    """Create a test database engine."""
+@pytest.fixture(scope="session")
+async def test_engine(event_loop):
+    """Create the test database engine and schema once per session."""
     engine = create_async_engine(
         TEST_DATABASE_URL,
         connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=5,
+        max_overflow=10,
     )
-    
+    enable_sqlite_foreign_keys(engine)
+
+    # pysqlite's implicit transaction handling breaks SAVEPOINT; take over BEGIN
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_implicit_begin(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
-    
+
     yield engine
-    
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-    
+
+    # No drop_all: the in-memory database disappears with its last connection
     await engine.dispose()
 
 
 @pytest.fixture
 async def test_db(test_engine) -> AsyncGenerator[AsyncSession, None]:
-    """Create a test database session."""
-    async_session = async_sessionmaker(
-        test_engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
-    
-    async with async_session() as session:
-        yield session
+    """
+    Create a test database session isolated in a rolled-back transaction.
 
+    Commits inside the test only release a SAVEPOINT; the outer transaction is
+    rolled back afterwards, so every test starts from an empty schema.
+    """
+    async with test_engine.connect() as connection:
+        transaction = await connection.begin()
+        session = AsyncSession(
+            bind=connection,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await transaction.rollback()
 
-@pytest.fixture
-async def test_client(test_db) -> AsyncGenerator[AsyncClient, None]:
-    """Create a test HTTP client."""
-    
-    async def override_get_db():
-        yield test_db
-    
-    app.dependency_overrides[get_db] = override_get_db
-    
-    # Disable rate limiting for tests
-    from app.middleware.rate_limit import limiter
+
+# Session used by the get_db override, rebound to each test's test_db
+_current_db: dict[str, AsyncSession] = {}
+
+
+async def _override_get_db() -> AsyncGenerator[AsyncSession, None]:
+    """Yield the current test's database session."""
+    yield _current_db["session"]
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _disable_rate_limiting() -> Generator:
+    """Disable rate limiting for the whole test session."""
     limiter._enabled = False
-    
+    yield
+    limiter._enabled = True
+
+
+@pytest.fixture(scope="session")
+async def _session_client(event_loop) -> AsyncGenerator[AsyncClient, None]:
+    """
+    Create the HTTP client and the get_db override once per session.
+
+    Depends on event_loop so it is torn down before the session loop closes, even
+    when an earlier test set up the loop first.
+    """
+    app.dependency_overrides[get_db] = _override_get_db
     async with AsyncClient(app=app, base_url="http://test") as client:
         yield client
-    
-    # Re-enable rate limiting after tests
-    limiter._enabled = True
-    app.dependency_overrides.clear()
+
+    app.dependency_overrides.pop(get_db, None)
 
 
 @pytest.fixture
-async def admin_token(test_client: AsyncClient) -> str:
-    """Get an admin authentication token using hardcoded credentials."""
-    # Use the hardcoded admin credentials from auth.py
-    response = await test_client.post(
-        "/auth/login",
-        json={"username": "admin", "password": "admin123"},
-    )
-    assert response.status_code == 200
-    return response.json()["access_token"]
+async def test_client(
+    _session_client: AsyncClient, test_db: AsyncSession
+) -> AsyncGenerator[AsyncClient, None]:
+    """Get the shared HTTP client, bound to this test's database session."""
+    _current_db["session"] = test_db
+    yield _session_client
+    del _current_db["session"]
+
+
+@pytest.fixture(scope="session")
+def admin_token() -> str:
+    """
+    Get an admin authentication token, signed directly with the test settings.
+
+    Skips the login round-trip and its password hash check; the real login flow
+    is still exercised through tests/test_api.py.
+    """
+    from app.api.auth import ADMIN_USERNAME
+    from app.utils.auth import create_access_token
+
+    return create_access_token({"sub": ADMIN_USERNAME})
 
 
 @pytest.fixture
@@ -109,6 +164,21 @@ async def test_interview(test_db: AsyncSession) -> Interview:
 
 
 @pytest.fixture
+def make_interview(test_db: AsyncSession):
+    """Factory that inserts interviews directly, bypassing the HTTP stack."""
+
+    async def _make(**fields) -> Interview:
+        interview = Interview(
+            **{"status": "DRAFT", "target_questions": 5, "difficulty_start": 5, **fields}
+        )
+        test_db.add(interview)
+        await test_db.commit()
+        return interview
+
+    return _make
+
+
+@pytest.fixture(scope="session")
 def mock_llm_response():
     """Mock LLM response for testing."""
     return {
@@ -118,7 +188,7 @@ def mock_llm_response():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_resume_text():
     """Sample resume text for testing."""
     return """
@@ -134,7 +204,7 @@ def sample_resume_text():
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_role_text():
     """Sample role description for testing."""
     return """
@@ -148,7 +218,7 @@ def sample_role_text():
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_job_offering_text():
     """Sample job offering for testing."""
     return """
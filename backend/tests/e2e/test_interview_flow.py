@@ -25,7 +25,7 @@ class TestInterviewE2E:
         # 1. Admin Create Interview
         # -------------------------
         create_response = await test_client.post(
-            "/interviews/",
+            "/api/interviews/",
             json={"target_questions": 2, "difficulty_start": 5}, # Keep short for test
             headers={"Authorization": f"Bearer {admin_token}"},
         )
@@ -65,7 +65,7 @@ class TestInterviewE2E:
 
         # Verify status is READY via API
         get_response = await test_client.get(
-            f"/interviews/{interview_id}",
+            f"/api/interviews/{interview_id}",
             headers={"Authorization": f"Bearer {admin_token}"},
         )
         assert get_response.json()["status"] == InterviewStatus.READY
@@ -73,7 +73,7 @@ class TestInterviewE2E:
         # 3. Admin Assign Interview (Status READY -> ASSIGNED)
         # ----------------------------------------------------
         assign_response = await test_client.post(
-            f"/interviews/{interview_id}/assign",
+            f"/api/interviews/{interview_id}/assign",
             headers={"Authorization": f"Bearer {admin_token}"},
         )
         assert assign_response.status_code == 200
@@ -85,14 +85,13 @@ class TestInterviewE2E:
         # 4. Candidate Start Interview (Status ASSIGNED -> IN_PROGRESS)
         # -------------------------------------------------------------
         # Mock agents globally to prevent real LLM calls during start_interview
-        # Note: generate_introduction is imported at top level in chat.py, so patch where used.
-        # generate_question is imported inside the function, so patching the source Works.
+        # Note: both agents are imported at top level in chat.py, so patch where used.
         with patch("app.api.chat.generate_introduction", return_value="Welcome to the interview!"), \
-             patch("app.agents.generate_question", new_callable=AsyncMock) as mock_gen_q:
+             patch("app.api.chat.generate_question", new_callable=AsyncMock) as mock_gen_q:
             
             mock_gen_q.return_value = "What is unit testing?"
             
-            start_response = await test_client.post(f"/chat/start/{token}")
+            start_response = await test_client.post(f"/api/chat/start/{token}")
             assert start_response.status_code == 200
             start_data = start_response.json()
             assert "introduction" in start_data
@@ -100,7 +99,7 @@ class TestInterviewE2E:
             
             # Verify status update
             get_response = await test_client.get(
-                f"/interviews/{interview_id}",
+                f"/api/interviews/{interview_id}",
                 headers={"Authorization": f"Bearer {admin_token}"},
             )
             assert get_response.json()["status"] == InterviewStatus.IN_PROGRESS
@@ -133,7 +132,7 @@ class TestInterviewE2E:
             # Send an answer
             # API expects /chat/{interview_id}/message
             message_response = await test_client.post(
-                f"/chat/{interview_id}/message",
+                f"/api/chat/{interview_id}/message",
                 json={
                     "content": "Unit testing is testing individual components.",
                     "telemetry": {
@@ -151,7 +150,7 @@ class TestInterviewE2E:
         # 6. Admin Check Costs (Post-Interview)
         # -------------------------------------
         cost_response = await test_client.get(
-            f"/interviews/{interview_id}/costs",
+            f"/api/interviews/{interview_id}/costs",
              headers={"Authorization": f"Bearer {admin_token}"},
         )
         assert cost_response.status_code == 200
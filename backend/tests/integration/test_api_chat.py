@@ -0,0 +1,42 @@
+"""Integration tests for chat API endpoints."""
+import pytest
+from httpx import AsyncClient
+
+from app.schemas.message import MessageCreate, Telemetry
+from app.services import MessageService
+
+
+@pytest.mark.asyncio
+class TestGetMessages:
+    """Test the transcript endpoint."""
+
+    async def test_telemetry_defaults_filled_in(
+        self, test_client: AsyncClient, test_interview, test_db
+    ):
+        """Test telemetry stored without its defaults is returned in full."""
+        await MessageService.create_messages(
+            test_db,
+            test_interview.id,
+            [
+                MessageCreate(role="assistant", content="Question?", question_number=1),
+                MessageCreate(
+                    role="candidate",
+                    content="Answer.",
+                    telemetry=Telemetry(response_time_ms=1200),
+                ),
+                MessageCreate(
+                    role="candidate",
+                    content="Pasted answer.",
+                    telemetry=Telemetry(response_time_ms=300, paste_detected=True),
+                ),
+            ],
+        )
+
+        response = await test_client.get(f"/api/chat/{test_interview.id}/messages")
+
+        assert response.status_code == 200
+        assert [message["telemetry"] for message in response.json()] == [
+            None,
+            {"response_time_ms": 1200, "paste_detected": False},
+            {"response_time_ms": 300, "paste_detected": True},
+        ]
@@ -1,11 +1,11 @@
 """Integration tests for cost tracking API endpoints."""
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import insert
 
 from app.models.llm_usage import LLMUsage
 
 
-@pytest.mark.skip(reason="Rate limiting issues in test environment causing 429 errors")
 @pytest.mark.asyncio
 class TestCostTrackingEndpoints:
     """Test cost tracking API endpoints."""
@@ -13,7 +13,7 @@ class TestCostTrackingEndpoints:
     async def test_get_interview_costs_empty(self, test_client: AsyncClient, test_interview, admin_token):
         """Test getting costs for interview with no LLM usage."""
         response = await test_client.get(
-            f"/interviews/{test_interview.id}/costs",
+            f"/api/interviews/{test_interview.id}/costs",
             headers={"Authorization": f"Bearer {admin_token}"},
         )
 
@@ -29,33 +29,36 @@ class TestCostTrackingEndpoints:
         self, test_client: AsyncClient, test_interview, test_db, admin_token
     ):
         """Test getting costs for interview with LLM usage."""
-        # Add some LLM usage records
-        usage1 = LLMUsage(
-            interview_id=test_interview.id,
-            agent_name="document_analysis",
-            model="gemini-pro",
-            prompt_tokens=1000,
-            completion_tokens=500,
-            total_tokens=1500,
-            estimated_cost=0.000375,
-            cached=False,
-        )
-        usage2 = LLMUsage(
-            interview_id=test_interview.id,
-            agent_name="question_generation",
-            model="gemini-pro",
-            prompt_tokens=500,
-            completion_tokens=300,
-            total_tokens=800,
-            estimated_cost=0.000275,
-            cached=True,
+        # Add some LLM usage records in one executemany INSERT
+        await test_db.execute(
+            insert(LLMUsage),
+            [
+                {
+                    "interview_id": test_interview.id,
+                    "agent_name": "document_analysis",
+                    "model": "gemini-pro",
+                    "prompt_tokens": 1000,
+                    "completion_tokens": 500,
+                    "total_tokens": 1500,
+                    "estimated_cost": 0.000375,
+                    "cached": False,
+                },
+                {
+                    "interview_id": test_interview.id,
+                    "agent_name": "question_generation",
+                    "model": "gemini-pro",
+                    "prompt_tokens": 500,
+                    "completion_tokens": 300,
+                    "total_tokens": 800,
+                    "estimated_cost": 0.000275,
+                    "cached": True,
+                },
+            ],
         )
-        test_db.add(usage1)
-        test_db.add(usage2)
         await test_db.commit()
 
         response = await test_client.get(
-            f"/interviews/{test_interview.id}/costs",
+            f"/api/interviews/{test_interview.id}/costs",
             headers={"Authorization": f"Bearer {admin_token}"},
         )
 
@@ -73,7 +76,7 @@ class TestCostTrackingEndpoints:
     async def test_get_cost_statistics_empty(self, test_client: AsyncClient, admin_token):
         """Test getting aggregate cost statistics with no data."""
         response = await test_client.get(
-            "/interviews/stats/costs",
+            "/api/interviews/stats/costs",
             headers={"Authorization": f"Bearer {admin_token}"},
         )
 
@@ -102,7 +105,7 @@ class TestCostTrackingEndpoints:
         await test_db.commit()
 
         response = await test_client.get(
-            "/interviews/stats/costs",
+            "/api/interviews/stats/costs",
             headers={"Authorization": f"Bearer {admin_token}"},
         )
 
@@ -117,7 +120,7 @@ class TestCostTrackingEndpoints:
     async def test_get_cache_stats(self, test_client: AsyncClient, admin_token):
         """Test getting cache statistics."""
         response = await test_client.get(
-            "/interviews/cache/stats",
+            "/api/interviews/cache/stats",
             headers={"Authorization": f"Bearer {admin_token}"},
         )
 
@@ -133,11 +136,11 @@ class TestCostTrackingEndpoints:
         """Test that cost endpoints require authentication."""
         # Without token - should get 403 (forbidden) not 401 (unauthorized)
         # because the endpoints are protected by require_admin dependency
-        response = await test_client.get(f"/interviews/{test_interview.id}/costs")
+        response = await test_client.get(f"/api/interviews/{test_interview.id}/costs")
         assert response.status_code in [401, 403]  # Accept either
 
-        response = await test_client.get("/interviews/stats/costs")
+        response = await test_client.get("/api/interviews/stats/costs")
         assert response.status_code in [401, 403]  # Accept either
 
-        response = await test_client.get("/interviews/cache/stats")
+        response = await test_client.get("/api/interviews/cache/stats")
         assert response.status_code in [401, 403]  # Accept either
@@ -0,0 +1,52 @@
+"""Integration tests for the document upload endpoint."""
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+
+import pytest
+from httpx import AsyncClient
+
+from app.api import interviews
+from app.config import settings
+from app.utils import file_upload
+
+
+class _BrokenExecutor:
+    """Executor stand-in that fails every job the way a crashed process pool does."""
+
+    def submit(self, fn, *args):
+        """Return a future already failed with BrokenProcessPool."""
+        future = Future()
+        future.set_exception(BrokenProcessPool("worker died"))
+        return future
+
+
+@pytest.mark.asyncio
+class TestUploadDocuments:
+    """Test document upload failure handling."""
+
+    async def test_broken_pool_returns_503_and_is_replaced(
+        self, test_client: AsyncClient, test_interview, admin_token, monkeypatch, tmp_path
+    ):
+        """Test a crashed PDF pool maps to 503 and is dropped for the next upload."""
+        monkeypatch.setattr(
+            file_upload, "settings", settings.model_copy(update={"upload_dir": str(tmp_path)})
+        )
+
+        @lru_cache(maxsize=None)
+        def get_pdf_executor():
+            return _BrokenExecutor()
+
+        monkeypatch.setattr(interviews, "get_pdf_executor", get_pdf_executor)
+
+        response = await test_client.post(
+            f"/api/interviews/{test_interview.id}/upload",
+            headers={"Authorization": f"Bearer {admin_token}"},
+            files={
+                name: (f"{name}.pdf", b"%PDF-1.4 " + name.encode(), "application/pdf")
+                for name in ["resume", "role_description", "job_offering"]
+            },
+        )
+
+        assert response.status_code == 503
+        assert get_pdf_executor.cache_info().currsize == 0
@@ -1,76 +1,19 @@
 """Integration tests for API endpoints."""
 import pytest
-import pytest_asyncio
-from httpx import AsyncClient, ASGITransport
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 
-from app.main import app
-from app.database import Base, get_db
+from app.api import auth
+from app.config import settings
 from app.utils.state_machine import InterviewStatus
 
 
-# Use SQLite in-memory database for tests (no setup required)
-TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+# The schema is created once per session by conftest's test_engine; test_db wraps
+# each test in a rolled-back transaction, so no per-test create_all/drop_all
 
 
-@pytest_asyncio.fixture
-async def test_engine():
-    """Create test database engine."""
-    engine = create_async_engine(TEST_DATABASE_URL, echo=False)
-
-    # Create tables
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-        await conn.run_sync(Base.metadata.create_all)
-
-    yield engine
-
-    # Cleanup
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-
-    await engine.dispose()
-
-
-@pytest_asyncio.fixture
-async def test_db(test_engine):
-    """Create test database session factory."""
-    async_session = async_sessionmaker(
-        test_engine, class_=AsyncSession, expire_on_commit=False
-    )
-    return async_session
-
-
-@pytest_asyncio.fixture
-async def client(test_db):
-    """Create test client."""
-    async def override_get_db():
-        async with test_db() as session:
-            yield session
-
-    app.dependency_overrides[get_db] = override_get_db
-    
-    # Disable rate limiting for tests
-    from app.middleware.rate_limit import limiter
-    limiter._enabled = False
-
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
-        yield ac
-    
-    # Re-enable after tests
-    limiter._enabled = True
-    app.dependency_overrides.clear()
-
-
-@pytest_asyncio.fixture
-async def admin_token(client):
-    """Get admin authentication token."""
-    response = await client.post(
-        "/auth/login",
-        json={"username": "admin", "password": "admin123"},
-    )
-    assert response.status_code == 200
-    return response.json()["access_token"]
+@pytest.fixture
+def client(test_client):
+    """Shared session-scoped test client, bound to this test's database session."""
+    return test_client
 
 
 @pytest.mark.asyncio
@@ -80,7 +23,7 @@ class TestInterviewEndpoints:
     async def test_create_interview(self, client, admin_token):
         """Test creating an interview."""
         response = await client.post(
-            "/interviews/",
+            "/api/interviews/",
             json={"target_questions": 5, "difficulty_start": 5},
             headers={"Authorization": f"Bearer {admin_token}"},
         )
@@ -92,18 +35,14 @@ class TestInterviewEndpoints:
         assert data["difficulty_start"] == 5
         assert "id" in data
 
-    async def test_list_interviews(self, client, admin_token):
+    async def test_list_interviews(self, client, admin_token, make_interview):
         """Test listing interviews."""
         # Create an interview first
-        await client.post(
-            "/interviews/",
-            json={"target_questions": 5, "difficulty_start": 5},
-            headers={"Authorization": f"Bearer {admin_token}"},
-        )
+        await make_interview()
 
         # List interviews
         response = await client.get(
-            "/interviews/",
+            "/api/interviews/",
             headers={"Authorization": f"Bearer {admin_token}"},
         )
 
@@ -112,19 +51,14 @@ class TestInterviewEndpoints:
         assert isinstance(data, list)
         assert len(data) >= 1
 
-    async def test_get_interview(self, client, admin_token):
+    async def test_get_interview(self, client, admin_token, make_interview):
         """Test getting interview by ID."""
         # Create interview
-        create_response = await client.post(
-            "/interviews/",
-            json={"target_questions": 5, "difficulty_start": 5},
-            headers={"Authorization": f"Bearer {admin_token}"},
-        )
-        interview_id = create_response.json()["id"]
+        interview_id = (await make_interview()).id
 
         # Get interview
         response = await client.get(
-            f"/interviews/{interview_id}",
+            f"/api/interviews/{interview_id}",
             headers={"Authorization": f"Bearer {admin_token}"},
         )
 
@@ -135,25 +69,22 @@ class TestInterviewEndpoints:
     async def test_get_nonexistent_interview(self, client, admin_token):
         """Test getting non-existent interview."""
         response = await client.get(
-            "/interviews/999",
+            "/api/interviews/999",
             headers={"Authorization": f"Bearer {admin_token}"},
         )
 
         assert response.status_code == 404
+        # The endpoint's own 404, not an unrouted path
+        assert response.json()["detail"] == "Interview not found"
 
-    async def test_delete_interview(self, client, admin_token):
+    async def test_delete_interview(self, client, admin_token, make_interview):
         """Test deleting an interview."""
         # Create interview
-        create_response = await client.post(
-            "/interviews/",
-            json={"target_questions": 5, "difficulty_start": 5},
-            headers={"Authorization": f"Bearer {admin_token}"},
-        )
-        interview_id = create_response.json()["id"]
+        interview_id = (await make_interview()).id
 
         # Delete interview
         response = await client.delete(
-            f"/interviews/{interview_id}",
+            f"/api/interviews/{interview_id}",
             headers={"Authorization": f"Bearer {admin_token}"},
         )
 
@@ -161,7 +92,7 @@ class TestInterviewEndpoints:
 
         # Verify it's gone
         response = await client.get(
-            f"/interviews/{interview_id}",
+            f"/api/interviews/{interview_id}",
             headers={"Authorization": f"Bearer {admin_token}"},
         )
 
@@ -174,47 +105,69 @@ class TestInterviewEndpoints:
         # and LLM API key to run
         pass
 
-    async def test_assign_interview_invalid_state(self, client, admin_token):
+    async def test_assign_interview_invalid_state(self, client, admin_token, make_interview):
         """Test assigning interview in wrong state."""
         # Create interview (DRAFT status)
-        create_response = await client.post(
-            "/interviews/",
-            json={"target_questions": 5, "difficulty_start": 5},
-            headers={"Authorization": f"Bearer {admin_token}"},
-        )
-        interview_id = create_response.json()["id"]
+        interview_id = (await make_interview()).id
 
         # Try to assign (should fail - needs to be READY first)
         response = await client.post(
-            f"/interviews/{interview_id}/assign",
+            f"/api/interviews/{interview_id}/assign",
             headers={"Authorization": f"Bearer {admin_token}"},
         )
 
         assert response.status_code == 400
 
 
+@pytest.mark.asyncio
+class TestAuthEndpoints:
+    """Test authentication endpoints."""
+
+    async def test_login(self, client, monkeypatch):
+        """Test the real login flow (other tests use a directly signed token)."""
+        # The admin123 fallback is development-only and off by default
+        monkeypatch.setattr(
+            auth,
+            "settings",
+            settings.model_copy(update={"admin_password_fallback_enabled": True}),
+        )
+        response = await client.post(
+            "/api/auth/login",
+            json={"username": "admin", "password": "admin123"},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["token_type"] == "bearer"
+        assert data["access_token"]
+
+    async def test_login_wrong_password(self, client):
+        """Test login with a wrong password."""
+        response = await client.post(
+            "/api/auth/login",
+            json={"username": "admin", "password": "wrong"},
+        )
+
+        assert response.status_code == 401
+
+
 @pytest.mark.asyncio
 class TestChatEndpoints:
     """Test chat endpoints."""
 
     async def test_start_interview_invalid_token(self, client):
         """Test starting interview with invalid token."""
-        response = await client.post("/chat/start/invalid_token")
+        response = await client.post("/api/chat/start/invalid_token")
 
         assert response.status_code == 400
 
-    async def test_get_messages_empty(self, client, admin_token):
+    async def test_get_messages_empty(self, client, make_interview):
         """Test getting messages for interview with no messages."""
         # Create interview
-        create_response = await client.post(
-            "/interviews/",
-            json={"target_questions": 5, "difficulty_start": 5},
-            headers={"Authorization": f"Bearer {admin_token}"},
-        )
-        interview_id = create_response.json()["id"]
+        interview_id = (await make_interview()).id
 
         # Get messages
-        response = await client.get(f"/chat/{interview_id}/messages")
+        response = await client.get(f"/api/chat/{interview_id}/messages")
 
         assert response.status_code == 200
         data = response.json()
@@ -0,0 +1,15 @@
+"""Shared fixtures for unit tests."""
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+
+@pytest.fixture
+def mock_invoke(agent):
+    """
+    Patch the agent's LLM invocation for the duration of a test.
+
+    Each agent test module provides its own ``agent`` fixture.
+    """
+    with patch.object(agent, "invoke_with_retry_async", new_callable=AsyncMock) as mock:
+        yield mock
@@ -0,0 +1,167 @@
+"""Unit tests for admin login helpers."""
+import pytest
+
+from app.api import auth
+from app.config import settings
+
+
+def _use_settings(monkeypatch, **update):
+    """Point the auth module at a copy of the (frozen) settings with updates applied."""
+    monkeypatch.setattr(auth, "settings", settings.model_copy(update=update))
+
+
+@pytest.fixture
+def verify_stub(monkeypatch):
+    """Stub verify_password on an empty cache; the stub records the passwords it checks."""
+    def _verify_password(password, hashed_password):
+        _verify_password.calls.append(password)
+        assert hashed_password == "configured-hash"
+        return password == "correct-password"
+
+    _verify_password.calls = []
+    _use_settings(monkeypatch, admin_password_hash="configured-hash")
+    monkeypatch.setattr(auth, "verify_password", _verify_password)
+    monkeypatch.setattr(auth, "_admin_verify_cache", {})
+    return _verify_password
+
+
+@pytest.mark.asyncio
+class TestVerifyAdmin:
+    """Test cases for the memoized admin password check."""
+
+    async def test_repeat_password_skips_verification(self, verify_stub):
+        """Test a second check with the same password reuses the cached result."""
+        assert await auth._verify_admin("correct-password") is True
+        assert await auth._verify_admin("correct-password") is True
+
+        assert verify_stub.calls == ["correct-password"]
+
+    async def test_wrong_password_cached_as_false(self, verify_stub):
+        """Test a failed check is cached as False."""
+        assert await auth._verify_admin("wrong-password") is False
+        assert await auth._verify_admin("wrong-password") is False
+
+        assert verify_stub.calls == ["wrong-password"]
+        assert list(auth._admin_verify_cache.values()) == [False]
+
+    async def test_cache_never_stores_plaintext(self, verify_stub):
+        """Test the cache is keyed by digest, not by the password itself."""
+        await auth._verify_admin("correct-password")
+
+        (key,) = auth._admin_verify_cache
+        assert b"correct-password" not in key
+
+    async def test_eviction_at_cache_size(self, verify_stub):
+        """Test the oldest entry is evicted once the 128-entry cap is reached."""
+        size = auth._VERIFY_CACHE_SIZE
+        for i in range(size):
+            await auth._verify_admin(f"password-{i}")
+        assert len(auth._admin_verify_cache) == size
+
+        await auth._verify_admin("password-new")
+        assert len(auth._admin_verify_cache) == size
+
+        # The oldest password was evicted and has to be verified again
+        await auth._verify_admin("password-0")
+        assert verify_stub.calls.count("password-0") == 2
+        await auth._verify_admin(f"password-{size - 1}")
+        assert verify_stub.calls.count(f"password-{size - 1}") == 1
+
+    async def test_no_hash_configured_rejects(self, verify_stub, monkeypatch):
+        """Test every password is rejected, without hashing, when no hash is set."""
+        _use_settings(monkeypatch, admin_password_hash=None)
+
+        assert await auth._verify_admin("correct-password") is False
+        assert verify_stub.calls == []
+
+
+class TestCheckAdminCredentials:
+    """Test cases for the startup admin configuration check."""
+
+    @pytest.mark.parametrize(
+        "password_hash,fallback_enabled",
+        [("configured-hash", False), (None, True), ("configured-hash", True)],
+    )
+    def test_configured_login_passes(self, monkeypatch, password_hash, fallback_enabled):
+        """Test startup proceeds with a hash, the fallback, or both."""
+        _use_settings(
+            monkeypatch,
+            admin_password_hash=password_hash,
+            admin_password_fallback_enabled=fallback_enabled,
+        )
+
+        auth.check_admin_credentials()
+
+    @pytest.mark.parametrize("password_hash", [None, ""])
+    def test_no_login_configured_fails(self, monkeypatch, password_hash):
+        """Test startup fails when neither a hash nor the fallback is set."""
+        _use_settings(
+            monkeypatch,
+            admin_password_hash=password_hash,
+            admin_password_fallback_enabled=False,
+        )
+
+        with pytest.raises(RuntimeError, match="ADMIN_PASSWORD_HASH"):
+            auth.check_admin_credentials()
+
+
+class _FakeClock:
+    """Stand-in for the time module with a settable time()."""
+
+    def __init__(self, now: float):
+        self.now = now
+
+    def time(self) -> float:
+        """Return the frozen time."""
+        return self.now
+
+
+@pytest.fixture
+def login_clock(monkeypatch):
+    """Accept any password and count signed tokens; returns the clock seen by login."""
+    async def _verify_admin(password):
+        return True
+
+    def _create_access_token(data, expires_delta=None):
+        _create_access_token.count += 1
+        return f"token-{_create_access_token.count}"
+
+    _create_access_token.count = 0
+    # Start of a bucket, so the +29 s step below stays inside it
+    clock = _FakeClock(auth._TOKEN_BUCKET_SECONDS * 1_000_000)
+    monkeypatch.setattr(auth, "_verify_admin", _verify_admin)
+    monkeypatch.setattr(auth, "create_access_token", _create_access_token)
+    monkeypatch.setattr(auth, "time", clock)
+    auth._signed_token.cache_clear()
+    yield clock
+    auth._signed_token.cache_clear()
+
+
+@pytest.mark.asyncio
+class TestLoginTokenReuse:
+    """Test cases for reusing signed tokens within a time bucket."""
+
+    async def _login(self, client):
+        response = await client.post(
+            "/api/auth/login",
+            json={"username": auth.ADMIN_USERNAME, "password": "any-password"},
+        )
+        assert response.status_code == 200
+        return response.json()["access_token"]
+
+    async def test_same_bucket_reuses_token(self, test_client, login_clock):
+        """Test two logins in one 30 s bucket get the same token."""
+        first = await self._login(test_client)
+        login_clock.now += auth._TOKEN_BUCKET_SECONDS - 1
+        second = await self._login(test_client)
+
+        assert first == second == "token-1"
+
+    async def test_next_bucket_signs_new_token(self, test_client, login_clock):
+        """Test a login in the next bucket gets a newly signed token."""
+        first = await self._login(test_client)
+        login_clock.now += auth._TOKEN_BUCKET_SECONDS
+        second = await self._login(test_client)
+
+        assert first == "token-1"
+        assert second == "token-2"
@@ -0,0 +1,104 @@
+"""Unit tests for the verified-token cache in auth dependencies."""
+import pytest
+
+from app.api import dependencies
+
+
+class _FakeClock:
+    """Stand-in for the time module with a settable time()."""
+
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def time(self) -> float:
+        """Return the frozen time."""
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Frozen clock for the cache TTL checks."""
+    fake = _FakeClock()
+    monkeypatch.setattr(dependencies, "time", fake)
+    return fake
+
+
+@pytest.fixture
+def verify_stub(monkeypatch):
+    """Stub verify_token on an empty cache; the stub records the tokens it verifies."""
+    def _verify_token(token):
+        _verify_token.calls.append(token)
+        if token.startswith("bad"):
+            return None
+        return {"sub": "admin", "exp": _verify_token.exp}
+
+    _verify_token.calls = []
+    _verify_token.exp = 2_000_000_000
+    monkeypatch.setattr(dependencies, "verify_token", _verify_token)
+    monkeypatch.setattr(dependencies, "_token_cache", {})
+    return _verify_token
+
+
+class TestVerifyTokenCached:
+    """Test cases for _verify_token_cached."""
+
+    def test_miss_verifies_and_caches(self, clock, verify_stub):
+        """Test a new token is verified once and stored."""
+        payload = dependencies._verify_token_cached("token-a")
+
+        assert payload == {"sub": "admin", "exp": verify_stub.exp}
+        assert verify_stub.calls == ["token-a"]
+        assert "token-a" in dependencies._token_cache
+
+    def test_hit_skips_verification(self, clock, verify_stub):
+        """Test a repeated token is served from the cache."""
+        first = dependencies._verify_token_cached("token-a")
+        second = dependencies._verify_token_cached("token-a")
+
+        assert second is first
+        assert verify_stub.calls == ["token-a"]
+
+    def test_invalid_token_not_cached(self, clock, verify_stub):
+        """Test tokens that fail verification are re-checked every time."""
+        assert dependencies._verify_token_cached("bad-token") is None
+        assert dependencies._verify_token_cached("bad-token") is None
+
+        assert verify_stub.calls == ["bad-token", "bad-token"]
+        assert dependencies._token_cache == {}
+
+    def test_entry_expires_after_ttl(self, clock, verify_stub):
+        """Test cached payloads are re-verified once the 60 s TTL passes."""
+        dependencies._verify_token_cached("token-a")
+
+        clock.now += dependencies._TOKEN_CACHE_TTL_SECONDS - 1
+        dependencies._verify_token_cached("token-a")
+        assert verify_stub.calls == ["token-a"]
+
+        clock.now += 1
+        dependencies._verify_token_cached("token-a")
+        assert verify_stub.calls == ["token-a", "token-a"]
+
+    def test_entry_capped_at_token_exp(self, clock, verify_stub):
+        """Test a token expiring within the TTL is not served past its exp."""
+        verify_stub.exp = clock.now + 10
+        dependencies._verify_token_cached("token-a")
+
+        assert dependencies._token_cache["token-a"][1] == clock.now + 10
+
+        clock.now += 10
+        dependencies._verify_token_cached("token-a")
+        assert verify_stub.calls == ["token-a", "token-a"]
+
+    def test_eviction_at_cache_size(self, clock, verify_stub):
+        """Test the oldest entry is evicted once the cache is full."""
+        size = dependencies._TOKEN_CACHE_SIZE
+        dependencies._token_cache.update(
+            (f"token-{i}", ({"sub": "admin"}, clock.now + 60)) for i in range(size)
+        )
+
+        dependencies._verify_token_cached("token-new")
+
+        assert len(dependencies._token_cache) == size
+        assert "token-0" not in dependencies._token_cache
+        assert "token-1" in dependencies._token_cache
+        assert "token-new" in dependencies._token_cache
@@ -0,0 +1,105 @@
+"""Unit tests for BaseAgent invocation and usage tracking."""
+import pytest
+from langchain_core.exceptions import OutputParserException
+from tenacity import wait_none
+
+from app.agents import base
+from app.agents.base import BaseAgent, LLMInvocationError
+
+
+class _FailingSession:
+    """Session stand-in whose commit fails; records whether rollback held the lock."""
+
+    def __init__(self):
+        self.info = {}
+        self.added = []
+        self.rollback_locked = None
+
+    def add(self, obj):
+        """Record an added object."""
+        self.added.append(obj)
+
+    async def commit(self):
+        """Fail the commit."""
+        raise RuntimeError("commit failed")
+
+    async def rollback(self):
+        """Record whether the usage lock is held during rollback."""
+        self.rollback_locked = self.info["llm_usage_lock"].locked()
+
+
+@pytest.mark.asyncio
+class TestTrackUsage:
+    """Test cases for BaseAgent._track_usage."""
+
+    async def test_failed_commit_rolls_back_under_lock(self):
+        """Test a failed usage write rolls back while still holding the session lock."""
+        agent = BaseAgent(agent_name="test")
+        db = _FailingSession()
+
+        await agent._track_usage(
+            db=db,
+            interview_id=1,
+            model="gpt-4",
+            prompt_tokens=10,
+            completion_tokens=5,
+            cost=0.01,
+            cached=False,
+        )
+
+        assert len(db.added) == 1
+        assert db.rollback_locked is True
+        assert not db.info["llm_usage_lock"].locked()
+
+
+class _FlakyChain:
+    """Chain stand-in whose first ainvoke returns unparseable output."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def ainvoke(self, inputs):
+        """Fail to parse on the first call, succeed afterwards."""
+        self.calls += 1
+        if self.calls == 1:
+            raise OutputParserException("invalid output")
+        return {"answer": inputs["question"]}
+
+
+class _BrokenChain:
+    """Chain stand-in whose provider call always fails."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def ainvoke(self, inputs):
+        """Fail every call."""
+        self.calls += 1
+        raise RuntimeError("provider down")
+
+
+@pytest.mark.asyncio
+class TestInvokeWithRetryAsync:
+    """Test cases for BaseAgent.invoke_with_retry_async."""
+
+    async def test_invalid_output_is_retried(self, monkeypatch):
+        """Test an output parsing failure is retried like in the sync version."""
+        monkeypatch.setattr(base, "_RETRY_WAIT", wait_none())
+        chain = _FlakyChain()
+
+        result = await BaseAgent(agent_name="test").invoke_with_retry_async(
+            chain=chain, inputs={"question": "q"}, model="gpt-4", use_cache=False
+        )
+
+        assert result == {"answer": "q"}
+        assert chain.calls == 2
+
+    async def test_gives_up_after_three_attempts(self, monkeypatch):
+        """Test the last error is re-raised once the attempts run out."""
+        monkeypatch.setattr(base, "_RETRY_WAIT", wait_none())
+        chain = _BrokenChain()
+        with pytest.raises(LLMInvocationError):
+            await BaseAgent(agent_name="test").invoke_with_retry_async(
+                chain=chain, inputs={}, model="gpt-4", use_cache=False
+            )
+        assert chain.calls == 3
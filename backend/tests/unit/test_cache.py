@@ -1,7 +1,27 @@
 """Unit tests for LLM cache utility."""
 import pytest
+from app.schemas.message import AnswerEvaluation
 from app.utils.llm_cache import LLMCache
 
+# Keys are deterministic, so tests that exercise storage rather than key
+# generation share keys computed once at import
+KEY1, KEY2, KEY3 = (
+    LLMCache().generate_key(f"prompt{i}", "gpt-4", 0.7, "agent") for i in (1, 2, 3)
+)
+
+
+@pytest.fixture(scope="module")
+def _shared_cache():
+    """One cache instance for the module's non-eviction tests."""
+    return LLMCache(max_size=1000)
+
+
+@pytest.fixture
+def cache(_shared_cache):
+    """Get the shared cache, emptied and with statistics reset."""
+    _shared_cache.clear()
+    return _shared_cache
+
 
 class TestLLMCache:
     """Test cases for LLM cache."""
@@ -14,40 +34,33 @@ class TestLLMCache:
         stats = cache.get_stats()
         assert stats["size"] == 0
 
-    def test_cache_set_and_get(self):
+    def test_cache_set_and_get(self, cache):
         """Test basic cache set and get operations."""
-        cache = LLMCache()
-        key = cache.generate_key("test prompt", "gpt-4", 0.7, "test_agent")
-        
-        cache.set(key, "test response")
-        result = cache.get(key)
+        cache.set(KEY1, "test response")
+        result = cache.get(KEY1)
         
         assert result == "test response"
         stats = cache.get_stats()
         assert stats["size"] == 1
 
-    def test_cache_miss(self):
+    def test_cache_miss(self, cache):
         """Test cache returns None on miss."""
-        cache = LLMCache()
         result = cache.get("nonexistent_key")
         assert result is None
 
-    def test_cache_statistics(self):
+    def test_cache_statistics(self, cache):
         """Test cache statistics tracking."""
-        cache = LLMCache()
-        key = cache.generate_key("test", "gpt-4", 0.7, "agent")
-        
         # First access - miss
-        cache.get(key)
+        cache.get(KEY1)
         stats = cache.get_stats()
         assert stats["misses"] == 1
         assert stats["hits"] == 0
         
         # Set value
-        cache.set(key, "response")
+        cache.set(KEY1, "response")
         
         # Second access - hit
-        cache.get(key)
+        cache.get(KEY1)
         stats = cache.get_stats()
         assert stats["hits"] == 1
         assert stats["misses"] == 1
@@ -56,53 +69,73 @@ class TestLLMCache:
     def test_cache_eviction(self):
         """Test cache evicts oldest entries when max size reached."""
         cache = LLMCache(max_size=2)
-        
-        key1 = cache.generate_key("prompt1", "gpt-4", 0.7, "agent")
-        key2 = cache.generate_key("prompt2", "gpt-4", 0.7, "agent")
-        key3 = cache.generate_key("prompt3", "gpt-4", 0.7, "agent")
-        
-        cache.set(key1, "response1")
-        cache.set(key2, "response2")
-        cache.set(key3, "response3")  # Should evict key1
+
+        cache.set(KEY1, "response1")
+        cache.set(KEY2, "response2")
+        cache.set(KEY3, "response3")  # Should evict KEY1
         
         stats = cache.get_stats()
         assert stats["size"] == 2
-        assert cache.get(key1) is None  # Evicted
-        assert cache.get(key2) == "response2"
-        assert cache.get(key3) == "response3"
+        assert cache.get(KEY1) is None  # Evicted
+        assert cache.get(KEY2) == "response2"
+        assert cache.get(KEY3) == "response3"
 
-    def test_key_generation_consistency(self):
+    @pytest.mark.parametrize(
+        "prompt,model,temperature,agent_name",
+        [
+            ("prompt", "gpt-4", 0.7, "agent"),
+            ("", "gemini-pro", 0.0, "answer_evaluation"),
+        ],
+    )
+    def test_key_generation_consistency(self, cache, prompt, model, temperature, agent_name):
         """Test that same inputs generate same key."""
-        cache = LLMCache()
-        
-        key1 = cache.generate_key("prompt", "gpt-4", 0.7, "agent")
-        key2 = cache.generate_key("prompt", "gpt-4", 0.7, "agent")
-        
+        key1 = cache.generate_key(prompt, model, temperature, agent_name)
+        key2 = cache.generate_key(prompt, model, temperature, agent_name)
+
         assert key1 == key2
 
-    def test_key_generation_uniqueness(self):
+    def test_key_generation_uniqueness(self, cache):
         """Test that different inputs generate different keys."""
-        cache = LLMCache()
-        
-        key1 = cache.generate_key("prompt1", "gpt-4", 0.7, "agent")
-        key2 = cache.generate_key("prompt2", "gpt-4", 0.7, "agent")
-        key3 = cache.generate_key("prompt1", "gpt-3.5", 0.7, "agent")
-        
-        assert key1 != key2
-        assert key1 != key3
-        assert key2 != key3
+        inputs = [
+            ("prompt1", "gpt-4", 0.7, "agent"),
+            ("prompt2", "gpt-4", 0.7, "agent"),
+            ("prompt1", "gpt-3.5", 0.7, "agent"),
+            ("prompt1", "gpt-4", 0.0, "agent"),
+            ("prompt1", "gpt-4", 0.7, "other_agent"),
+        ]
 
-    def test_cache_clear(self):
+        keys = {cache.generate_key(*args) for args in inputs}
+
+        assert len(keys) == len(inputs)
+
+    def test_cache_clear(self, cache):
         """Test cache can be cleared."""
-        cache = LLMCache()
-        key = cache.generate_key("test", "gpt-4", 0.7, "agent")
-        
-        cache.set(key, "response")
+        cache.set(KEY1, "response")
         stats = cache.get_stats()
         assert stats["size"] == 1
         
         cache.clear()
         stats = cache.get_stats()
         assert stats["size"] == 0
-        assert cache.get(key) is None
+        assert cache.get(KEY1) is None
+
+    def test_cache_evicts_least_recently_used(self):
+        """Test a recent hit protects an entry from eviction."""
+        cache = LLMCache(max_size=2)
+
+        cache.set("key1", "response1")
+        cache.set("key2", "response2")
+        cache.get("key1")  # key2 is now least recently used
+        cache.set("key3", "response3")
+
+        assert cache.get("key1") == "response1"
+        assert cache.get("key2") is None
+        assert cache.get("key3") == "response3"
+
+    def test_cache_returns_stored_object(self, cache):
+        """Test structured responses come back as the same object, not a string."""
+        evaluation = AnswerEvaluation(score=7, rationale="Solid", evidence="quote")
+
+        cache.set("key", evaluation)
 
+        assert cache.get("key") is evaluation
@@ -22,51 +22,25 @@ class TestCostTracker:
         # Should be approximately 100 tokens (4 chars per token)
         assert 90 <= tokens <= 110
 
-    def test_calculate_cost_gpt4(self):
-        """Test cost calculation for GPT-4."""
+    @pytest.mark.parametrize(
+        "model,prompt_rate,completion_rate",
+        [
+            ("gpt-4", 0.03, 0.06),
+            ("gpt-3.5-turbo", 0.0015, 0.002),
+            ("gemini-pro", 0.00025, 0.0005),
+            # Unknown models default to Gemini pricing
+            ("unknown-model", 0.00025, 0.0005),
+        ],
+    )
+    def test_calculate_cost(self, model, prompt_rate, completion_rate):
+        """Test cost calculation against the per-1K-token rates for each model."""
         cost = CostTracker.calculate_cost(
             prompt_tokens=1000,
             completion_tokens=500,
-            model="gpt-4"
+            model=model
         )
-        
-        # GPT-4: $0.03/1K prompt, $0.06/1K completion
-        expected = (1000 * 0.03 / 1000) + (500 * 0.06 / 1000)
-        assert abs(cost - expected) < 0.0001
 
-    def test_calculate_cost_gpt35(self):
-        """Test cost calculation for GPT-3.5."""
-        cost = CostTracker.calculate_cost(
-            prompt_tokens=1000,
-            completion_tokens=500,
-            model="gpt-3.5-turbo"
-        )
-        
-        # GPT-3.5: $0.0015/1K prompt, $0.002/1K completion
-        expected = (1000 * 0.0015 / 1000) + (500 * 0.002 / 1000)
-        assert abs(cost - expected) < 0.0001
-
-    def test_calculate_cost_gemini(self):
-        """Test cost calculation for Gemini."""
-        cost = CostTracker.calculate_cost(
-            prompt_tokens=1000,
-            completion_tokens=500,
-            model="gemini-pro"
-        )
-        
-        # Gemini: $0.00025/1K prompt, $0.0005/1K completion
-        expected = (1000 * 0.00025 / 1000) + (500 * 0.0005 / 1000)
-        assert abs(cost - expected) < 0.0001
-
-    def test_calculate_cost_unknown_model(self):
-        """Test cost calculation for unknown models uses Gemini pricing."""
-        cost = CostTracker.calculate_cost(
-            prompt_tokens=1000,
-            completion_tokens=500,
-            model="unknown-model"
-        )
-        # Unknown models default to Gemini pricing
-        expected = (1000 * 0.00025 / 1000) + (500 * 0.0005 / 1000)
+        expected = (1000 * prompt_rate / 1000) + (500 * completion_rate / 1000)
         assert abs(cost - expected) < 0.0001
 
     def test_get_token_counts(self):
@@ -1,42 +1,47 @@
 import pytest
 from unittest.mock import AsyncMock, patch
 from app.agents.integrity_judgment import IntegrityJudgmentAgent, assess_integrity
+from app.agents.validators import IntegrityAdjustmentInput
 from app.schemas.interview import IntegrityAssessment
 
+
+@pytest.fixture
+def agent():
+    """Agent under test."""
+    return IntegrityJudgmentAgent()
+
+
 @pytest.mark.asyncio
 class TestIntegrityJudgmentAgent:
     """Test suite for IntegrityJudgmentAgent."""
 
-    async def test_assess_success(self):
+    async def test_assess_success(self, agent, mock_invoke):
         """Test successful integrity assessment."""
-        agent = IntegrityJudgmentAgent()
-        
         # Mock result
         expected_assessment = IntegrityAssessment(
             cheat_certainty=15.0,
             indicators=["Fast response"]
         )
         
-        with patch.object(agent, "invoke_with_retry_async", new_callable=AsyncMock) as mock_invoke:
-            mock_invoke.return_value = expected_assessment
-            
-            result = await agent.assess(
-                question="What is this question about?",
-                answer="A",
-                response_time_ms=1000,
-                paste_detected=False,
-                previous_answers=[]
-            )
-            
-            assert result == expected_assessment
-            mock_invoke.assert_called_once()
-            
-            # Verify inputs to invoke
-            call_kwargs = mock_invoke.call_args.kwargs
-            assert "inputs" in call_kwargs
-            inputs = call_kwargs["inputs"]
-            assert inputs["question"] == "What is this question about?"
-            assert inputs["response_time_ms"] == 1000
+        mock_invoke.return_value = expected_assessment
+        
+        result = await agent.assess(
+            question="What is this question about?",
+            answer="A",
+            response_time_ms=1000,
+            paste_detected=False,
+            previous_answers=[]
+        )
+        
+        assert result == expected_assessment
+        assert mock_invoke.await_count == 1
+        
+        # Verify inputs to invoke
+        call_kwargs = mock_invoke.call_args.kwargs
+        assert "inputs" in call_kwargs
+        inputs = call_kwargs["inputs"]
+        assert inputs["question"] == "What is this question about?"
+        assert inputs["response_time_ms"] == 1000
 
     async def test_convenience_function(self):
         """Test the async convenience function."""
@@ -45,13 +50,85 @@ class TestIntegrityJudgmentAgent:
             indicators=[]
         )
         
-        with patch("app.agents.integrity_judgment.IntegrityJudgmentAgent.assess", new_callable=AsyncMock) as mock_method:
-            mock_method.return_value = expected_assessment
-            
+        with patch(
+            "app.agents.integrity_judgment.IntegrityJudgmentAgent.assess",
+            new=AsyncMock(return_value=expected_assessment),
+        ) as mock_method:
             result = await assess_integrity(
                 question="What is this question about?",
                 answer="A"
             )
             
             assert result == expected_assessment
-            mock_method.assert_called_once()
+            assert mock_method.await_count == 1
+
+    async def test_prefilter_slow_typed_answer_skips_llm(self, agent, mock_invoke):
+        """Test that a slow, typed answer is cleared without an LLM call."""
+        result = await agent.assess(
+            question="What is this question about?",
+            answer="It is about testing.",
+            response_time_ms=20000,
+            paste_detected=False,
+            previous_answers=[],
+        )
+
+        assert result.cheat_certainty == 0.0
+        mock_invoke.assert_not_called()
+
+    async def test_prefilter_impossible_typing_speed_flags(self, agent, mock_invoke):
+        """Test that impossibly fast typing is flagged without an LLM call."""
+        result = await agent.assess(
+            question="What is this question about?",
+            answer="x" * 1000,
+            response_time_ms=1000,
+            paste_detected=True,
+            previous_answers=[],
+        )
+
+        assert result.cheat_certainty > 0
+        assert result.indicators
+        mock_invoke.assert_not_called()
+
+    async def test_prefilter_pasted_answer_uses_llm(self, agent, mock_invoke):
+        """Test that a pasted answer at a plausible speed still goes to the LLM."""
+        expected_assessment = IntegrityAssessment(cheat_certainty=60.0, indicators=["Paste"])
+
+        mock_invoke.return_value = expected_assessment
+
+        result = await agent.assess(
+            question="What is this question about?",
+            answer="It is about testing.",
+            response_time_ms=20000,
+            paste_detected=True,
+            previous_answers=["Earlier answer."],
+        )
+
+        assert result == expected_assessment
+        assert mock_invoke.await_count == 1
+
+    async def test_assess_batch_compares_against_earlier_answers(self):
+        """Test that batch assessment compares each answer with the recent ones before it."""
+        agent = IntegrityJudgmentAgent()
+        items = [
+            IntegrityAdjustmentInput(
+                question="What is this question about?",
+                answer=f"Answer number {i}",
+                response_time_ms=20000,
+                paste_detected=True,
+            )
+            for i in range(5)
+        ]
+        expected_assessment = IntegrityAssessment(cheat_certainty=10.0, indicators=[])
+
+        with patch.object(agent, "assess", new_callable=AsyncMock) as mock_assess:
+            mock_assess.return_value = expected_assessment
+
+            results = await agent.assess_batch(items)
+
+            assert results == [expected_assessment] * 5
+            assert mock_assess.call_args_list[2].args[4] == ["Answer number 0", "Answer number 1"]
+            assert mock_assess.call_args_list[4].args[4] == [
+                "Answer number 1",
+                "Answer number 2",
+                "Answer number 3",
+            ]
@@ -1,38 +1,141 @@
+import json
+
 import pytest
 from unittest.mock import AsyncMock, patch
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_openai import ChatOpenAI
+from openai.types.chat import ChatCompletion
 from app.agents.message_classification import MessageClassificationAgent, classify_message
 from app.schemas.interview import MessageClassification
 
+
+class _FakeCompletions:
+    """Stand-in for the OpenAI async chat completions client."""
+
+    def __init__(self, response: ChatCompletion):
+        self.response = response
+        self.kwargs = {}
+
+    async def create(self, **kwargs) -> ChatCompletion:
+        """Record the request and return the canned completion."""
+        self.kwargs = kwargs
+        return self.response
+
+
+@pytest.fixture
+def agent():
+    """Agent under test."""
+    return MessageClassificationAgent()
+
+
 @pytest.mark.asyncio
 class TestMessageClassificationAgent:
     """Test suite for MessageClassificationAgent."""
 
-    async def test_classify_success(self):
+    async def test_classify_success(self, agent, mock_invoke):
         """Test successful message classification."""
-        agent = MessageClassificationAgent()
-        
         # Mock result
         expected_classification = MessageClassification(
             type="Answer",
             confidence=0.95
         )
         
-        with patch.object(agent, "invoke_with_retry_async", new_callable=AsyncMock) as mock_invoke:
-            mock_invoke.return_value = expected_classification
-            
-            result = await agent.classify(
-                current_question="What is REST?",
-                candidate_message="It's an architectural style."
+        mock_invoke.return_value = expected_classification
+        
+        result = await agent.classify(
+            current_question="What is REST?",
+            candidate_message="It's an architectural style."
+        )
+        
+        assert result == expected_classification
+        assert mock_invoke.await_count == 1
+        
+        # Verify inputs
+        call_kwargs = mock_invoke.call_args.kwargs
+        assert "inputs" in call_kwargs
+        inputs = call_kwargs["inputs"]
+        assert inputs["current_question"] == "What is REST?"
+        assert "format_instructions" not in inputs
+
+    async def test_chain_uses_structured_output(self):
+        """Test the chain returns the model from an OpenAI tool-call response."""
+        llm = ChatOpenAI(api_key="sk-test", model="gpt-4")
+        completions = _FakeCompletions(
+            ChatCompletion.model_validate(
+                {
+                    "id": "chatcmpl-test",
+                    "object": "chat.completion",
+                    "created": 0,
+                    "model": "gpt-4",
+                    "choices": [
+                        {
+                            "index": 0,
+                            "finish_reason": "tool_calls",
+                            "message": {
+                                "role": "assistant",
+                                "content": None,
+                                "tool_calls": [
+                                    {
+                                        "id": "call_test",
+                                        "type": "function",
+                                        "function": {
+                                            "name": "MessageClassification",
+                                            "arguments": json.dumps(
+                                                {"type": "Answer", "confidence": 0.9}
+                                            ),
+                                        },
+                                    }
+                                ],
+                            },
+                        }
+                    ],
+                }
             )
-            
-            assert result == expected_classification
-            mock_invoke.assert_called_once()
-            
-            # Verify inputs
-            call_kwargs = mock_invoke.call_args.kwargs
-            assert "inputs" in call_kwargs
-            inputs = call_kwargs["inputs"]
-            assert inputs["current_question"] == "What is REST?"
+        )
+        llm.async_client = completions
+
+        with patch("app.agents.message_classification.get_llm", return_value=llm):
+            agent = MessageClassificationAgent()
+
+        result = await agent._chain.ainvoke(
+            {"current_question": "What is REST?", "candidate_message": "A style."}
+        )
+
+        # The schema travelled as a tool definition, not as prompt text
+        assert completions.kwargs["tools"][0]["function"]["name"] == "MessageClassification"
+        assert isinstance(result, MessageClassification)
+        assert result == MessageClassification(type="Answer", confidence=0.9)
+
+    async def test_chain_falls_back_to_json_parsing(self):
+        """Test the chain parses JSON when the LLM lacks structured output."""
+        llm = FakeListChatModel(responses=['{"type": "OffTopic", "confidence": 0.7}'])
+
+        with patch("app.agents.message_classification.get_llm", return_value=llm):
+            agent = MessageClassificationAgent()
+
+        result = await agent._chain.ainvoke(
+            {"current_question": "What is REST?", "candidate_message": "Nice weather."}
+        )
+        assert result == MessageClassification(type="OffTopic", confidence=0.7)
+
+    @pytest.mark.parametrize(
+        "message,expected_type",
+        [
+            ("idk", "Answer"),
+            ("  I don't know. ", "Answer"),
+            ("Could you please repeat the question?", "Clarification"),
+            ("What do you mean by idempotent?", "Clarification"),
+        ],
+    )
+    async def test_classify_rule_match_skips_llm(self, agent, mock_invoke, message, expected_type):
+        """Test obvious messages are classified without invoking the LLM."""
+        result = await agent.classify(
+            current_question="What is idempotency?",
+            candidate_message=message,
+        )
+
+        assert result.type == expected_type
+        mock_invoke.assert_not_called()
 
     async def test_convenience_function(self):
         """Test the async convenience function."""
@@ -41,13 +144,14 @@ class TestMessageClassificationAgent:
             confidence=0.8
         )
         
-        with patch("app.agents.message_classification.MessageClassificationAgent.classify", new_callable=AsyncMock) as mock_method:
-            mock_method.return_value = expected_classification
-            
+        with patch(
+            "app.agents.message_classification.MessageClassificationAgent.classify",
+            new=AsyncMock(return_value=expected_classification),
+        ) as mock_method:
             result = await classify_message(
                 current_question="Q",
                 candidate_message="I don't understand."
             )
             
             assert result == expected_classification
-            mock_method.assert_called_once()
+            assert mock_method.await_count == 1
@@ -0,0 +1,31 @@
+import pytest
+from langchain_core.exceptions import OutputParserException
+from app.agents.output_parsers import PydanticJsonOutputParser, find_json_span
+from app.schemas.interview import MessageClassification
+
+
+class TestPydanticJsonOutputParser:
+    """Test suite for PydanticJsonOutputParser."""
+
+    def test_parse_fenced_json_with_braces_in_strings(self):
+        """Test parsing JSON wrapped in prose and fences, with braces inside strings."""
+        parser = PydanticJsonOutputParser(pydantic_object=MessageClassification)
+        text = 'Sure:\n```json\n{"type": "Answer", "confidence": 0.9, "note": "a } \\" {"}\n```'
+
+        result = parser.parse(text)
+
+        assert result == MessageClassification(type="Answer", confidence=0.9)
+
+    def test_parse_invalid_payload_raises(self):
+        """Test that schema violations surface as OutputParserException."""
+        parser = PydanticJsonOutputParser(pydantic_object=MessageClassification)
+
+        with pytest.raises(OutputParserException):
+            parser.parse('{"type": "Answer", "confidence": 7}')
+
+        with pytest.raises(OutputParserException):
+            parser.parse("no json here")
+
+    def test_find_json_span_unterminated(self):
+        """Test that an unterminated object yields no span."""
+        assert find_json_span('{"type": "Answer"') is None
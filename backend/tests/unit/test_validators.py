@@ -7,99 +7,149 @@ from app.agents.validators import (
     MessageClassificationInput,
 )
 
-class TestValidators:
-    """Test suite for Pydantic validators."""
+# Shared literals, built once for every parametrized case
+RESUME_TEXT = "A" * 50
+ROLE_TEXT = "B" * 20
+OFFER_TEXT = "C" * 20
+BLANK_RESUME_TEXT = " " * 51
+SHORT_TEXT = "Short"
 
-    def test_document_input_validation(self):
-        """Test DocumentInput validation."""
-        # Valid input
-        valid_input = {
-            "resume_text": "A" * 50,
-            "role_description_text": "B" * 20,
-            "job_offering_text": "C" * 20,
-        }
-        model = DocumentInput(**valid_input)
-        assert model.resume_text == "A" * 50
+# Core validators bound once, skipping the BaseModel.__init__ dispatch per case
+_VALIDATORS = {
+    model_class: model_class.__pydantic_validator__.validate_python
+    for model_class in (
+        DocumentInput,
+        QuestionAnswerInput,
+        QuestionGenerationInput,
+        MessageClassificationInput,
+    )
+}
 
-        # Invalid: Empty string (whitespace)
-        with pytest.raises(ValidationError) as exc:
-            DocumentInput(
-                resume_text=" " * 51,
-                role_description_text="B" * 20,
-                job_offering_text="C" * 20
-            )
-        assert "Text cannot be empty" in str(exc.value)
 
-        # Invalid: Too short
-        with pytest.raises(ValidationError) as exc:
-            DocumentInput(
-                resume_text="Short",
-                role_description_text="B" * 20,
-                job_offering_text="C" * 20
-            )
-        assert "String should have at least 50 characters" in str(exc.value)
+def _check(model_class, payload, expect_error, msg_fragment):
+    """Validate payload and check it is accepted or rejected as expected."""
+    validate = _VALIDATORS[model_class]
+    if expect_error:
+        with pytest.raises(ValidationError, match=msg_fragment):
+            validate(payload)
+        return
 
-    def test_question_answer_input_validation(self):
-        """Test QuestionAnswerInput validation."""
-        # Valid input
-        valid_input = {
-            "question": "What is Python?",  # > 10 chars
-            "answer": "A programming language."
-        }
-        model = QuestionAnswerInput(**valid_input)
-        assert model.question == "What is Python?"
+    model = validate(payload)
+    assert isinstance(model, model_class)
+    for field, value in payload.items():
+        assert getattr(model, field) == value
 
-        # Invalid: Question too short
-        with pytest.raises(ValidationError):
-            QuestionAnswerInput(question="Short", answer="Valid answer")
 
-        # Invalid: Answer empty
-        with pytest.raises(ValidationError) as exc:
-            QuestionAnswerInput(question="What is Python?", answer="   ")
-        assert "Text cannot be empty" in str(exc.value)
+@pytest.mark.xdist_group("validators")
+class TestValidators:
+    """Test suite for Pydantic validators."""
 
-    def test_question_generation_input_validation(self):
-        """Test QuestionGenerationInput validation."""
-        # Valid input
-        valid_input = {
-            "focus_areas": ["Python", "API"],
-            "difficulty_level": 5.0,
-            "questions_asked": 2
-        }
-        model = QuestionGenerationInput(**valid_input)
-        assert model.focus_areas == ["Python", "API"]
+    @pytest.mark.parametrize(
+        "payload,expect_error,msg_fragment",
+        [
+            (
+                {
+                    "resume_text": RESUME_TEXT,
+                    "role_description_text": ROLE_TEXT,
+                    "job_offering_text": OFFER_TEXT,
+                },
+                False,
+                None,
+            ),
+            # Empty string (whitespace)
+            (
+                {
+                    "resume_text": BLANK_RESUME_TEXT,
+                    "role_description_text": ROLE_TEXT,
+                    "job_offering_text": OFFER_TEXT,
+                },
+                True,
+                "String should have at least",
+            ),
+            # Too short
+            (
+                {
+                    "resume_text": SHORT_TEXT,
+                    "role_description_text": ROLE_TEXT,
+                    "job_offering_text": OFFER_TEXT,
+                },
+                True,
+                "String should have at least 50 characters",
+            ),
+        ],
+    )
+    def test_document_input_validation(self, payload, expect_error, msg_fragment):
+        """Test DocumentInput validation."""
+        _check(DocumentInput, payload, expect_error, msg_fragment)
 
-        # Invalid: Empty list item
-        with pytest.raises(ValidationError) as exc:
-            QuestionGenerationInput(
-                focus_areas=["Python", "   "],
-                difficulty_level=5.0,
-                questions_asked=2
-            )
-        assert "Focus areas cannot be empty" in str(exc.value)
+    @pytest.mark.parametrize(
+        "payload,expect_error,msg_fragment",
+        [
+            ({"question": "What is Python?", "answer": "A programming language."}, False, None),
+            # Question too short
+            ({"question": SHORT_TEXT, "answer": "Valid answer"}, True, None),
+            # Answer empty
+            ({"question": "What is Python?", "answer": "   "}, True, "String should have at least"),
+        ],
+    )
+    def test_question_answer_input_validation(self, payload, expect_error, msg_fragment):
+        """Test QuestionAnswerInput validation."""
+        _check(QuestionAnswerInput, payload, expect_error, msg_fragment)
 
-        # Invalid: Difficulty out of range
-        with pytest.raises(ValidationError):
-            QuestionGenerationInput(
-                focus_areas=["Python"],
-                difficulty_level=11.0,
-                questions_asked=2
-            )
+    @pytest.mark.parametrize(
+        "payload,expect_error,msg_fragment",
+        [
+            (
+                {"focus_areas": ["Python", "API"], "difficulty_level": 5.0, "questions_asked": 2},
+                False,
+                None,
+            ),
+            # Empty list item
+            (
+                {"focus_areas": ["Python", "   "], "difficulty_level": 5.0, "questions_asked": 2},
+                True,
+                "Focus areas cannot be empty",
+            ),
+            # Difficulty out of range
+            (
+                {"focus_areas": ["Python"], "difficulty_level": 11.0, "questions_asked": 2},
+                True,
+                None,
+            ),
+        ],
+    )
+    def test_question_generation_input_validation(self, payload, expect_error, msg_fragment):
+        """Test QuestionGenerationInput validation."""
+        _check(QuestionGenerationInput, payload, expect_error, msg_fragment)
 
-    def test_message_classification_input_validation(self):
+    @pytest.mark.parametrize(
+        "payload,expect_error,msg_fragment",
+        [
+            (
+                {
+                    "current_question": "What is validation?",
+                    "candidate_message": "Checking correctness.",
+                },
+                False,
+                None,
+            ),
+            # Empty message
+            (
+                {"current_question": "What is validation?", "candidate_message": "   "},
+                True,
+                "String should have at least",
+            ),
+        ],
+    )
+    def test_message_classification_input_validation(self, payload, expect_error, msg_fragment):
         """Test MessageClassificationInput validation."""
-        # Valid input
-        valid_input = {
-            "current_question": "What is validation?",
-            "candidate_message": "Checking correctness."
-        }
-        model = MessageClassificationInput(**valid_input)
-        assert model.current_question == "What is validation?"
+        _check(MessageClassificationInput, payload, expect_error, msg_fragment)
 
-        # Invalid: Empty message
-        with pytest.raises(ValidationError) as exc:
-            MessageClassificationInput(
-                current_question="What is validation?",
-                candidate_message="   "
-            )
-        assert "Text cannot be empty" in str(exc.value)
+    def test_validators_reject_unknown_fields_and_mutation(self):
+        """Test that input shells forbid extra fields and are immutable."""
+        with pytest.raises(ValidationError):
+            QuestionAnswerInput(question="What is Python?", answer="A language.", extra="x")
+
+        model = QuestionAnswerInput(question="What is Python?", answer="A language.")
+        with pytest.raises(ValidationError):
+            model.answer = "Changed"
@@ -118,7 +118,7 @@ export default function AdminDashboard() {
                             <div className="text-sm text-purple-200 mb-1">Total API Cost</div>
                             <div className="text-2xl font-bold text-white">${costStats.total_cost.toFixed(4)}</div>
                             <div className="text-xs text-purple-300 mt-1">
-                                {costStats.total_tokens.toLocaleString()} tokens | {costStats.cache_hit_rate}% cached
+                                {costStats.total_tokens.toLocaleString()} tokens | {costStats.cache_hit_rate.toFixed(2)}% cached
                             </div>
                         </div>
                     )}
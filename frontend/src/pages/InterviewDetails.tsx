@@ -201,7 +201,7 @@ export default function InterviewDetails() {
                             </div>
                             <div className="bg-white/5 rounded-lg p-4 border border-white/10">
                                 <div className="text-sm text-purple-200 mb-1">Cache Hit Rate</div>
-                                <div className="text-2xl font-bold text-green-400">{costs.cache_hit_rate}%</div>
+                                <div className="text-2xl font-bold text-green-400">{costs.cache_hit_rate.toFixed(2)}%</div>
                                 <div className="text-xs text-purple-300 mt-1">
                                     {costs.cache_hits} hits / {costs.cache_misses} misses
                                 </div>